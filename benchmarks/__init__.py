@@ -0,0 +1 @@
+# YouTube爬虫离线基准测试
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+本地YouTube夹具服务器 - 离线提供watch/search/频道videos/about页面
+
+路由:
+    /results?search_query=...   搜索结果页
+    /@<handle>/videos           频道视频列表页
+    /@<handle>/about            频道关于页
+    /watch?v=<id>               视频观看页
+
+若 benchmarks/recorded/ 下存在录制的真实页面（watch.html、search.html、
+channel_videos.html、channel_about.html），则优先返回录制页面，并把其中的
+youtube.com 链接改写为本地地址。
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from .fixtures import (
+    make_video_id,
+    render_watch_page,
+    render_search_page,
+    render_channel_videos_page,
+    render_channel_about_page,
+)
+
+RECORDED_DIR = os.path.join(os.path.dirname(__file__), "recorded")
+
+
+class FixtureServer:
+    """本地夹具服务器（可作为上下文管理器使用）"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, videos_per_listing: int = 30,
+                 locale: str = "en", pad_bytes: int = 1024 * 1024):
+        self.host = host
+        self.port = port
+        self.videos_per_listing = videos_per_listing
+        self.locale = locale
+        self.pad_bytes = pad_bytes
+        self.request_count = 0
+        self._httpd = None
+        self._thread = None
+        self._recorded = self._load_recorded()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def _load_recorded(self) -> dict:
+        """加载录制的真实页面"""
+        recorded = {}
+        if os.path.isdir(RECORDED_DIR):
+            for kind in ("watch", "search", "channel_videos", "channel_about"):
+                path = os.path.join(RECORDED_DIR, f"{kind}.html")
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        recorded[kind] = f.read()
+        return recorded
+
+    def _rewrite(self, html: str) -> str:
+        """把录制页面中的YouTube链接改写为本地地址"""
+        for origin in ("https://www.youtube.com", "https://youtube.com", "https://m.youtube.com"):
+            html = html.replace(origin, self.base_url)
+        return html
+
+    def render(self, path: str) -> tuple:
+        """
+        根据请求路径渲染页面
+
+        Returns:
+            (状态码, HTML文本)
+        """
+        parsed = urlparse(path)
+        query = parse_qs(parsed.query)
+        parts = [p for p in parsed.path.split("/") if p]
+
+        if parsed.path == "/watch" and query.get("v"):
+            if "watch" in self._recorded:
+                return 200, self._rewrite(self._recorded["watch"])
+            return 200, render_watch_page(query["v"][0], self.locale, self.pad_bytes)
+
+        if parsed.path == "/results":
+            search_query = query.get("search_query", [""])[0]
+            if "search" in self._recorded:
+                return 200, self._rewrite(self._recorded["search"])
+            ids = [make_video_id(search_query, i) for i in range(self.videos_per_listing)]
+            return 200, render_search_page(search_query, ids, self.base_url, self.locale, self.pad_bytes)
+
+        if parts and parts[0].startswith("@"):
+            handle = parts[0][1:]
+            tab = parts[1] if len(parts) > 1 else "videos"
+            if tab == "about":
+                if "channel_about" in self._recorded:
+                    return 200, self._rewrite(self._recorded["channel_about"])
+                return 200, render_channel_about_page(handle, self.locale, self.pad_bytes)
+            if "channel_videos" in self._recorded:
+                return 200, self._rewrite(self._recorded["channel_videos"])
+            ids = [make_video_id(handle, i) for i in range(self.videos_per_listing)]
+            return 200, render_channel_videos_page(handle, ids, self.base_url, self.locale, self.pad_bytes)
+
+        return 404, "<html><body>not found</body></html>"
+
+    def start(self):
+        """在后台线程启动服务器"""
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.request_count += 1
+                status, html = server.render(self.path)
+                body = html.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                return
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self.port = self._httpd.server_port
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """停止服务器"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="启动本地YouTube夹具服务器")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--locale", choices=["en", "zh", "vi"], default="en")
+    args = parser.parse_args()
+
+    with FixtureServer(port=args.port, locale=args.locale) as fixture_server:
+        print(f"夹具服务器已启动: {fixture_server.base_url}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+基准测试页面夹具 - 按YouTube真实页面结构生成watch/search/频道videos/about页面
+
+页面同时包含DOM节点（供CSS选择器提取）和内联的ytInitialData/ytInitialPlayerResponse
+（供页面源码解析），并可填充到与线上页面相近的体积（1-2MB）。
+"""
+
+import json
+import random
+import hashlib
+
+# 各语言的页面文案
+LOCALES = {
+    "en": {
+        "views": "{n} views",
+        "view_short": "{n} views",
+        "date": "{mon_en} {day}, {year}",
+        "relative": ["{k} hours ago", "{k} days ago", "{k} weeks ago", "{k} months ago"],
+        "subscribers": "{n} subscribers",
+        "videos": "{n} videos",
+        "location_label": "Location",
+        "description": "In this video we break down the latest market moves and what they mean for you.",
+        "grouping": ",",
+        "subscriber_values": ["12.3K", "1.2M", "845K", "3.4K"],
+    },
+    "zh": {
+        "views": "{n}次观看",
+        "view_short": "{n}次观看",
+        "date": "{year}年{month}月{day}日",
+        "relative": ["{k}小时前", "{k}天前", "{k}周前", "{k}个月前"],
+        "subscribers": "{n}位订阅者",
+        "videos": "{n} 个视频",
+        "location_label": "位置",
+        "description": "本期视频我们分析最新的市场走势，以及它对你的投资意味着什么。",
+        "grouping": ",",
+        "subscriber_values": ["1.2万", "35.6万", "1.1亿", "8900"],
+    },
+    "vi": {
+        "views": "{n} lượt xem",
+        "view_short": "{n} lượt xem",
+        "date": "{day} thg {month}, {year}",
+        "relative": ["{k} giờ trước", "{k} ngày trước", "{k} tuần trước", "{k} tháng trước"],
+        "subscribers": "{n} người đăng ký",
+        "videos": "{n} video",
+        "location_label": "Vị trí",
+        "description": "Trong video này chúng ta phân tích diễn biến thị trường tiền điện tử mới nhất.",
+        "grouping": ".",
+        "subscriber_values": ["12,3 N", "1,2 Tr", "845 N", "3,4 N"],
+    },
+}
+
+MONTHS_EN = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# 填充块 - 模拟线上页面中大量的内联JSON/脚本
+_FILLER_BLOCK = (
+    '{"trackingParams":"CAAQhGciEwiY6u2X0ZqEAxVYQ0wIHQ","clickTrackingParams":"CBQQ3DAYACITCJjq",'
+    '"commandMetadata":{"webCommandMetadata":{"url":"/feed/trending","webPageType":"WEB_PAGE_TYPE_BROWSE",'
+    '"rootVe":6827}},"accessibility":{"accessibilityData":{"label":"Trending"}},"icon":{"iconType":"FIRE"}},'
+)
+
+
+def _rng(*parts) -> random.Random:
+    """根据输入生成确定性的随机数发生器"""
+    digest = hashlib.md5("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return random.Random(int(digest[:12], 16))
+
+
+def _group(n: int, sep: str) -> str:
+    """千位分组"""
+    return f"{n:,}".replace(",", sep)
+
+
+def _esc(text: str) -> str:
+    """HTML转义"""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def make_video_id(seed, index: int) -> str:
+    """生成11位视频ID"""
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    rng = _rng("vid", seed, index)
+    return "".join(rng.choice(alphabet) for _ in range(11))
+
+
+def video_facts(video_id: str, locale: str = "en") -> dict:
+    """生成视频的确定性元数据"""
+    texts = LOCALES[locale]
+    rng = _rng("facts", video_id)
+    views = rng.randint(100, 5_000_000)
+    year, month, day = rng.choice([2023, 2024, 2025]), rng.randint(1, 12), rng.randint(1, 28)
+    relative = rng.choice(texts["relative"]).format(k=rng.randint(1, 11))
+    return {
+        "video_id": video_id,
+        "title": f"Market update #{rng.randint(1, 999)} - {video_id}",
+        "channel": f"Bench Channel {video_id[:3]}",
+        "views": views,
+        "views_text": texts["views"].format(n=_group(views, texts["grouping"])),
+        "date_text": texts["date"].format(mon_en=MONTHS_EN[month - 1], month=month, day=day, year=year),
+        "publish_date": f"{year:04d}-{month:02d}-{day:02d}",
+        "relative_text": relative,
+        "description": f"{texts['description']}\n\nChapters:\n00:00 Intro\n02:15 Analysis\n\n#crypto #{video_id}",
+    }
+
+
+def _filler(target_bytes: int) -> str:
+    """生成指定体积的内联脚本填充"""
+    if target_bytes <= 0:
+        return ""
+    repeat = max(1, target_bytes // len(_FILLER_BLOCK))
+    return '<script nonce="bench">var ytcfgFiller = [' + _FILLER_BLOCK * repeat + '{}];</script>'
+
+
+def _page(title: str, body: str, scripts: str, pad_bytes: int, lang: str) -> str:
+    return (
+        f'<!DOCTYPE html><html lang="{lang}"><head><meta charset="utf-8">'
+        f"<title>{_esc(title)} - YouTube</title></head><body>"
+        f"{body}{scripts}{_filler(pad_bytes)}</body></html>"
+    )
+
+
+def render_watch_page(video_id: str, locale: str = "en", pad_bytes: int = 0) -> str:
+    """渲染视频观看页"""
+    facts = video_facts(video_id, locale)
+    first_line = f"{facts['views_text']}  {facts['date_text']}"
+    player_response = {
+        "playabilityStatus": {"status": "OK"},
+        "videoDetails": {
+            "videoId": video_id,
+            "title": facts["title"],
+            "author": facts["channel"],
+            "shortDescription": facts["description"],
+            "viewCount": str(facts["views"]),
+        },
+        "microformat": {"playerMicroformatRenderer": {
+            "publishDate": facts["publish_date"],
+            "uploadDate": facts["publish_date"],
+        }},
+    }
+    initial_data = {"contents": {"twoColumnWatchNextResults": {"results": {"results": {"contents": [
+        {"videoPrimaryInfoRenderer": {
+            "title": {"runs": [{"text": facts["title"]}]},
+            "viewCount": {"videoViewCountRenderer": {"viewCount": {"simpleText": facts["views_text"]}}},
+            "dateText": {"simpleText": facts["date_text"]},
+        }},
+        {"videoSecondaryInfoRenderer": {"owner": {"videoOwnerRenderer": {
+            "title": {"runs": [{"text": facts["channel"]}]},
+        }}}},
+    ]}}}}}
+    body = (
+        '<ytd-app><div id="content"><ytd-watch-flexy><div id="primary"><ytd-watch-metadata>'
+        f'<div id="title"><h1 class="style-scope ytd-watch-metadata"><yt-formatted-string>{_esc(facts["title"])}'
+        '</yt-formatted-string></h1></div>'
+        '<ytd-video-owner-renderer><ytd-channel-name id="channel-name">'
+        f'<yt-formatted-string class="style-scope ytd-channel-name"><a href="/@{video_id[:3]}">{_esc(facts["channel"])}</a>'
+        '</yt-formatted-string></ytd-channel-name></ytd-video-owner-renderer>'
+        '<ytd-text-inline-expander id="description-inline-expander">'
+        f'<yt-formatted-string class="style-scope ytd-text-inline-expander">{_esc(first_line)}\n{_esc(facts["description"])}'
+        '</yt-formatted-string><tp-yt-paper-button id="expand">...more</tp-yt-paper-button>'
+        '</ytd-text-inline-expander></ytd-watch-metadata></div></ytd-watch-flexy></div></ytd-app>'
+    )
+    scripts = (
+        f"<script>var ytInitialPlayerResponse = {json.dumps(player_response, ensure_ascii=False)};</script>"
+        f"<script>var ytInitialData = {json.dumps(initial_data, ensure_ascii=False)};</script>"
+    )
+    return _page(facts["title"], body, scripts, pad_bytes, locale)
+
+
+def _tile_renderer(video_id: str, locale: str) -> dict:
+    facts = video_facts(video_id, locale)
+    return {"videoRenderer": {
+        "videoId": video_id,
+        "title": {"runs": [{"text": facts["title"]}]},
+        "publishedTimeText": {"simpleText": facts["relative_text"]},
+        "viewCountText": {"simpleText": facts["views_text"]},
+        "ownerText": {"runs": [{"text": facts["channel"]}]},
+    }}
+
+
+def _tile_html(video_id: str, locale: str, tag: str, base_url: str) -> str:
+    facts = video_facts(video_id, locale)
+    href = f"{base_url}/watch?v={video_id}"
+    return (
+        f'<{tag} class="style-scope"><a id="thumbnail" href="{href}"></a>'
+        f'<a id="video-title" href="{href}" title="{_esc(facts["title"])}">{_esc(facts["title"])}</a>'
+        '<div id="metadata-line">'
+        f'<span class="inline-metadata-item">{_esc(facts["views_text"])}</span>'
+        f'<span class="inline-metadata-item">{_esc(facts["relative_text"])}</span>'
+        f"</div></{tag}>"
+    )
+
+
+def render_search_page(query: str, video_ids: list, base_url: str = "", locale: str = "en",
+                       pad_bytes: int = 0) -> str:
+    """渲染搜索结果页"""
+    tiles = "".join(_tile_html(vid, locale, "ytd-video-renderer", base_url) for vid in video_ids)
+    initial_data = {"contents": {"twoColumnSearchResultsRenderer": {"primaryContents": {
+        "sectionListRenderer": {"contents": [{"itemSectionRenderer": {
+            "contents": [_tile_renderer(vid, locale) for vid in video_ids],
+        }}]},
+    }}}}
+    body = f'<ytd-app><div id="contents">{tiles}</div></ytd-app>'
+    scripts = f"<script>var ytInitialData = {json.dumps(initial_data, ensure_ascii=False)};</script>"
+    return _page(query, body, scripts, pad_bytes, locale)
+
+
+def render_channel_videos_page(handle: str, video_ids: list, base_url: str = "", locale: str = "en",
+                               pad_bytes: int = 0) -> str:
+    """渲染频道 /videos 列表页（按发布时间从新到旧）"""
+    texts = LOCALES[locale]
+    rng = _rng("channel", handle)
+    subscribers = texts["subscribers"].format(n=rng.choice(texts["subscriber_values"]))
+    tiles = "".join(
+        f'<ytd-rich-item-renderer><ytd-rich-grid-media>{_tile_html(vid, locale, "div", base_url)}'
+        "</ytd-rich-grid-media></ytd-rich-item-renderer>"
+        for vid in video_ids
+    )
+    initial_data = {
+        "header": {"c4TabbedHeaderRenderer": {
+            "title": handle,
+            "subscriberCountText": {"simpleText": subscribers},
+        }},
+        "contents": {"twoColumnBrowseResultsRenderer": {"tabs": [{"tabRenderer": {
+            "title": "Videos", "selected": True,
+            "content": {"richGridRenderer": {"contents": [
+                {"richItemRenderer": {"content": _tile_renderer(vid, locale)}} for vid in video_ids
+            ]}},
+        }}]}},
+    }
+    body = (
+        '<ytd-app><div id="page-header">'
+        f'<yt-formatted-string id="subscriber-count">{_esc(subscribers)}</yt-formatted-string></div>'
+        f'<div id="contents">{tiles}</div></ytd-app>'
+    )
+    scripts = f"<script>var ytInitialData = {json.dumps(initial_data, ensure_ascii=False)};</script>"
+    return _page(handle, body, scripts, pad_bytes, locale)
+
+
+def render_channel_about_page(handle: str, locale: str = "en", pad_bytes: int = 0) -> str:
+    """渲染频道 /about 页（包含aboutChannelViewModel）"""
+    texts = LOCALES[locale]
+    rng = _rng("channel", handle)
+    subscribers = texts["subscribers"].format(n=rng.choice(texts["subscriber_values"]))
+    video_count = texts["videos"].format(n=_group(rng.randint(10, 3000), texts["grouping"]))
+    country = {"en": "United States", "zh": "中国", "vi": "Việt Nam"}[locale]
+    bio = f"{texts['description']} @{handle}"
+    about = {"aboutChannelViewModel": {
+        "description": bio,
+        "subscriberCountText": subscribers,
+        "videoCountText": video_count,
+        "viewCountText": texts["views"].format(n=_group(rng.randint(10_000, 90_000_000), texts["grouping"])),
+        "country": country,
+        "canonicalChannelUrl": f"http://www.youtube.com/@{handle}",
+        "links": [
+            {"channelExternalLinkViewModel": {"title": {"content": "Telegram"},
+                                              "link": {"content": f"t.me/{handle}"}}},
+            {"channelExternalLinkViewModel": {"title": {"content": "Website"},
+                                              "link": {"content": f"{handle}.example.com"}}},
+        ],
+    }}
+    initial_data = {
+        "header": {"pageHeaderRenderer": {"pageTitle": handle}},
+        "onResponseReceivedEndpoints": [{"showEngagementPanelEndpoint": {"engagementPanel": {
+            "engagementPanelSectionListRenderer": {"content": {"sectionListRenderer": {"contents": [
+                {"itemSectionRenderer": {"contents": [{"aboutChannelRenderer": {"metadata": about}}]}},
+            ]}}},
+        }}}],
+    }
+    body = (
+        '<ytd-app><ytd-about-channel-renderer><div id="description-container">'
+        f'<yt-attributed-string id="description">{_esc(bio)}</yt-attributed-string></div>'
+        '<table id="additional-info-container">'
+        f"<tr><td>{_esc(subscribers)}</td></tr><tr><td>{_esc(video_count)}</td></tr>"
+        f"<tr><td>{_esc(texts['location_label'])}: {_esc(country)}</td></tr>"
+        "</table></ytd-about-channel-renderer></ytd-app>"
+    )
+    scripts = f"<script>var ytInitialData = {json.dumps(initial_data, ensure_ascii=False)};</script>"
+    return _page(handle, body, scripts, pad_bytes, locale)
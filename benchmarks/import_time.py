@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+导入耗时基准 - 在全新的解释器中测量各入口模块的导入时间，并检查是否加载了重量级依赖
+
+用法:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 10 --module src.utils.text_parsers
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 不同类型的工作进程实际使用的入口
+DEFAULT_MODULES = [
+    "src",
+    "src.main",
+    "src.utils.text_parsers",
+    "src.service",
+    "src.service.data_service",
+    "src.service.browser_service",
+    "src.service.url_batch_service",
+]
+
+HEAVY_MODULES = ["pandas", "selenium", "webdriver_manager"]
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str, runs: int) -> dict:
+    """在子进程中多次导入模块，返回中位耗时及加载的重量级依赖"""
+    samples, heavy = [], []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)], cwd=BASE_DIR
+        )
+        result = json.loads(output.decode().strip().splitlines()[-1])
+        samples.append(result["ms"])
+        heavy = result["heavy"]
+    return {"module": module, "median_ms": round(statistics.median(samples), 1),
+            "min_ms": round(min(samples), 1), "heavy_imports": heavy}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="入口模块导入耗时基准")
+    parser.add_argument("--runs", type=int, default=5, help="每个模块的测量次数")
+    parser.add_argument("--module", action="append", help="要测量的模块（可重复指定）")
+    parser.add_argument("--json", action="store_true", help="以JSON输出结果")
+    args = parser.parse_args()
+
+    results = [measure(module, args.runs) for module in (args.module or DEFAULT_MODULES)]
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{'module':<34}{'median(ms)':>12}{'min(ms)':>10}  heavy imports")
+    print("-" * 76)
+    for r in results:
+        print(f"{r['module']:<34}{r['median_ms']:>12}{r['min_ms']:>10}  {', '.join(r['heavy_imports']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
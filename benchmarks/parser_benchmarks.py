@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+解析器微基准 - 在多语言page_source语料上测量text_parsers各函数的吞吐量(MB/s)
+
+语料目录 benchmarks/corpus/<locale>/ 下的 *.html 为保存的页面源码，文件名以
+watch_ / about_ 开头区分页面类型。目录为空时自动用夹具生成英文、中文、越南语
+页面（1-2MB）。可以把线上保存的页面直接放进对应目录替换合成语料。
+
+输出格式参考pytest-benchmark：每个函数报告 rounds、min、median、mean、stddev、MB/s。
+
+用法:
+    python -m benchmarks.parser_benchmarks
+    python -m benchmarks.parser_benchmarks --rounds 20 --function parse_title_from_page_source
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import time
+import argparse
+import statistics
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from benchmarks.fixtures import LOCALES, make_video_id, render_watch_page, render_channel_about_page
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+# 频道列表中的代表性频道（英文、中文、越南语）
+CORPUS_CHANNELS = {
+    "en": ["drcrypto2", "CryptoQueen_Group"],
+    "zh": ["cryptograde", "moon_star512"],
+    "vi": ["Caracryptovn", "dautukiemtienvn"],
+}
+
+
+def build_corpus(pages_per_kind: int = 2) -> dict:
+    """
+    生成合成语料（1MB与2MB交替）
+
+    Returns:
+        {locale: {"watch": [页面源码...], "about": [页面源码...]}}
+    """
+    corpus = {}
+    for locale, channels in CORPUS_CHANNELS.items():
+        watch_pages, about_pages = [], []
+        for i in range(pages_per_kind):
+            pad = (1 + i % 2) * 1024 * 1024
+            watch_pages.append(render_watch_page(make_video_id(channels[0], i), locale, pad))
+            about_pages.append(render_channel_about_page(channels[i % len(channels)], locale, pad))
+        corpus[locale] = {"watch": watch_pages, "about": about_pages}
+    return corpus
+
+
+def load_corpus() -> dict:
+    """加载保存的语料，不存在时生成合成语料"""
+    corpus = {}
+    for locale_dir in sorted(glob.glob(os.path.join(CORPUS_DIR, "*"))):
+        if not os.path.isdir(locale_dir):
+            continue
+        pages = {"watch": [], "about": []}
+        for path in sorted(glob.glob(os.path.join(locale_dir, "*.html"))):
+            kind = "about" if os.path.basename(path).startswith("about_") else "watch"
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                pages[kind].append(f.read())
+        if pages["watch"] or pages["about"]:
+            corpus[os.path.basename(locale_dir)] = pages
+    return corpus or build_corpus()
+
+
+def subscriber_samples(corpus: dict) -> list:
+    """从语料中收集订阅者原始文本，加上各语言的典型写法"""
+    samples = []
+    for pages in corpus.values():
+        for source in pages["about"]:
+            samples.extend(re.findall(r'"subscriberCountText"\s*:\s*"([^"]+)"', source))
+    for texts in LOCALES.values():
+        samples.extend(texts["subscribers"].format(n=v) for v in texts["subscriber_values"])
+    return samples
+
+
+def run_benchmark(func, inputs: list, rounds: int) -> dict:
+    """对输入列表重复执行函数，统计每轮耗时"""
+    total_bytes = sum(len(s.encode("utf-8")) for s in inputs)
+    func(inputs[0])  # 预热（正则编译缓存）
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for source in inputs:
+            func(source)
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    return {
+        "rounds": rounds,
+        "inputs": len(inputs),
+        "bytes": total_bytes,
+        "min_ms": round(min(timings) * 1000, 3),
+        "median_ms": round(median * 1000, 3),
+        "mean_ms": round(statistics.mean(timings) * 1000, 3),
+        "stddev_ms": round(statistics.stdev(timings) * 1000, 3) if len(timings) > 1 else 0.0,
+        "mb_per_sec": round(total_bytes / (1024 * 1024) / median, 2) if median > 0 else 0.0,
+    }
+
+
+def collect_cases(corpus: dict) -> list:
+    """组装 (函数名, 语言, 函数, 输入列表) 基准用例"""
+    from src.utils import text_parsers
+
+    cases = []
+    for locale, pages in sorted(corpus.items()):
+        if pages["watch"]:
+            cases.append(("parse_title_from_page_source", locale,
+                          text_parsers.parse_title_from_page_source, pages["watch"]))
+            cases.append(("parse_description_from_page_source", locale,
+                          text_parsers.parse_description_from_page_source, pages["watch"]))
+        if pages["about"]:
+            cases.append(("parse_channel_about_from_page_source", locale,
+                          text_parsers.parse_channel_about_from_page_source, pages["about"]))
+    samples = subscriber_samples(corpus)
+    if samples:
+        cases.append(("normalize_subscriber_text", "all", text_parsers.normalize_subscriber_text, samples))
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description="text_parsers解析器微基准")
+    parser.add_argument("--rounds", type=int, default=10, help="每个用例的轮数")
+    parser.add_argument("--function", help="只运行指定函数")
+    parser.add_argument("--json", action="store_true", help="以JSON输出结果")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    results = []
+    for name, locale, func, inputs in collect_cases(corpus):
+        if args.function and name != args.function:
+            continue
+        # 短文本函数需要更多轮数才能得到稳定的计时
+        rounds = args.rounds * 100 if name == "normalize_subscriber_text" else args.rounds
+        result = run_benchmark(func, inputs, rounds)
+        result.update({"function": name, "locale": locale})
+        results.append(result)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    header = f"{'function':<40}{'locale':<8}{'inputs':>7}{'min(ms)':>11}{'median(ms)':>12}{'stddev':>9}{'MB/s':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['function']:<40}{r['locale']:<8}{r['inputs']:>7}{r['min_ms']:>11}"
+              f"{r['median_ms']:>12}{r['stddev_ms']:>9}{r['mb_per_sec']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+回归检查 - 不需要浏览器的已知问题用例，逐条比较实际结果与期望值
+
+用法:
+    python -m benchmarks.regression_checks
+    python -m benchmarks.regression_checks --check parse_count
+"""
+
+import os
+import sys
+import argparse
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+# parse_count: (原始文本, 期望值)
+PARSE_COUNT_CASES = [
+    ("16,278 views", 16278),
+    ("16.278 lượt xem", 16278),
+    ("1.2K views", 1200),
+    ("1.2万次观看", 12000),
+    ("1,2 N lượt xem", 1200),
+    ("1 Tr lượt xem", 1000000),
+    ("12,3 N người đăng ký", 12300),
+    ("1,2 Tr người đăng ký", 1200000),
+    ("12 345 vues", 12345),
+    ("1 234 567 views", 1234567),
+    # 普通空格后不是3位数字时结束匹配，不能把两个数字拼在一起
+    ("Trending #1 5 views", 1),
+    ("No views", 0),
+    (float("nan"), None),
+]
+
+
+def check_parse_count() -> list:
+    """parse_count 用例，返回失败描述列表"""
+    from src.utils.text_parsers import parse_count
+
+    failures = []
+    for text, expected in PARSE_COUNT_CASES:
+        actual = parse_count(text)
+        if actual != expected:
+            failures.append(f"parse_count({text!r}) = {actual!r}，期望 {expected!r}")
+    return failures
+
+
+# 频道订阅数：(关于页原始文本, 期望的 subscribers_num)
+SUBSCRIBER_CASES = [
+    ("12,3 N người đăng ký", 12300),
+    ("1,2 Tr người đăng ký", 1200000),
+    ("1.2万位订阅者", 12000),
+    ("3.4K subscribers", 3400),
+]
+
+
+def check_channel_subscribers() -> list:
+    """URLBatchService 频道级信息的订阅数（不需要浏览器：关于页已提供订阅数时不访问频道页）"""
+    from src.service.url_batch_service import URLBatchService
+
+    service = URLBatchService()
+    failures = []
+    for raw, expected in SUBSCRIBER_CASES:
+        info = service._resolve_channel_info(f"@regression/{raw}", {"subscribers": raw})
+        if info["subscribers_num"] != expected or info["subscribers_raw"] != raw:
+            failures.append(
+                f"订阅数 {raw!r}: subscribers_num={info['subscribers_num']!r}，"
+                f"subscribers_raw={info['subscribers_raw']!r}，期望 {expected!r}"
+            )
+    return failures
+
+
+def check_json_exception_logging() -> list:
+    """经过日志队列的异常日志，JSON输出中堆栈在独立的 exc_info 字段，不混入 message"""
+    import json
+    import queue
+    import logging
+    from src.service.logging_service import JsonFormatter, _StructuredQueueHandler
+
+    log_queue = queue.Queue()
+    logger = logging.getLogger("benchmarks.regression_checks.json_exception")
+    logger.propagate = False
+    handler = _StructuredQueueHandler(log_queue)
+    logger.addHandler(handler)
+    try:
+        try:
+            raise ValueError("regression check")
+        except ValueError:
+            logger.exception("记录异常")
+    finally:
+        logger.removeHandler(handler)
+
+    payload = json.loads(JsonFormatter().format(log_queue.get_nowait()))
+    failures = []
+    if "ValueError: regression check" not in payload.get("exc_info", ""):
+        failures.append(f"exc_info 字段缺失或不含堆栈: {payload.get('exc_info')!r}")
+    if payload.get("message") != "记录异常":
+        failures.append(f"message = {payload.get('message')!r}，期望 '记录异常'")
+    return failures
+
+
+CHECKS = {
+    "parse_count": check_parse_count,
+    "channel_subscribers": check_channel_subscribers,
+    "json_exception_logging": check_json_exception_logging,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube爬虫回归检查")
+    parser.add_argument("--check", choices=sorted(CHECKS), action="append", help="只运行指定检查（可重复）")
+    args = parser.parse_args()
+
+    failed = 0
+    for name in args.check or list(CHECKS):
+        failures = CHECKS[name]()
+        print(f"{name}: {'通过' if not failures else f'失败 {len(failures)} 条'}")
+        for failure in failures:
+            print(f"  - {failure}")
+        failed += len(failures)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+离线基准测试 - 基于本地夹具服务器驱动 YouTubeService、URLBatchService 和 text_parsers
+
+报告 videos/sec、单视频 p50/p95 延迟和峰值RSS，并把结果追加到
+benchmarks/results/history.jsonl，便于对比不同提交之间的性能回归。
+
+用法:
+    python -m benchmarks.run_benchmarks                 # 全部基准（需要Chrome）
+    python -m benchmarks.run_benchmarks --parsers-only  # 仅解析器（无需浏览器）
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from benchmarks.fixture_server import FixtureServer
+
+RESULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "history.jsonl")
+
+
+def percentile(values, pct: float) -> float:
+    """最近秩法计算百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb() -> dict:
+    """峰值RSS（MB）：本进程与已回收的子进程（chromedriver/Chrome）"""
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "self": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+        "children": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1),
+    }
+
+
+def git_commit() -> str:
+    """当前提交哈希"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+
+def summarize(latencies, elapsed: float) -> dict:
+    """汇总延迟样本"""
+    return {
+        "videos": len(latencies),
+        "seconds": round(elapsed, 3),
+        "videos_per_sec": round(len(latencies) / elapsed, 3) if elapsed > 0 else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+    }
+
+
+def _timed_video_processing(youtube_service, latencies: list):
+    """包装YouTubeService._process_single_video以记录单视频延迟"""
+    original = youtube_service._process_single_video
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    youtube_service._process_single_video = timed
+
+
+def bench_parsers(server: FixtureServer, pages: int) -> dict:
+    """对夹具页面运行text_parsers"""
+    from src.utils import text_parsers
+    from benchmarks.fixtures import make_video_id
+
+    sources = [server.render(f"/watch?v={make_video_id('parsers', i)}")[1] for i in range(pages)]
+    sources.append(server.render("/@benchchannel/about")[1])
+
+    latencies = []
+    start = time.perf_counter()
+    for source in sources:
+        page_start = time.perf_counter()
+        text_parsers.parse_title_from_page_source(source)
+        text_parsers.parse_description_from_page_source(source)
+        text_parsers.parse_channel_about_from_page_source(source)
+        latencies.append(time.perf_counter() - page_start)
+    summary = summarize(latencies, time.perf_counter() - start)
+    return {
+        "pages": summary["videos"],
+        "seconds": summary["seconds"],
+        "pages_per_sec": summary["videos_per_sec"],
+        "p50_ms": summary["p50_ms"],
+        "p95_ms": summary["p95_ms"],
+    }
+
+
+def bench_search(server: FixtureServer, max_videos: int, headless: bool) -> dict:
+    """驱动YouTubeService.search_videos"""
+    from src.config.settings import YOUTUBE_CONFIG
+    from src.service.browser_service import BrowserService
+    from src.service.youtube_service import YouTubeService
+
+    YOUTUBE_CONFIG["search_url"] = f"{server.base_url}/results?search_query={{}}"
+    browser_service = BrowserService()
+    browser_service.create_driver(headless)
+    try:
+        youtube_service = YouTubeService(browser_service.get_driver())
+        latencies = []
+        _timed_video_processing(youtube_service, latencies)
+        start = time.perf_counter()
+        youtube_service.search_videos("benchmark query", max_videos)
+        return summarize(latencies, time.perf_counter() - start)
+    finally:
+        browser_service.close_driver()
+
+
+def bench_channel(server: FixtureServer, max_videos: int, headless: bool) -> dict:
+    """驱动URLBatchService.process_channel_url"""
+    from src.service.url_batch_service import URLBatchService
+
+    with URLBatchService(headless=headless) as batch_service:
+        latencies = []
+        _timed_video_processing(batch_service.youtube_service, latencies)
+        start = time.perf_counter()
+        batch_service.process_channel_url(f"{server.base_url}/@benchchannel", max_videos)
+        return summarize(latencies, time.perf_counter() - start)
+
+
+def load_history() -> list:
+    """读取历史结果"""
+    if not os.path.exists(RESULTS_FILE):
+        return []
+    with open(RESULTS_FILE, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_result(record: dict):
+    """追加结果到历史文件"""
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def print_report(record: dict, previous: dict = None):
+    """打印结果及与上一次不同提交结果的对比"""
+    print("=" * 60)
+    print(f"提交: {record['commit']}  时间: {record['timestamp']}")
+    for name, result in record["benchmarks"].items():
+        print(f"[{name}]")
+        for key, value in result.items():
+            line = f"  {key}: {value}"
+            old = (previous or {}).get("benchmarks", {}).get(name, {}).get(key)
+            if isinstance(value, (int, float)) and isinstance(old, (int, float)) and old:
+                line += f"  (上次 {old}, {(value - old) / old * 100:+.1f}%)"
+            print(line)
+    print(f"峰值RSS(MB): {record['peak_rss_mb']}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube爬虫离线基准测试")
+    parser.add_argument("--max-videos", type=int, default=10, help="每个基准处理的视频数量")
+    parser.add_argument("--parser-pages", type=int, default=50, help="解析器基准的页面数量")
+    parser.add_argument("--locale", choices=["en", "zh", "vi"], default="en")
+    parser.add_argument("--pad-kb", type=int, default=1024, help="每个页面的填充体积(KB)")
+    parser.add_argument("--parsers-only", action="store_true", help="只运行解析器基准（无需浏览器）")
+    parser.add_argument("--keep-delays", action="store_true", help="保留配置中的固定等待时间")
+    parser.add_argument("--headed", action="store_true", help="使用有界面浏览器")
+    parser.add_argument("--no-save", action="store_true", help="不写入历史结果")
+    args = parser.parse_args()
+
+    if not args.keep_delays:
+        from src.config.settings import SCRAPER_CONFIG
+        SCRAPER_CONFIG.update({"page_load_delay": 0, "scroll_delay": 0, "scroll_count": 1})
+
+    benchmarks = {}
+    with FixtureServer(videos_per_listing=max(30, args.max_videos), locale=args.locale,
+                       pad_bytes=args.pad_kb * 1024) as server:
+        benchmarks["text_parsers"] = bench_parsers(server, args.parser_pages)
+        if not args.parsers_only:
+            benchmarks["youtube_service_search"] = bench_search(server, args.max_videos, not args.headed)
+            benchmarks["url_batch_channel"] = bench_channel(server, args.max_videos, not args.headed)
+
+    record = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "locale": args.locale,
+        "keep_delays": args.keep_delays,
+        "benchmarks": benchmarks,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    previous = next((r for r in reversed(load_history()) if r.get("commit") != record["commit"]), None)
+    print_report(record, previous)
+    if not args.no_save:
+        save_result(record)
+        print(f"结果已追加到: {RESULTS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -53,15 +53,16 @@ class CryptoChannelsScraper:
     "https://www.youtube.com/@crypto-mario"
     ]
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, listing_only: bool = None):
         """
         初始化批量爬虫
         
         Args:
             headless: 是否无头模式
+            listing_only: 是否只用频道列表卡片构建记录（不打开观看页）
         """
         self.headless = headless
-        self.url_batch_service = URLBatchService(headless)
+        self.url_batch_service = URLBatchService(headless, listing_only)
         
     def scrape_all_channels(self, max_videos_per_channel: int = 20):
         """
@@ -139,14 +140,18 @@ def main():
     headless_input = input("是否使用无头模式? (y/n, 默认n): ").lower()
     headless = headless_input in ['y', 'yes', '是']
     
+    listing_input = input("是否使用仅列表模式（不打开视频页，无完整描述）? (y/n, 默认n): ").lower()
+    listing_only = listing_input in ['y', 'yes', '是']
+    
     print(f"\n开始爬取:")
     print(f"每个频道最多: {max_videos} 个视频")
     print(f"无头模式: {'是' if headless else '否'}")
+    print(f"仅列表模式: {'是' if listing_only else '否'}")
     print("=" * 50)
     
     # 运行爬虫
     try:
-        scraper = CryptoChannelsScraper(headless=headless)
+        scraper = CryptoChannelsScraper(headless=headless, listing_only=listing_only)
         saved_files = scraper.run(max_videos)
         
         # 显示保存的文件
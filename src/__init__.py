@@ -2,20 +2,9 @@
 __version__ = "2.0.0"
 __author__ = "YouTube Crawler"
 
-from .service.scraper_service import YouTubeScraperService
-from .main import main
+import importlib
 
-# 导入服务层
-from .service import (
-    BrowserService,
-    YouTubeService,
-    DataService,
-    LoggingService,
-    YouTubeScraperService,
-    YouTubeUserService
-)
-
-# 导入配置层
+# 导入配置层（仅依赖标准库，开销很小）
 from .config import (
     BROWSER_CONFIG,
     SCRAPER_CONFIG,
@@ -27,13 +16,43 @@ from .config import (
     ERROR_CONFIG
 )
 
-# 导入工具层
-from .utils import (
-    text_parsers,
-    element_extractors,
-    css_selectors,
-    file_utils
-)
+# 服务层、工具层和主程序按需加载（PEP 562），
+# 避免仅使用解析器或查看 --help 时也加载 pandas/selenium/webdriver_manager
+_LAZY_ATTRS = {
+    # 主要类
+    'YouTubeScraperService': ('.service.scraper_service', 'YouTubeScraperService'),
+    'YouTubeUserService': ('.service.user_service', 'YouTubeUserService'),
+    'main': ('.main', 'main'),
+    
+    # 服务层
+    'BrowserService': ('.service.browser_service', 'BrowserService'),
+    'YouTubeService': ('.service.youtube_service', 'YouTubeService'),
+    'DataService': ('.service.data_service', 'DataService'),
+    'LoggingService': ('.service.logging_service', 'LoggingService'),
+    
+    # 工具层
+    'text_parsers': ('.utils.text_parsers', None),
+    'element_extractors': ('.utils.element_extractors', None),
+    'css_selectors': ('.utils.css_selectors', None),
+    'file_utils': ('.utils.file_utils', None),
+}
+
+
+def __getattr__(name):
+    """首次访问时加载对应模块并缓存到包命名空间"""
+    target = _LAZY_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, attr) if attr else module
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # 主要类
@@ -46,8 +65,6 @@ __all__ = [
     'YouTubeService',
     'DataService',
     'LoggingService',
-    'YouTubeScraperService',
-    'YouTubeUserService',
     
     # 配置层
     'BROWSER_CONFIG',
@@ -64,4 +81,4 @@ __all__ = [
     'element_extractors',
     'css_selectors',
     'file_utils'
-] 
\ No newline at end of file
+]
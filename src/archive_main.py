@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+页面归档命令行 - 查看归档统计、按容量淘汰、对归档页面重新解析（无需浏览器）
+
+用法:
+    python -m src.archive_main stats
+    python -m src.archive_main reparse                              # 重新解析全部归档页面
+    python -m src.archive_main reparse --page-type watch --hours 48 --output-name watch_fix
+    python -m src.archive_main backfill --workers 8                 # 多进程并行重新解析
+    python -m src.archive_main evict --max-mb 500
+"""
+
+import time
+import argparse
+
+from .utils.page_reparser import VIDEO_PAGE_TYPES, CHANNEL_PAGE_TYPES
+
+
+def open_archive(args):
+    """打开归档（命令行指定目录时不要求配置中启用归档）"""
+    from .service.page_archive_service import PageArchiveService
+    return PageArchiveService(archive_dir=args.archive_dir)
+
+
+def run_stats(args):
+    """显示归档统计"""
+    with open_archive(args) as archive:
+        stats = archive.stats()
+    print(f"页面数: {stats['pages']}  内容文件数: {stats['blobs']}")
+    print(f"原始体积: {stats['raw_bytes'] / 1024 / 1024:.1f} MB  "
+          f"压缩后: {stats['stored_bytes'] / 1024 / 1024:.1f} MB  压缩比: {stats['compression_ratio']}")
+    for page_type, count in sorted(stats["by_page_type"].items()):
+        print(f"  {page_type}: {count}")
+
+
+def run_evict(args):
+    """按容量上限淘汰最旧的页面"""
+    with open_archive(args) as archive:
+        max_bytes = int(args.max_mb * 1024 * 1024) if args.max_mb is not None else archive.max_bytes
+        removed = archive.evict(max_bytes)
+    print(f"已淘汰 {removed} 个内容文件")
+
+
+def run_reparse(args):
+    """重新解析归档页面并保存结果"""
+    from .service.data_service import DataService
+    from .utils.page_reparser import reparse_archive
+
+    since = int(time.time() - args.hours * 3600) if args.hours else None
+    videos, channels, pages = [], [], 0
+    start = time.time()
+    with open_archive(args) as archive:
+        for result in reparse_archive(archive, args.page_type, since):
+            pages += 1
+            if result["page_type"] in CHANNEL_PAGE_TYPES:
+                channels.extend(result["records"])
+            else:
+                videos.extend(result["records"])
+    duration = time.time() - start
+    print(f"重新解析 {pages} 个页面，用时 {duration:.1f} 秒 ({pages / duration if duration else 0:.1f} 页/秒)")
+    print(f"视频记录 {len(videos)} 条，频道记录 {len(channels)} 条")
+
+    data_service = DataService()
+    for format_type, filepath in data_service.save_videos(videos, args.output_name).items():
+        print(f"  {format_type.upper()}: {filepath}")
+    channels_path = data_service.save_channels(channels, args.output_name)
+    if channels_path:
+        print(f"  CHANNELS: {channels_path}")
+
+
+def run_backfill(args):
+    """多进程并行重新解析归档页面并保存结果"""
+    from .service.reparse_service import ReparseService
+
+    since = int(time.time() - args.hours * 3600) if args.hours else None
+    with open_archive(args) as archive:
+        result = ReparseService(archive).run(args.page_type, since, args.workers, args.chunk_size,
+                                             args.output_name)
+    print(f"重新解析 {result['pages']} 个页面，用时 {result['seconds']:.1f} 秒 "
+          f"({result['pages_per_sec']:.1f} 页/秒)")
+    print(f"视频记录 {result['videos']} 条，频道记录 {result['channels']} 条")
+    if result["failed_pages"]:
+        print(f"解析失败页面 {result['failed_pages']} 个（详见日志）")
+    for format_type, filepath in result["saved_files"].items():
+        print(f"  {format_type.upper()}: {filepath}")
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="页面归档：统计、淘汰、重新解析")
+    parser.add_argument("--archive-dir", default=None, help="归档目录（默认使用配置中的目录）")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("stats", help="显示归档统计")
+
+    evict_parser = subparsers.add_parser("evict", help="按抓取时间淘汰最旧的页面")
+    evict_parser.add_argument("--max-mb", type=float, default=None, help="容量上限（MB），默认使用配置")
+
+    reparse_parser = subparsers.add_parser("reparse", help="重新解析归档页面（无需浏览器）")
+    reparse_parser.add_argument("--page-type", choices=VIDEO_PAGE_TYPES + CHANNEL_PAGE_TYPES,
+                                help="只解析指定页面类型")
+    reparse_parser.add_argument("--hours", type=float, default=None, help="只解析最近N小时抓取的页面")
+    reparse_parser.add_argument("--output-name", default="archive_reparse", help="输出文件名前缀")
+
+    backfill_parser = subparsers.add_parser("backfill", help="多进程并行重新解析归档页面")
+    backfill_parser.add_argument("--page-type", choices=VIDEO_PAGE_TYPES + CHANNEL_PAGE_TYPES,
+                                 help="只解析指定页面类型")
+    backfill_parser.add_argument("--hours", type=float, default=None, help="只解析最近N小时抓取的页面")
+    backfill_parser.add_argument("--workers", type=int, default=None, help="进程数（默认CPU核数）")
+    backfill_parser.add_argument("--chunk-size", type=int, default=None, help="每个分片的页面数")
+    backfill_parser.add_argument("--output-name", default="archive_reparse", help="输出文件名前缀")
+
+    args = parser.parse_args()
+    {"stats": run_stats, "evict": run_evict, "reparse": run_reparse, "backfill": run_backfill}[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,18 @@ __all__ = [
     'REGEX_CONFIG',
     'FILTER_CONFIG',
     'ERROR_CONFIG',
+    'METRICS_CONFIG',
+    'SELECTOR_CONFIG',
+    'EXTRACTION_CONFIG',
+    'CHANNEL_WALK_CONFIG',
+    'LISTING_CONFIG',
+    'SNAPSHOT_CONFIG',
+    'ARCHIVE_CONFIG',
+    'RATE_LIMIT_CONFIG',
+    'BLOCK_CONFIG',
+    'NEGATIVE_CACHE_CONFIG',
+    'WATCHDOG_CONFIG',
+    'MEMORY_CONFIG',
     'BASE_DIR',
     'OUTPUT_DIR'
 ] 
\ No newline at end of file
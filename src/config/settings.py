@@ -59,6 +59,7 @@ SCRAPER_CONFIG = {
     "page_load_delay": 1,  # 大幅减少页面加载延迟到1秒
     "retry_count": 1,  # 减少重试次数到1次
     "retry_delay": 1,  # 减少重试延迟到1秒
+    "driver_pool_size": 1,  # 批量搜索时并行处理视频的浏览器驱动数量
 }
 
 # YouTube URL配置
@@ -80,6 +81,16 @@ LOGGING_CONFIG = {
     "level": "INFO",
     "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     "file": os.path.join(BASE_DIR, "logs", "youtube_crawler.log"),
+    "formatter": "text",  # text 或 json（结构化日志，每行一个JSON对象）
+    "max_bytes": 10 * 1024 * 1024,  # 单个日志文件10MB
+    "backup_count": 5,
+    "queue_size": -1,  # 日志队列长度，-1为不限
+    # 按模块设置日志级别
+    "module_levels": {
+        "selenium": "WARNING",
+        "urllib3": "WARNING",
+        "webdriver_manager": "WARNING",
+    },
 }
 
 # 正则表达式配置
@@ -122,8 +133,133 @@ FILTER_CONFIG = {
 
 # 错误处理配置 - 优化性能
 ERROR_CONFIG = {
-    "max_retries": 1,  # 减少重试次数到1次
+    "max_retries": 1,  # 减少重试次数到1次（未分类异常的总尝试次数）
     "retry_delay": 1,  # 减少重试延迟到0.5秒
     "continue_on_error": True,
     "log_errors": True,
-} 
\ No newline at end of file
+    # 按错误类别的重试策略（类别见 src/utils/errors.py），未列出的类别按 max_retries/retry_delay 处理
+    #   max_retries: 重试次数；delay/backoff: 第n次重试前等待 delay * backoff^(n-1) 秒
+    #   where: in_place 立即重试，deferred 放到当前频道/搜索的队尾再试
+    #   negative_cache: 最终失败时写入负缓存，后续运行直接跳过该视频
+    "retry_policy": {
+        "timeout": {"max_retries": 2, "delay": 2, "backoff": 2.0, "where": "in_place"},
+        "driver": {"max_retries": 1, "delay": 3, "backoff": 1.0, "where": "in_place"},
+        "blocked": {"max_retries": 2, "delay": 0, "backoff": 1.0, "where": "in_place"},  # 等待由全局退避负责
+        "selector_miss": {"max_retries": 1, "delay": 0, "backoff": 1.0, "where": "deferred"},
+        "unavailable": {"max_retries": 0, "negative_cache": True},
+        "age_restricted": {"max_retries": 0, "negative_cache": True},
+    },
+} 
+
+# 指标配置 - Prometheus兼容导出
+METRICS_CONFIG = {
+    "enabled": True,
+    "namespace": "youtube_crawler",
+    "http_port": None,  # 设置端口(如9108)后启动 /metrics HTTP端点
+    "http_addr": "0.0.0.0",
+    "textfile_path": None,  # node-exporter textfile路径，如 /var/lib/node_exporter/youtube_crawler.prom
+    "default_buckets": [0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60],
+}
+
+
+# 选择器命中率学习配置
+SELECTOR_CONFIG = {
+    "learning_enabled": True,  # 按历史命中率调整选择器尝试顺序
+    "stats_file": os.path.join(BASE_DIR, "data", "selector_stats.json"),
+    "min_samples": 5,  # 样本数达到该值后才参与排序
+    "dead_min_attempts": 20,  # 尝试次数达到该值且从未命中视为失效
+    "save_every": 50,  # 每记录N次保存一次
+}
+
+
+# 提取模式配置
+EXTRACTION_CONFIG = {
+    # implicit: 使用 BROWSER_CONFIG["implicit_wait"]，每个选择器未命中都可能阻塞
+    # deadline: 隐式等待设为0，每个字段在一个显式截止时间内同时轮询全部选择器
+    "mode": "implicit",
+    "field_deadlines": {  # 各字段截止时间（秒）
+        "title": 5,
+        "channel": 3,
+        "show_more": 1.5,
+        "description": 3,
+    },
+    "poll_interval": 0.25,  # 轮询间隔（秒）
+}
+
+# 频道列表遍历配置
+CHANNEL_WALK_CONFIG = {
+    # 先读取/videos列表卡片上的发布时间，规划需要打开的视频，凑够数量即停止滚动
+    "plan_from_tiles": True,
+    "open_recent_videos": True,  # 是否打开24小时内的视频（不计入max_videos）
+}
+
+# 观看次数快照配置
+SNAPSHOT_CONFIG = {
+    "enabled": True,  # 保存结果时同时追加观看次数快照
+    "db_path": os.path.join(BASE_DIR, "data", "snapshots.sqlite3"),
+}
+
+# 仅列表模式配置：直接用列表/搜索结果卡片构建视频记录，不打开观看页
+LISTING_CONFIG = {
+    "listing_only": False,
+    "fetch_description": False,  # 仅列表模式下是否仍打开观看页补全完整描述
+}
+
+# 页面归档配置：保存抓取到的观看页/频道页/关于页源码，解析器修复后可重新解析而无需重新抓取
+ARCHIVE_CONFIG = {
+    "enabled": False,  # 启用后每个页面多读取一次page_source（约1-2MB）
+    "dir": os.path.join(BASE_DIR, "data", "page_archive"),
+    "max_bytes": 2 * 1024 ** 3,  # 压缩后总容量上限，超过时按抓取时间淘汰最旧的页面
+    "compression_level": 6,  # zlib压缩级别
+    "reparse_workers": None,  # 并行重新解析的进程数，None表示CPU核数
+    "reparse_chunk_size": 64,  # 每个子进程任务包含的页面数
+}
+
+# 限速配置：按主机的令牌桶，线程间和进程间共享（状态文件加 fcntl 锁）
+RATE_LIMIT_CONFIG = {
+    "enabled": True,
+    "state_dir": os.path.join(BASE_DIR, "data", "rate_limits"),
+    "hosts": {
+        # rate: 每秒请求数，burst: 允许的突发请求数
+        "youtube.com": {"rate": 1.0, "burst": 3},
+        "googlevideo.com": {"rate": 5.0, "burst": 10},
+    },
+}
+
+# 拦截页识别配置：同意页/机器人验证/异常流量/429 作为单独的失败类别，并触发全局指数退避
+BLOCK_CONFIG = {
+    "detect": True,
+    "backoff_base_seconds": 30,  # 第一次拦截的退避时间
+    "backoff_max_seconds": 900,  # 退避时间上限
+    "backoff_jitter": 0.5,  # 退避时间乘以 [1-jitter, 1] 的随机系数，避免所有工作者同时恢复
+}
+
+# 负缓存配置：已删除/私享/年龄限制的视频ID，后续运行直接跳过
+NEGATIVE_CACHE_CONFIG = {
+    "enabled": True,
+    "db_path": os.path.join(BASE_DIR, "data", "negative_cache.sqlite3"),
+    "ttl_days": 30,  # 过期后重新尝试（私享视频可能重新公开）
+}
+
+# 驱动看门狗配置：driver.get/execute_script 卡死（渲染进程冻结、弹窗）超过截止时间时，
+# 强制结束 chromedriver/Chrome 进程树并重建驱动，从当前视频继续
+WATCHDOG_CONFIG = {
+    "enabled": True,
+    "poll_interval": 1.0,  # 监控线程检查截止时间的间隔（秒）
+    "kill_wait_seconds": 5,  # 结束进程树后等待 chromedriver 退出的时间（秒）
+    "deadlines": {  # 各操作的截止时间（秒），应明显大于 page_load_timeout
+        "navigate": 60,  # 页面导航和拦截页识别
+        "extract": 120,  # 观看页播放状态检查、等待和字段提取
+        "scroll": 90,  # 频道页规划/滚动/读取卡片
+    },
+}
+
+# 浏览器内存治理：长批次中Chrome内存持续增长，定期采样进程树RSS和JS堆，超过阈值时回收（重建）驱动
+MEMORY_CONFIG = {
+    "enabled": True,
+    "blank_between_videos": True,  # 每个视频处理后导航到 about:blank，释放观看页内存
+    "check_every": 10,  # 每处理N个视频采样一次内存
+    "max_rss_mb": 2048,  # chromedriver/Chrome 进程树RSS上限（MB），None表示不限制
+    "max_js_heap_mb": 512,  # 当前页面JS堆已用大小上限（MB，CDP Performance.getMetrics），None表示不限制
+    "recycle_every": None,  # 无论内存多少，每处理N个视频回收一次驱动，None表示不定期回收
+}
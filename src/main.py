@@ -1,13 +1,85 @@
 # -*- coding: utf-8 -*-
 """
 YouTube爬虫主入口 - 使用服务层架构
+
+用法:
+    python -m src.main                                   # 交互式输入单个搜索词
+    python -m src.main --queries-file queries.txt        # 批量搜索（每行一个搜索词）
+    python -m src.main --queries-file queries.txt --max-videos 20 --pool-size 3 --headless
+    python -m src.main --upload-date today --type video --sort upload_date   # 只搜索24小时内的视频
 """
 
-from .service.scraper_service import YouTubeScraperService
+import argparse
+
+from .utils.search_filters import (
+    SearchOptions, UPLOAD_DATE_VALUES, TYPE_VALUES, DURATION_VALUES, SORT_VALUES
+)
+
+
+def load_queries(filepath: str) -> list:
+    """读取搜索词文件：每行一个，忽略空行和#开头的注释行"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+
+def print_saved_files(saved_files: dict):
+    """显示保存的文件"""
+    if saved_files:
+        print(f"\n文件已保存:")
+        for format_type, filepath in saved_files.items():
+            print(f"  {format_type.upper()}: {filepath}")
+    else:
+        print("\n没有找到任何视频")
+
+
+def build_options(args) -> SearchOptions:
+    """根据命令行参数构建搜索过滤选项"""
+    return SearchOptions(upload_date=args.upload_date, type=args.type,
+                         duration=args.duration, sort_by=args.sort)
+
+
+def run_batch(args):
+    """批量搜索模式"""
+    from .service.scraper_service import YouTubeScraperService
+    
+    queries = load_queries(args.queries_file)
+    if not queries:
+        print(f"搜索词文件为空: {args.queries_file}")
+        return
+    
+    print(f"批量搜索 {len(queries)} 个关键词，每个最多 {args.max_videos} 个视频")
+    print("=" * 50)
+    
+    try:
+        with YouTubeScraperService(headless=args.headless) as scraper:
+            saved_files = scraper.run_batch(queries, args.max_videos, args.pool_size, args.output_name,
+                                            build_options(args))
+            print_saved_files(saved_files)
+    except Exception as e:
+        print(f"爬取过程中出错: {str(e)}")
 
 
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description="YouTube视频描述爬虫")
+    parser.add_argument("--queries-file", help="搜索词文件（每行一个），指定后进入批量搜索模式")
+    parser.add_argument("--max-videos", type=int, default=10, help="每个搜索词的最大视频数量 (默认10)")
+    parser.add_argument("--pool-size", type=int, default=None, help="并行处理视频的浏览器驱动数量")
+    parser.add_argument("--output-name", default="batch_search", help="批量搜索输出文件名前缀")
+    parser.add_argument("--headless", action="store_true", help="使用无头浏览器")
+    parser.add_argument("--upload-date", choices=list(UPLOAD_DATE_VALUES), help="上传时间过滤")
+    parser.add_argument("--type", choices=list(TYPE_VALUES), help="结果类型过滤")
+    parser.add_argument("--duration", choices=list(DURATION_VALUES), help="时长过滤")
+    parser.add_argument("--sort", choices=list(SORT_VALUES), help="排序方式")
+    args = parser.parse_args()
+    
+    if args.queries_file:
+        run_batch(args)
+        return
+    
+    # 延迟导入服务层，启动时不加载selenium/pandas
+    from .service.scraper_service import YouTubeScraperService
+    
     print("YouTube视频描述爬虫")
     print("=" * 50)
     
@@ -28,21 +100,16 @@ def main():
     
     # 使用上下文管理器运行爬虫
     try:
-        with YouTubeScraperService(headless=False) as scraper:
+        with YouTubeScraperService(headless=args.headless) as scraper:
             # 运行完整的爬虫流程
-            saved_files = scraper.run(search_query, max_videos)
+            saved_files = scraper.run(search_query, max_videos, build_options(args))
             
             # 显示保存的文件
-            if saved_files:
-                print(f"\n文件已保存:")
-                for format_type, filepath in saved_files.items():
-                    print(f"  {format_type.upper()}: {filepath}")
-            else:
-                print("\n没有找到任何视频")
+            print_saved_files(saved_files)
                 
     except Exception as e:
         print(f"爬取过程中出错: {str(e)}")
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main() 
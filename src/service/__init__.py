@@ -1,13 +1,45 @@
 # YouTube爬虫服务层
 
-from .browser_service import BrowserService
-from .youtube_service import YouTubeService
-from .data_service import DataService
-from .logging_service import LoggingService
-from .scraper_service import YouTubeScraperService
-from .user_service import YouTubeUserService
-# from .batch_service import BatchProcessingService  # 未实现
-from .url_batch_service import URLBatchService
+import importlib
+
+# 服务类按需加载（PEP 562）：只用DataService或指标服务的进程不会加载selenium
+_LAZY_ATTRS = {
+    'BrowserService': '.browser_service',
+    'YouTubeService': '.youtube_service',
+    'DataService': '.data_service',
+    'LoggingService': '.logging_service',
+    'YouTubeScraperService': '.scraper_service',
+    'YouTubeUserService': '.user_service',
+    # 'BatchProcessingService': '.batch_service',  # 未实现
+    'URLBatchService': '.url_batch_service',
+    'MetricsService': '.metrics_service',
+    'get_metrics_service': '.metrics_service',
+    'StatsService': '.stats_service',
+    'SnapshotService': '.snapshot_service',
+    'PageArchiveService': '.page_archive_service',
+    'get_page_archive': '.page_archive_service',
+    'ReparseService': '.reparse_service',
+    'fetch_page': '.fetch_service',
+    'NegativeCacheService': '.negative_cache_service',
+    'get_negative_cache': '.negative_cache_service',
+    'DriverWatchdog': '.watchdog_service',
+    'get_watchdog': '.watchdog_service',
+}
+
+
+def __getattr__(name):
+    """首次访问时加载对应模块并缓存到包命名空间"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     'BrowserService',
@@ -17,5 +49,17 @@ __all__ = [
     'YouTubeScraperService',
     'YouTubeUserService',
     # 'BatchProcessingService',  # 未实现
-    'URLBatchService'
-] 
\ No newline at end of file
+    'URLBatchService',
+    'MetricsService',
+    'get_metrics_service',
+    'StatsService',
+    'SnapshotService',
+    'PageArchiveService',
+    'get_page_archive',
+    'ReparseService',
+    'fetch_page',
+    'NegativeCacheService',
+    'get_negative_cache',
+    'DriverWatchdog',
+    'get_watchdog'
+]
@@ -3,13 +3,19 @@
 浏览器服务层 - 处理浏览器相关操作
 """
 
+import queue
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from ..config.settings import BROWSER_CONFIG
+from ..config.settings import BROWSER_CONFIG, EXTRACTION_CONFIG, WATCHDOG_CONFIG, MEMORY_CONFIG
+from ..utils.process_tree import kill_process_tree, process_tree_rss
+from .metrics_service import get_metrics_service
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+_MB = 1024 * 1024
 
 
 class BrowserService:
@@ -17,9 +23,25 @@ class BrowserService:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.metrics = get_metrics_service()
         self.driver = None
+        self._drivers_created = 0
+        self._headless = None
+        # 当前驱动的内存治理状态（重建驱动时清零）
+        self._performance_enabled = False
+        self._videos_on_driver = 0
+        self._videos_since_check = 0
+        # 整个服务生命周期的内存统计，供批处理统计输出
+        self.memory_stats = {
+            "samples": 0,
+            "recycles": 0,
+            "last_rss_bytes": None,
+            "last_js_heap_bytes": None,
+            "peak_rss_bytes": None,
+            "peak_js_heap_bytes": None,
+        }
     
-    def create_driver(self, headless: bool = None) -> webdriver.Chrome:
+    def create_driver(self, headless: bool = None) -> "webdriver.Chrome":
         """
         创建Chrome浏览器驱动
         
@@ -29,8 +51,15 @@ class BrowserService:
         Returns:
             Chrome WebDriver实例
         """
+        # 延迟导入selenium/webdriver_manager，只在真正需要浏览器时加载
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from webdriver_manager.chrome import ChromeDriverManager
+        
         if headless is None:
             headless = BROWSER_CONFIG["headless"]
+        self._headless = headless
         
         self.logger.info(f"创建Chrome浏览器驱动 (headless: {headless})")
         
@@ -56,16 +85,39 @@ class BrowserService:
         # 创建WebDriver
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         
-        # 设置隐式等待时间
-        self.driver.implicitly_wait(BROWSER_CONFIG["implicit_wait"])
+        # 设置隐式等待时间（截止时间模式下为0，由各字段的显式截止时间控制等待）
+        if EXTRACTION_CONFIG["mode"] == "deadline":
+            self.driver.implicitly_wait(0)
+        else:
+            self.driver.implicitly_wait(BROWSER_CONFIG["implicit_wait"])
         
         # 设置页面加载超时
         self.driver.set_page_load_timeout(BROWSER_CONFIG["page_load_timeout"])
         
+        # 同一服务实例再次创建驱动即视为重建
+        if self._drivers_created > 0:
+            self.metrics.inc("driver_restarts_total")
+        self._drivers_created += 1
+        self._performance_enabled = False
+        self._videos_on_driver = 0
+        self._videos_since_check = 0
+        
         self.logger.info("Chrome浏览器驱动创建成功")
         return self.driver
     
-    def get_driver(self) -> webdriver.Chrome:
+    def record_blocked_request(self, resource_type: str, estimated_bytes: int = 0):
+        """
+        记录一次被拦截的资源请求
+        
+        Args:
+            resource_type: 资源类型，如 image/media/font
+            estimated_bytes: 估算节省的字节数
+        """
+        self.metrics.inc("blocked_requests_total", resource_type=resource_type)
+        if estimated_bytes:
+            self.metrics.inc("blocked_bytes_total", estimated_bytes, resource_type=resource_type)
+    
+    def get_driver(self) -> "webdriver.Chrome":
         """获取当前WebDriver实例"""
         if self.driver is None:
             raise RuntimeError("WebDriver未初始化，请先调用create_driver()")
@@ -82,6 +134,143 @@ class BrowserService:
             finally:
                 self.driver = None
     
+    def driver_pid(self) -> Optional[int]:
+        """chromedriver进程号，驱动未创建时返回None"""
+        try:
+            return self.driver.service.process.pid
+        except AttributeError:
+            return None
+    
+    def kill_driver(self):
+        """
+        强制结束 chromedriver 及其派生的 Chrome 进程树（不经过 quit，卡死的会话无法正常退出）
+        
+        可以从看门狗线程调用：正在阻塞的 driver 调用会因连接断开而抛出异常。
+        """
+        driver, self.driver = self.driver, None
+        if driver is None:
+            return
+        pid = None
+        try:
+            pid = driver.service.process.pid
+        except AttributeError:
+            pass
+        if pid is None:
+            self.logger.warning("无法获取chromedriver进程号，尝试直接关闭驱动")
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.warning(f"关闭浏览器驱动时出错: {str(e)}")
+            return
+        killed = kill_process_tree(pid)
+        try:
+            driver.service.process.wait(timeout=WATCHDOG_CONFIG["kill_wait_seconds"])
+        except Exception as e:
+            self.logger.warning(f"等待chromedriver退出失败: {str(e)}")
+        self.logger.warning(f"已强制结束浏览器进程树 (chromedriver pid {pid}，共 {killed} 个进程)")
+    
+    def rebuild_driver(self) -> "webdriver.Chrome":
+        """结束当前驱动进程树并以相同的无头设置重新创建驱动"""
+        self.kill_driver()
+        return self.create_driver(self._headless)
+    
+    def sample_memory(self) -> Dict[str, Optional[int]]:
+        """
+        采样浏览器内存：chromedriver/Chrome 进程树RSS，以及当前页面的JS堆已用大小（CDP Performance.getMetrics）
+        
+        Returns:
+            {"rss_bytes", "js_heap_bytes"}，无法获取的项为None
+        """
+        sample = {"rss_bytes": None, "js_heap_bytes": None}
+        if not self.is_driver_ready():
+            return sample
+        
+        pid = self.driver_pid()
+        if pid is not None:
+            sample["rss_bytes"] = process_tree_rss(pid) or None
+        try:
+            if not self._performance_enabled:
+                self.driver.execute_cdp_cmd("Performance.enable", {})
+                self._performance_enabled = True
+            result = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+            values = {m["name"]: m["value"] for m in result.get("metrics", [])}
+            if "JSHeapUsedSize" in values:
+                sample["js_heap_bytes"] = int(values["JSHeapUsedSize"])
+        except Exception as e:
+            self.logger.debug(f"读取JS堆大小失败: {str(e)}")
+        
+        stats = self.memory_stats
+        stats["samples"] += 1
+        for kind in ("rss", "js_heap"):
+            value = sample[f"{kind}_bytes"]
+            if value is None:
+                continue
+            stats[f"last_{kind}_bytes"] = value
+            stats[f"peak_{kind}_bytes"] = max(value, stats[f"peak_{kind}_bytes"] or 0)
+            self.metrics.observe("browser_memory_mb", value / _MB, kind=kind)
+        return sample
+    
+    def _memory_over_threshold(self, sample: Dict[str, Optional[int]]) -> Optional[str]:
+        """返回超过的阈值类型 rss/js_heap，均未超过时返回None"""
+        for kind in ("rss", "js_heap"):
+            limit_mb = MEMORY_CONFIG[f"max_{kind}_mb"]
+            value = sample[f"{kind}_bytes"]
+            if limit_mb is not None and value is not None and value > limit_mb * _MB:
+                return kind
+        return None
+    
+    def recycle_driver(self, reason: str) -> "webdriver.Chrome":
+        """
+        正常关闭并以相同的无头设置重新创建驱动，释放Chrome累积的内存
+        
+        Args:
+            reason: 回收原因（指标标签）rss/js_heap/periodic
+        """
+        self.logger.info(f"回收浏览器驱动 ({reason})，已处理 {self._videos_on_driver} 个视频")
+        self.metrics.inc("driver_recycles_total", reason=reason)
+        self.memory_stats["recycles"] += 1
+        self.close_driver()
+        return self.create_driver(self._headless)
+    
+    def blank_page(self):
+        """导航到 about:blank，释放上一个页面的DOM和JS堆"""
+        if not self.is_driver_ready():
+            return
+        try:
+            self.driver.get("about:blank")
+        except Exception as e:
+            self.logger.debug(f"导航到空白页失败: {str(e)}")
+    
+    def govern_memory(self) -> bool:
+        """
+        每处理完一个视频调用一次：每 check_every 个视频采样内存，超过阈值（或达到 recycle_every）时回收驱动，
+        否则按配置导航到空白页
+        
+        Returns:
+            是否回收了驱动（调用方需要改用新的 self.driver）
+        """
+        if not MEMORY_CONFIG["enabled"] or not self.is_driver_ready():
+            return False
+        self._videos_on_driver += 1
+        self._videos_since_check += 1
+        
+        reason = None
+        recycle_every = MEMORY_CONFIG["recycle_every"]
+        if recycle_every and self._videos_on_driver >= recycle_every:
+            reason = "periodic"
+        elif self._videos_since_check >= MEMORY_CONFIG["check_every"]:
+            # 在观看页上采样，JS堆反映真实页面的占用
+            self._videos_since_check = 0
+            sample = self.sample_memory()
+            reason = self._memory_over_threshold(sample)
+        
+        if reason is not None:
+            self.recycle_driver(reason)
+            return True
+        if MEMORY_CONFIG["blank_between_videos"]:
+            self.blank_page()
+        return False
+    
     def __enter__(self):
         """上下文管理器入口"""
         self.create_driver()
@@ -152,4 +341,74 @@ class BrowserService:
             return self.driver.execute_script(script)
         except Exception as e:
             self.logger.error(f"执行JavaScript脚本失败: {str(e)}")
-            return None 
\ No newline at end of file
+            return None
+
+
+class BrowserPool:
+    """浏览器驱动池 - 多个工作线程共享一组Chrome实例，每个驱动同一时间只被一个线程使用"""
+    
+    def __init__(self, size: int, headless: bool = None, existing: Optional[BrowserService] = None):
+        """
+        初始化驱动池
+        
+        Args:
+            size: 驱动数量
+            headless: 是否无头模式
+            existing: 已创建驱动的浏览器服务，加入池中复用（关闭池时不会关闭它）
+        """
+        self.logger = logging.getLogger(__name__)
+        self.size = max(1, size)
+        self.headless = headless
+        self.existing = existing
+        self.browser_services: List[BrowserService] = []
+        self._owned: List[BrowserService] = []
+        self._idle = queue.Queue()
+    
+    def start(self):
+        """创建驱动"""
+        if self.existing is not None and self.existing.is_driver_ready():
+            self.browser_services.append(self.existing)
+        try:
+            while len(self.browser_services) < self.size:
+                browser_service = BrowserService()
+                browser_service.create_driver(self.headless)
+                self.browser_services.append(browser_service)
+                self._owned.append(browser_service)
+        except Exception:
+            self.close()
+            raise
+        for browser_service in self.browser_services:
+            self._idle.put(browser_service)
+        self.logger.info(f"浏览器驱动池已就绪，共 {len(self.browser_services)} 个驱动")
+        return self
+    
+    def acquire(self) -> BrowserService:
+        """取出一个空闲的浏览器服务（阻塞直到可用）"""
+        return self._idle.get()
+    
+    def release(self, browser_service: BrowserService):
+        """归还浏览器服务"""
+        self._idle.put(browser_service)
+    
+    @contextmanager
+    def browser(self):
+        """以上下文管理器方式借用浏览器服务"""
+        browser_service = self.acquire()
+        try:
+            yield browser_service
+        finally:
+            self.release(browser_service)
+    
+    def close(self):
+        """关闭池创建的驱动"""
+        for browser_service in self._owned:
+            browser_service.close_driver()
+        self._owned = []
+        self.browser_services = []
+        self._idle = queue.Queue()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -6,11 +6,12 @@
 import os
 import json
 import logging
-import pandas as pd
 from typing import List, Dict, Optional
 from pathlib import Path
 
-from ..config.settings import OUTPUT_CONFIG, OUTPUT_DIR
+from ..config.settings import OUTPUT_CONFIG, OUTPUT_DIR, SNAPSHOT_CONFIG
+from ..utils.text_parsers import resolve_upload_timestamp
+from .stats_service import StatsService
 
 
 class DataService:
@@ -18,6 +19,8 @@ class DataService:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.stats_service = StatsService()
+        self._snapshot_service = None
         self._ensure_output_dir()
     
     def _ensure_output_dir(self):
@@ -25,13 +28,14 @@ class DataService:
         os.makedirs(OUTPUT_DIR, exist_ok=True)
         self.logger.info(f"输出目录: {OUTPUT_DIR}")
     
-    def save_videos(self, videos: List[Dict], search_query: str) -> Dict[str, str]:
+    def save_videos(self, videos: List[Dict], search_query: str, record_snapshots: bool = True) -> Dict[str, str]:
         """
         保存视频数据
         
         Args:
             videos: 视频数据列表
             search_query: 搜索关键词
+            record_snapshots: 是否追加观看次数快照（已逐批写入快照的调用方传False）
             
         Returns:
             保存的文件路径字典
@@ -58,11 +62,27 @@ class DataService:
                 saved_files["json"] = json_path
         
         self.logger.info(f"成功保存 {len(videos)} 个视频到 {len(saved_files)} 个文件")
+        
+        # 追加观看次数快照（多次抓取形成时间序列）
+        if record_snapshots and SNAPSHOT_CONFIG["enabled"]:
+            try:
+                self.snapshot_service.record(videos)
+            except Exception as e:
+                self.logger.error(f"记录观看次数快照失败: {str(e)}")
         return saved_files
     
+    @property
+    def snapshot_service(self):
+        """快照服务（首次使用时打开数据库）"""
+        if self._snapshot_service is None:
+            from .snapshot_service import SnapshotService
+            self._snapshot_service = SnapshotService()
+        return self._snapshot_service
+    
     def _save_to_csv(self, videos: List[Dict], search_query: str) -> Optional[str]:
         """保存为CSV格式"""
         try:
+            import pandas as pd  # 延迟导入，避免仅加载服务时引入pandas
             df = pd.DataFrame(videos)
             filename = f"{search_query}_videos.csv"
             filepath = os.path.join(OUTPUT_DIR, filename)
@@ -96,6 +116,153 @@ class DataService:
             self.logger.error(f"保存JSON文件失败: {str(e)}")
             return None
     
+    def save_query_map(self, query_map: Dict[str, List[str]], name: str) -> Optional[str]:
+        """
+        保存批量搜索的 搜索词→视频ID 映射
+        
+        Args:
+            query_map: {搜索词: [视频ID, ...]}
+            name: 文件名前缀
+            
+        Returns:
+            保存的文件路径
+        """
+        try:
+            filename = f"{self._sanitize_filename(name)}_query_map.json"
+            filepath = os.path.join(OUTPUT_DIR, filename)
+            
+            with open(filepath, 'w', encoding=OUTPUT_CONFIG["json_encoding"]) as f:
+                json.dump(query_map, f, ensure_ascii=False, indent=2)
+            
+            self.logger.info(f"已保存搜索词映射文件: {filepath}")
+            return filepath
+            
+        except Exception as e:
+            self.logger.error(f"保存搜索词映射文件失败: {str(e)}")
+            return None
+
+    def save_channels(self, channels: List[Dict], name: str) -> Optional[str]:
+        """
+        保存频道信息记录（如重新解析关于页得到的 bio/订阅数/视频数）
+
+        Args:
+            channels: 频道记录列表
+            name: 文件名前缀
+
+        Returns:
+            保存的文件路径
+        """
+        if not channels:
+            return None
+        try:
+            filename = f"{self._sanitize_filename(name)}_channels.json"
+            filepath = os.path.join(OUTPUT_DIR, filename)
+
+            with open(filepath, 'w', encoding=OUTPUT_CONFIG["json_encoding"]) as f:
+                json.dump(channels, f, ensure_ascii=False, indent=2)
+
+            self.logger.info(f"已保存频道信息文件: {filepath}")
+            return filepath
+
+        except Exception as e:
+            self.logger.error(f"保存频道信息文件失败: {str(e)}")
+            return None
+
+    def records_path(self, name: str, kind: str = "videos") -> str:
+        """逐批追加的记录文件路径 {name}_{kind}.jsonl"""
+        return os.path.join(OUTPUT_DIR, f"{self._sanitize_filename(name)}_{kind}.jsonl")
+
+    def append_records(self, records: List[Dict], name: str, kind: str = "videos") -> Optional[str]:
+        """
+        把一批记录追加到 JSON Lines 文件（每行一条），调用方不需要在内存中保留全部记录，
+        中途崩溃时已写入的批次保留在文件中
+
+        Args:
+            records: 记录列表
+            name: 文件名前缀
+            kind: 记录类型 videos/channels
+
+        Returns:
+            记录文件路径
+        """
+        filepath = self.records_path(name, kind)
+        if not records:
+            return filepath
+        with open(filepath, 'a', encoding=OUTPUT_CONFIG["json_encoding"]) as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        return filepath
+
+    def iter_records(self, filepath: str):
+        """逐条读取 JSON Lines 记录文件"""
+        with open(filepath, 'r', encoding=OUTPUT_CONFIG["json_encoding"]) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def export_records(self, filepath: str, name: str, kind: str = "videos", formats: List[str] = None,
+                       chunk_size: int = 1000) -> Dict[str, str]:
+        """
+        把 JSON Lines 记录文件流式转换为 {name}_{kind}.csv/.json，内存占用只与 chunk_size 有关
+
+        第一遍读取全部字段名（保持首次出现的顺序），第二遍分块写出。
+
+        Args:
+            filepath: JSON Lines 记录文件
+            name: 输出文件名前缀
+            kind: 记录类型 videos/channels
+            formats: 输出格式，None则使用配置文件中的设置
+            chunk_size: 每次写出的记录数
+
+        Returns:
+            保存的文件路径字典
+        """
+        formats = OUTPUT_CONFIG["output_formats"] if formats is None else formats
+        if not os.path.exists(filepath):
+            return {}
+        columns = {}
+        for record in self.iter_records(filepath):
+            columns.update(dict.fromkeys(record))
+        if not columns:
+            return {}
+        columns = list(columns)
+
+        saved_files = {}
+        base = os.path.join(OUTPUT_DIR, f"{self._sanitize_filename(name)}_{kind}")
+        if "csv" in formats:
+            try:
+                import pandas as pd  # 延迟导入，避免仅加载服务时引入pandas
+                csv_path = f"{base}.csv"
+                # 同一个文件句柄分块写出，utf-8-sig 的BOM只写一次
+                with open(csv_path, 'w', encoding=OUTPUT_CONFIG["csv_encoding"], newline='') as f:
+                    chunk = []
+                    header = True
+                    for record in self.iter_records(filepath):
+                        chunk.append(record)
+                        if len(chunk) >= chunk_size:
+                            pd.DataFrame(chunk, columns=columns).to_csv(f, index=False, header=header)
+                            chunk, header = [], False
+                    if chunk or header:
+                        pd.DataFrame(chunk, columns=columns).to_csv(f, index=False, header=header)
+                saved_files["csv"] = csv_path
+                self.logger.info(f"已保存CSV文件: {csv_path}")
+            except Exception as e:
+                self.logger.error(f"保存CSV文件失败: {str(e)}")
+        if "json" in formats:
+            try:
+                json_path = f"{base}.json"
+                with open(json_path, 'w', encoding=OUTPUT_CONFIG["json_encoding"]) as f:
+                    f.write("[")
+                    for i, record in enumerate(self.iter_records(filepath)):
+                        f.write(",\n" if i else "\n")
+                        f.write(json.dumps(record, ensure_ascii=False, indent=2))
+                    f.write("\n]")
+                saved_files["json"] = json_path
+                self.logger.info(f"已保存JSON文件: {json_path}")
+            except Exception as e:
+                self.logger.error(f"保存JSON文件失败: {str(e)}")
+        return saved_files
+
     def _sanitize_filename(self, filename: str) -> str:
         """清理文件名，移除不安全的字符"""
         # 移除或替换不安全的字符
@@ -112,6 +279,7 @@ class DataService:
     def load_videos_from_csv(self, filepath: str) -> List[Dict]:
         """从CSV文件加载视频数据"""
         try:
+            import pandas as pd
             df = pd.read_csv(filepath, encoding=OUTPUT_CONFIG["csv_encoding"])
             return df.to_dict('records')
         except Exception as e:
@@ -167,40 +335,61 @@ class DataService:
                 description = description[:100] + "..."
             self.logger.info(f"   描述: {description}")
     
-    def get_statistics(self, videos: List[Dict]) -> Dict:
-        """获取视频统计信息"""
-        if not videos:
-            return {}
+    def filter_by_upload_time(self, videos: List[Dict], since: int = None, until: int = None) -> List[Dict]:
+        """
+        按上传时间戳筛选视频（整数比较）
         
-        stats = {
-            "total_videos": len(videos),
-            "channels": {},
-            "view_count_stats": {},
-            "date_stats": {}
-        }
+        缺少 upload_timestamp 的旧数据以其 scrape_timestamp 为基准从 date 补算。
         
-        # 统计频道
+        Args:
+            videos: 视频数据列表
+            since: 起始时间戳（含），None表示不限
+            until: 结束时间戳（不含），None表示不限
+            
+        Returns:
+            上传时间在窗口内的视频列表（上传时间未知的视频被排除）
+        """
+        result = []
         for video in videos:
-            channel = video.get('channel', '未知频道')
-            stats["channels"][channel] = stats["channels"].get(channel, 0) + 1
+            upload_ts = video.get('upload_timestamp')
+            if upload_ts is None or upload_ts != upload_ts:  # None或NaN
+                upload_ts = resolve_upload_timestamp(video.get('date'), video.get('scrape_timestamp'))
+                if upload_ts is None:
+                    continue
+            if since is not None and upload_ts < since:
+                continue
+            if until is not None and upload_ts >= until:
+                continue
+            result.append(video)
+        return result
+    
+    def get_statistics(self, videos) -> Dict:
+        """
+        获取视频统计信息（列式计算，见 StatsService.compute）
         
-        # 统计观看次数
-        view_counts = []
-        for video in videos:
-            view_count = video.get('view_count', '未知')
-            if view_count != '未知':
-                try:
-                    # 移除逗号并转换为数字
-                    view_count_num = int(view_count.replace(',', ''))
-                    view_counts.append(view_count_num)
-                except:
-                    pass
-        
-        if view_counts:
-            stats["view_count_stats"] = {
-                "min": min(view_counts),
-                "max": max(view_counts),
-                "avg": sum(view_counts) / len(view_counts)
-            }
-        
-        return stats 
\ No newline at end of file
+        Args:
+            videos: 视频记录列表或 load_history 返回的DataFrame
+            
+        Returns:
+            {total_videos, channels, view_count_stats, date_stats: {older_24h, within_24h}, per_channel}
+        """
+        if videos is None or len(videos) == 0:
+            return {}
+        
+        stats = self.stats_service.compute(videos)
+        if not stats:
+            return {}
+        stats["date_stats"] = {
+            "older_24h": stats.pop("older_24h"),
+            "within_24h": stats.pop("within_24h"),
+        }
+        return stats
+    
+    def load_history(self, pattern: str = "*_videos.*"):
+        """
+        加载输出目录中的历史数据为DataFrame（只读取统计需要的列），可直接传给 get_statistics
+        
+        Args:
+            pattern: 文件名通配符
+        """
+        return self.stats_service.load_history(pattern)
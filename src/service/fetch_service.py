@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+页面获取层 - 所有页面导航统一经过 fetch_page：全局退避、按主机令牌桶限速、driver.get、
+页面计数、加载等待和拦截页识别
+"""
+
+import time
+import logging
+
+from ..config.settings import SCRAPER_CONFIG
+from ..utils.errors import BlockedError
+from ..utils.interstitials import check_interstitial
+from ..utils.rate_limiter import get_rate_limiter, get_shared_backoff
+from .metrics_service import get_metrics_service
+from .watchdog_service import guard
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_page(driver, url: str, page_type: str, settle_delay: float = None, browser_service=None) -> float:
+    """
+    限速后访问页面
+
+    处于全局退避期时先等待到截止时间；加载后识别到拦截页时升级全局退避并抛出 BlockedError，
+    正常页面使退避等级逐步回落。
+
+    Args:
+        driver: WebDriver实例
+        url: 页面URL
+        page_type: 页面类型（用于指标标签）watch/search/about/channel_videos
+        settle_delay: 加载后的固定等待（秒），None则使用 page_load_delay
+        browser_service: 驱动所属的浏览器服务，提供时导航和拦截页识别受看门狗 navigate 截止时间保护
+
+    Returns:
+        限速等待的秒数
+
+    Raises:
+        BlockedError: 页面为同意页/机器人验证/异常流量/429错误页
+        DriverHangError: 导航超过看门狗截止时间，驱动进程树已被结束
+    """
+    metrics = get_metrics_service()
+    backoff = get_shared_backoff()
+    if backoff is not None:
+        backoff_waited = backoff.wait()
+        if backoff_waited > 0:
+            metrics.observe("wait_seconds", backoff_waited, kind="block_backoff")
+
+    waited = 0.0
+    limiter = get_rate_limiter(url)
+    if limiter is not None:
+        waited = limiter.acquire()
+        if waited > 0:
+            logger.debug(f"限速等待 {waited:.2f} 秒: {url}")
+            metrics.observe("wait_seconds", waited, kind="rate_limit")
+
+    # 退避和限速等待不计入看门狗截止时间
+    with guard(browser_service, "navigate", url):
+        driver.get(url)
+        metrics.inc("pages_fetched_total", page_type=page_type)
+
+        delay = SCRAPER_CONFIG["page_load_delay"] if settle_delay is None else settle_delay
+        if delay > 0:
+            time.sleep(delay)
+            metrics.observe("wait_seconds", delay, kind="page_load_delay")
+
+        kind = check_interstitial(driver) if backoff is not None else None
+
+    if backoff is not None:
+        if kind is not None:
+            metrics.inc("interstitials_total", kind=kind, page_type=page_type)
+            backoff_seconds = backoff.on_block()
+            logger.warning(f"识别到拦截页 ({kind})，全局退避 {backoff_seconds:.0f} 秒: {url}")
+            raise BlockedError(kind, url, backoff_seconds)
+        backoff.on_success()
+    return waited
@@ -4,12 +4,68 @@
 """
 
 import os
+import copy
+import json
+import queue
+import atexit
 import logging
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 from ..config.settings import LOGGING_CONFIG, BASE_DIR
 
+# 进程内共享的日志队列监听器（只初始化一次）
+_listener = None
+_setup_lock = threading.Lock()
+
+# LogRecord自带属性，JSON格式化时不作为额外字段输出
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """结构化JSON日志格式化器，每条日志一行"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "process": record.process,
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # 经过日志队列的记录只保留格式化后的异常文本（见 _StructuredQueueHandler）
+            payload["exc_info"] = record.exc_text
+        # 通过 extra= 传入的字段
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and key not in payload:
+                payload[key] = value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """
+    入队前只合并消息参数，异常堆栈保存在 exc_text 中单独传递
+
+    标准 QueueHandler.prepare 会把堆栈格式化进 msg 并清空 exc_info，JSON日志就只能把堆栈混在 message 里。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None  # 不跨线程持有堆栈帧
+        return record
+
 
 class LoggingService:
     """日志服务类 - 处理日志配置和管理"""
@@ -17,33 +73,61 @@ class LoggingService:
     def __init__(self):
         self._setup_logging()
     
+    def _create_formatter(self) -> logging.Formatter:
+        """根据配置创建格式化器"""
+        if LOGGING_CONFIG.get("formatter") == "json":
+            return JsonFormatter()
+        return logging.Formatter(LOGGING_CONFIG["format"])
+    
     def _setup_logging(self):
-        """设置日志配置"""
-        # 创建日志目录
-        log_dir = os.path.join(BASE_DIR, "logs")
-        os.makedirs(log_dir, exist_ok=True)
+        """
+        设置日志配置
         
-        # 配置根日志记录器
-        logging.basicConfig(
-            level=getattr(logging, LOGGING_CONFIG["level"]),
-            format=LOGGING_CONFIG["format"],
-            handlers=[
+        根日志记录器只挂一个QueueHandler，业务线程写日志只是入队；
+        控制台和文件I/O由后台QueueListener线程完成，不阻塞爬虫工作线程。
+        """
+        global _listener
+        with _setup_lock:
+            if _listener is not None:
+                return
+            
+            # 创建日志目录
+            log_dir = os.path.join(BASE_DIR, "logs")
+            os.makedirs(log_dir, exist_ok=True)
+            
+            formatter = self._create_formatter()
+            handlers = [
                 # 控制台处理器
                 logging.StreamHandler(),
                 # 文件处理器
                 RotatingFileHandler(
                     LOGGING_CONFIG["file"],
-                    maxBytes=10*1024*1024,  # 10MB
-                    backupCount=5,
+                    maxBytes=LOGGING_CONFIG["max_bytes"],
+                    backupCount=LOGGING_CONFIG["backup_count"],
                     encoding='utf-8'
                 )
             ]
-        )
-        
-        # 设置第三方库的日志级别
-        logging.getLogger("selenium").setLevel(logging.WARNING)
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
-        logging.getLogger("webdriver_manager").setLevel(logging.WARNING)
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            
+            log_queue = queue.Queue(LOGGING_CONFIG["queue_size"])
+            root_logger = logging.getLogger()
+            root_logger.setLevel(getattr(logging, LOGGING_CONFIG["level"]))
+            root_logger.addHandler(_StructuredQueueHandler(log_queue))
+            
+            _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            _listener.start()
+            atexit.register(_listener.stop)
+            
+            # 按模块设置日志级别（包括第三方库）
+            for name, level in LOGGING_CONFIG["module_levels"].items():
+                logging.getLogger(name).setLevel(getattr(logging, level))
+    
+    def flush(self):
+        """等待队列中的日志全部写出（重启监听器）"""
+        if _listener is not None:
+            _listener.stop()
+            _listener.start()
     
     def get_logger(self, name: str) -> logging.Logger:
         """获取指定名称的日志记录器"""
@@ -97,4 +181,4 @@ class LoggingService:
     def log_debug(self, message: str):
         """记录调试日志"""
         logger = self.get_logger(__name__)
-        logger.debug(message) 
\ No newline at end of file
+        logger.debug(message) 
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+指标服务层 - 提供Prometheus兼容的计数器/直方图、/metrics HTTP端点和textfile导出
+"""
+
+import os
+import bisect
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from ..config.settings import METRICS_CONFIG
+
+
+def _format_labels(labelnames: Tuple[str, ...], labelvalues: Tuple[str, ...], extra: str = "") -> str:
+    """格式化标签为Prometheus文本格式"""
+    pairs = []
+    for name, value in zip(labelnames, labelvalues):
+        value = str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """格式化数值，整数不带小数点"""
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """单调递增计数器（支持标签）"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        """增加计数"""
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """读取当前计数"""
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def total(self) -> float:
+        """所有标签组合的计数总和"""
+        with self._lock:
+            return sum(self._values.values())
+
+    def render(self) -> List[str]:
+        """渲染为Prometheus文本行"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), 0)]
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """累积分桶直方图（支持标签）"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Optional[List[float]] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = sorted(buckets or METRICS_CONFIG["default_buckets"])
+        # 每个标签组合: [各桶计数(非累积)..., +Inf桶计数, sum]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """记录一个观测值"""
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            slots = self._values.get(key)
+            if slots is None:
+                slots = [0] * (len(self.buckets) + 2)
+                self._values[key] = slots
+            slots[index] += 1
+            slots[-1] += value
+
+    def count(self, **labels) -> int:
+        """某标签组合的观测次数"""
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            slots = self._values.get(key)
+            return int(sum(slots[:-1])) if slots else 0
+
+    def render(self) -> List[str]:
+        """渲染为Prometheus文本行"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        for key, slots in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, slots):
+                cumulative += bucket_count
+                le = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {int(cumulative)}")
+            cumulative += slots[len(self.buckets)]
+            le = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {int(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(slots[-1])}")
+            lines.append(f"{self.name}_count{labels} {int(cumulative)}")
+        return lines
+
+
+class MetricsService:
+    """指标服务类 - 管理指标注册表并负责导出"""
+
+    def __init__(self, namespace: str = None):
+        self.logger = logging.getLogger(__name__)
+        self.namespace = namespace or METRICS_CONFIG["namespace"]
+        self.enabled = METRICS_CONFIG["enabled"]
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self._http_server = None
+        self._register_default_metrics()
+
+    def _register_default_metrics(self):
+        """注册爬虫默认指标"""
+        self.counter("pages_fetched_total", "已访问的页面数量", ("page_type",))
+        self.counter("videos_extracted_total", "成功提取的视频数量")
+        self.counter("listing_records_total", "仅列表模式下直接由卡片构建的视频记录数量")
+        self.counter("extraction_failures_total", "字段提取失败次数", ("field",))
+        self.counter("retries_total", "视频处理重试次数")
+        self.counter("driver_restarts_total", "浏览器驱动重建次数")
+        self.counter("channel_subscriber_fallback_total", "关于页缺少订阅数、回退到频道页提取的次数")
+        self.counter("blocked_requests_total", "被拦截的资源请求数量", ("resource_type",))
+        self.counter("blocked_bytes_total", "拦截资源节省的字节数(估算)", ("resource_type",))
+        self.counter("interstitials_total", "识别到的拦截页数量（同意页/机器人验证/异常流量/429）", ("kind", "page_type"))
+        self.counter("video_failures_total", "按错误类别统计的最终失败视频数量", ("category",))
+        self.counter("negative_cache_hits_total", "因在负缓存中而跳过的视频数量", ("category",))
+        self.counter("watchdog_kills_total", "驱动操作超过截止时间、被看门狗结束进程树的次数", ("operation",))
+        self.counter("driver_recycles_total", "因内存超过阈值或定期回收而重建驱动的次数", ("reason",))
+        self.histogram("wait_seconds", "固定等待/显式等待耗时(秒)", ("kind",))
+        self.histogram("video_seconds", "单个视频处理耗时(秒)")
+        self.histogram("browser_memory_mb", "浏览器内存采样(MB)：进程树RSS/JS堆已用大小", ("kind",),
+                       buckets=[64, 128, 256, 512, 1024, 1536, 2048, 3072, 4096])
+
+    def _full_name(self, name: str) -> str:
+        return f"{self.namespace}_{name}" if self.namespace else name
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        """获取或注册计数器"""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Counter(self._full_name(name), documentation, labelnames)
+                self._metrics[name] = metric
+            return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Optional[List[float]] = None) -> Histogram:
+        """获取或注册直方图"""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Histogram(self._full_name(name), documentation, labelnames, buckets)
+                self._metrics[name] = metric
+            return metric
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        """计数器加一（未启用或未注册时忽略）"""
+        if not self.enabled:
+            return
+        metric = self._metrics.get(name)
+        if metric is not None:
+            metric.inc(amount, **labels)
+
+    def observe(self, name: str, value: float, **labels):
+        """直方图记录观测值（未启用或未注册时忽略）"""
+        if not self.enabled:
+            return
+        metric = self._metrics.get(name)
+        if metric is not None:
+            metric.observe(value, **labels)
+
+    def get(self, name: str):
+        """按短名称获取指标对象"""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """以Prometheus文本格式导出全部指标"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str = None) -> Optional[str]:
+        """
+        写入node-exporter textfile格式文件（先写临时文件再原子替换）
+
+        Args:
+            path: 输出路径，None则使用配置文件中的设置
+
+        Returns:
+            写入的文件路径，未配置时返回None
+        """
+        path = path or METRICS_CONFIG["textfile_path"]
+        if not path or not self.enabled:
+            return None
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+            return path
+        except Exception as e:
+            self.logger.warning(f"写入指标文件失败: {str(e)}")
+            return None
+
+    def start_http_server(self, port: int = None, addr: str = None) -> bool:
+        """
+        在后台线程启动/metrics HTTP端点
+
+        Args:
+            port: 监听端口，None则使用配置文件中的设置
+            addr: 监听地址，None则使用配置文件中的设置
+
+        Returns:
+            是否已在运行
+        """
+        if self._http_server is not None:
+            return True
+        port = port if port is not None else METRICS_CONFIG["http_port"]
+        addr = addr or METRICS_CONFIG["http_addr"]
+        if port is None or not self.enabled:
+            return False
+
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        service = self
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = service.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                return
+
+        try:
+            self._http_server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+        except OSError as e:
+            self.logger.warning(f"启动指标HTTP端点失败: {str(e)}")
+            return False
+        thread = threading.Thread(target=self._http_server.serve_forever, name="metrics-http", daemon=True)
+        thread.start()
+        self.logger.info(f"指标端点已启动: http://{addr}:{self._http_server.server_port}/metrics")
+        return True
+
+    def stop_http_server(self):
+        """停止/metrics HTTP端点"""
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+    def start_exporters(self):
+        """按配置启动导出器"""
+        self.start_http_server()
+
+    def flush(self):
+        """按配置刷新textfile导出"""
+        self.write_textfile()
+
+
+_default_metrics_service = None
+_default_lock = threading.Lock()
+
+
+def get_metrics_service() -> MetricsService:
+    """获取进程内共享的指标服务实例"""
+    global _default_metrics_service
+    if _default_metrics_service is None:
+        with _default_lock:
+            if _default_metrics_service is None:
+                _default_metrics_service = MetricsService()
+    return _default_metrics_service
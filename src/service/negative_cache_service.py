@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+负缓存服务层 - 记录永久不可用的视频ID（已删除/私享/年龄限制），后续运行直接跳过，不再消耗重试次数
+
+条目在 ttl_days 后过期，过期的视频会被重新尝试一次（私享视频可能重新公开）。
+
+用法:
+    python -m src.service.negative_cache_service                 # 显示条目数量并清理过期条目
+    python -m src.service.negative_cache_service --remove VIDEO_ID
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, Optional
+
+from ..config.settings import NEGATIVE_CACHE_CONFIG
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS unavailable_videos (
+    video_id TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    reason TEXT,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+"""
+
+
+class NegativeCacheService:
+    """负缓存服务类 - 永久不可用视频ID的持久化集合"""
+
+    def __init__(self, db_path: str = None, ttl_days: float = None):
+        """
+        初始化负缓存
+
+        Args:
+            db_path: SQLite数据库路径，None则使用配置文件中的设置
+            ttl_days: 条目有效期（天），None则使用配置文件中的设置
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path or NEGATIVE_CACHE_CONFIG["db_path"]
+        ttl_days = ttl_days if ttl_days is not None else NEGATIVE_CACHE_CONFIG["ttl_days"]
+        self.ttl_seconds = int(ttl_days * 86400)
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get(self, video_id: str) -> Optional[Dict]:
+        """
+        查询视频是否在负缓存中（命中时累加命中次数）
+
+        Returns:
+            {video_id, category, reason, first_seen, last_seen, hits}，未命中或已过期返回None
+        """
+        cutoff = int(time.time()) - self.ttl_seconds
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT video_id, category, reason, first_seen, last_seen, hits FROM unavailable_videos "
+                "WHERE video_id = ? AND last_seen >= ?",
+                (video_id, cutoff),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE unavailable_videos SET hits = hits + 1 WHERE video_id = ?", (video_id,))
+        return dict(zip(("video_id", "category", "reason", "first_seen", "last_seen", "hits"), row))
+
+    def add(self, video_id: str, category: str, reason: str = None):
+        """写入（或刷新）一个不可用视频"""
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO unavailable_videos (video_id, category, reason, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(video_id) DO UPDATE SET "
+                "category = excluded.category, reason = excluded.reason, last_seen = excluded.last_seen",
+                (video_id, category, reason, now, now),
+            )
+        self.logger.info(f"负缓存写入 {video_id} ({category}): {reason}")
+
+    def remove(self, video_id: str) -> bool:
+        """移除一个视频，返回是否存在"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM unavailable_videos WHERE video_id = ?", (video_id,))
+        return cursor.rowcount > 0
+
+    def prune(self) -> int:
+        """删除过期条目，返回删除数量"""
+        cutoff = int(time.time()) - self.ttl_seconds
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM unavailable_videos WHERE last_seen < ?", (cutoff,))
+        return cursor.rowcount
+
+    def count(self) -> Dict[str, int]:
+        """按类别统计条目数量"""
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT category, COUNT(*) FROM unavailable_videos GROUP BY category"
+            ).fetchall())
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_negative_cache() -> Optional[NegativeCacheService]:
+    """获取进程内共享的负缓存，未启用时返回None"""
+    global _default_cache
+    if not NEGATIVE_CACHE_CONFIG["enabled"]:
+        return None
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = NegativeCacheService()
+    return _default_cache
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="负缓存：永久不可用的视频ID")
+    parser.add_argument("--remove", metavar="VIDEO_ID", help="移除指定视频，下次运行重新尝试")
+    args = parser.parse_args()
+
+    with NegativeCacheService() as cache:
+        if args.remove:
+            print(f"{args.remove}: {'已移除' if cache.remove(args.remove) else '不在负缓存中'}")
+        print(f"清理过期条目: {cache.prune()}")
+        for category, count in sorted(cache.count().items()):
+            print(f"  {category}: {count}")
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+页面归档服务层 - 把抓取到的观看页、频道页、关于页源码压缩后按内容哈希存储，
+以 (URL, 抓取时间) 建立SQLite索引，超过容量上限时按抓取时间淘汰最旧的页面。
+
+解析器修复后可以对归档重新解析（python -m src.archive_main reparse），无需重新抓取。
+"""
+
+import os
+import zlib
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Iterator, Optional
+
+from ..config.settings import ARCHIVE_CONFIG
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL,
+    page_type TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (url, fetched_at)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS blobs (
+    content_hash TEXT PRIMARY KEY,
+    stored_size INTEGER NOT NULL,
+    raw_size INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_pages_fetched ON pages (fetched_at);
+CREATE INDEX IF NOT EXISTS idx_pages_hash ON pages (content_hash);
+"""
+
+
+def blob_path(archive_dir: str, content_hash: str) -> str:
+    """内容文件路径：objects/<哈希前2位>/<其余部分>.z"""
+    return os.path.join(archive_dir, "objects", content_hash[:2], f"{content_hash[2:]}.z")
+
+
+def read_blob(archive_dir: str, content_hash: str) -> Optional[str]:
+    """读取并解压内容文件（不经过索引，可在子进程中调用），不存在时返回None"""
+    try:
+        with open(blob_path(archive_dir, content_hash), "rb") as f:
+            return zlib.decompress(f.read()).decode("utf-8")
+    except FileNotFoundError:
+        return None
+
+
+class PageArchiveService:
+    """页面归档服务类 - 内容寻址的压缩页面存储"""
+
+    def __init__(self, archive_dir: str = None, max_bytes: int = None):
+        """
+        初始化页面归档
+
+        Args:
+            archive_dir: 归档目录，None则使用配置文件中的设置
+            max_bytes: 压缩后总容量上限（字节），None则使用配置文件中的设置
+        """
+        self.logger = logging.getLogger(__name__)
+        self.archive_dir = archive_dir or ARCHIVE_CONFIG["dir"]
+        self.max_bytes = max_bytes if max_bytes is not None else ARCHIVE_CONFIG["max_bytes"]
+        self.objects_dir = os.path.join(self.archive_dir, "objects")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(self.archive_dir, "index.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()[0]
+
+    def close(self):
+        """关闭索引数据库"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _blob_path(self, content_hash: str) -> str:
+        return blob_path(self.archive_dir, content_hash)
+
+    def store(self, url: str, page_type: str, html: str, fetched_at: Optional[int] = None) -> str:
+        """
+        归档一个页面（相同内容只保存一份）
+
+        Args:
+            url: 页面URL
+            page_type: 页面类型 watch/about/channel_videos/search
+            html: 页面源码
+            fetched_at: 抓取时间戳，None表示当前时间
+
+        Returns:
+            内容哈希
+        """
+        data = html.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        fetched_at = int(fetched_at if fetched_at is not None else time.time())
+        blob_path = self._blob_path(content_hash)
+
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM blobs WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+            if not exists:
+                compressed = zlib.compress(data, ARCHIVE_CONFIG["compression_level"])
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                tmp_path = f"{blob_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(compressed)
+                os.replace(tmp_path, blob_path)
+            with self._conn:
+                if not exists:
+                    self._conn.execute(
+                        "INSERT INTO blobs (content_hash, stored_size, raw_size) VALUES (?, ?, ?)",
+                        (content_hash, len(compressed), len(data)),
+                    )
+                    self._total_bytes += len(compressed)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pages (url, fetched_at, page_type, content_hash) VALUES (?, ?, ?, ?)",
+                    (url, fetched_at, page_type, content_hash),
+                )
+
+        if self.max_bytes and self._total_bytes > self.max_bytes:
+            self.evict()
+        return content_hash
+
+    def load(self, content_hash: str) -> Optional[str]:
+        """按内容哈希读取页面源码，不存在时返回None"""
+        return read_blob(self.archive_dir, content_hash)
+
+    def latest(self, url: str) -> Optional[str]:
+        """读取某个URL最近一次归档的页面源码"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash FROM pages WHERE url = ? ORDER BY fetched_at DESC LIMIT 1", (url,)
+            ).fetchone()
+        return self.load(row[0]) if row else None
+
+    def iter_pages(self, page_type: Optional[str] = None, since: Optional[int] = None) -> Iterator[Dict]:
+        """
+        按抓取时间顺序遍历归档索引（不读取页面内容）
+
+        Args:
+            page_type: 只遍历指定页面类型
+            since: 只遍历该时间戳之后抓取的页面
+
+        Yields:
+            {url, fetched_at, page_type, content_hash}
+        """
+        sql = "SELECT url, fetched_at, page_type, content_hash FROM pages WHERE fetched_at >= ?"
+        params = [since or 0]
+        if page_type:
+            sql += " AND page_type = ?"
+            params.append(page_type)
+        sql += " ORDER BY fetched_at"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        for url, fetched_at, row_type, content_hash in rows:
+            yield {"url": url, "fetched_at": fetched_at, "page_type": row_type, "content_hash": content_hash}
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        按抓取时间淘汰最旧的页面，直到压缩后总容量不超过上限的90%
+
+        Args:
+            max_bytes: 容量上限，None则使用实例设置
+
+        Returns:
+            删除的内容文件数量
+        """
+        max_bytes = max_bytes if max_bytes is not None else self.max_bytes
+        target = int(max_bytes * 0.9)
+        removed = 0
+        with self._lock:
+            while self._total_bytes > target:
+                oldest = self._conn.execute(
+                    "SELECT url, fetched_at, content_hash FROM pages ORDER BY fetched_at LIMIT 500"
+                ).fetchall()
+                if not oldest:
+                    break
+                with self._conn:
+                    for url, fetched_at, content_hash in oldest:
+                        self._conn.execute("DELETE FROM pages WHERE url = ? AND fetched_at = ?", (url, fetched_at))
+                        if self._conn.execute(
+                            "SELECT 1 FROM pages WHERE content_hash = ? LIMIT 1", (content_hash,)
+                        ).fetchone():
+                            continue
+                        row = self._conn.execute(
+                            "SELECT stored_size FROM blobs WHERE content_hash = ?", (content_hash,)
+                        ).fetchone()
+                        self._conn.execute("DELETE FROM blobs WHERE content_hash = ?", (content_hash,))
+                        try:
+                            os.remove(self._blob_path(content_hash))
+                        except FileNotFoundError:
+                            pass
+                        if row:
+                            self._total_bytes -= row[0]
+                            removed += 1
+                        if self._total_bytes <= target:
+                            break
+        if removed:
+            self.logger.info(f"页面归档淘汰 {removed} 个内容文件，当前 {self._total_bytes / 1024 / 1024:.1f} MB")
+        return removed
+
+    def stats(self) -> Dict:
+        """归档统计：页面数、内容文件数、原始/压缩体积、按页面类型计数"""
+        with self._lock:
+            pages = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            blobs, stored, raw = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(stored_size), 0), COALESCE(SUM(raw_size), 0) FROM blobs"
+            ).fetchone()
+            by_type = dict(self._conn.execute("SELECT page_type, COUNT(*) FROM pages GROUP BY page_type").fetchall())
+        return {
+            "pages": pages,
+            "blobs": blobs,
+            "stored_bytes": stored,
+            "raw_bytes": raw,
+            "compression_ratio": round(raw / stored, 2) if stored else 0.0,
+            "by_page_type": by_type,
+        }
+
+
+_default_archive = None
+_default_lock = threading.Lock()
+
+
+def get_page_archive() -> Optional[PageArchiveService]:
+    """获取进程内共享的页面归档，未启用时返回None"""
+    global _default_archive
+    if not ARCHIVE_CONFIG["enabled"]:
+        return None
+    if _default_archive is None:
+        with _default_lock:
+            if _default_archive is None:
+                _default_archive = PageArchiveService()
+    return _default_archive
+
+
+def archive_page(driver, url: str, page_type: str):
+    """归档浏览器当前页面源码（未启用归档时不读取page_source），失败只记录日志"""
+    archive = get_page_archive()
+    if archive is None:
+        return
+    try:
+        archive.store(url, page_type, driver.page_source)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"归档页面失败 {url}: {str(e)}")
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+并行重新解析服务层 - 把归档页面分片交给进程池重新解析，结果逐片写入DataService
+
+主进程只读取归档索引并分发 (页面类型, URL, 抓取时间, 内容哈希)；子进程自己读取并解压
+内容文件，避免在进程间传输MB级的页面源码；同时在途的分片数有上限，页面源码的内存占用与归档大小无关。
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Tuple
+
+from ..config.settings import ARCHIVE_CONFIG, SNAPSHOT_CONFIG
+from ..utils.page_reparser import CHANNEL_PAGE_TYPES, reparse_page
+from .data_service import DataService
+from .page_archive_service import PageArchiveService, read_blob
+
+
+def _reparse_shard(archive_dir: str,
+                   shard: List[Tuple[str, str, int, str]]) -> Tuple[int, int, List[Dict], List[Dict]]:
+    """
+    子进程任务：重新解析一个分片，单个页面失败（内容文件损坏、解析异常）只跳过该页面
+
+    Args:
+        archive_dir: 归档目录
+        shard: [(页面类型, URL, 抓取时间, 内容哈希), ...]
+
+    Returns:
+        (页面数, 失败页面数, 视频记录, 频道记录)
+    """
+    videos, channels = [], []
+    failed = 0
+    for page_type, url, fetched_at, content_hash in shard:
+        try:
+            records = reparse_page(page_type, url, fetched_at, read_blob(archive_dir, content_hash))
+        except Exception as e:
+            failed += 1
+            logging.getLogger(__name__).warning(f"重新解析页面失败 {page_type} {url} ({content_hash}): {str(e)}")
+            continue
+        (channels if page_type in CHANNEL_PAGE_TYPES else videos).extend(records)
+    return len(shard), failed, videos, channels
+
+
+class ReparseService:
+    """并行重新解析服务类"""
+
+    def __init__(self, archive: Optional[PageArchiveService] = None, data_service: Optional[DataService] = None):
+        """
+        初始化并行重新解析服务
+
+        Args:
+            archive: 页面归档，None则打开配置中的归档目录
+            data_service: 数据服务，None则新建
+        """
+        self.logger = logging.getLogger(__name__)
+        self.archive = archive or PageArchiveService()
+        self.data_service = data_service or DataService()
+
+    def run(self, page_type: Optional[str] = None, since: Optional[int] = None,
+            workers: Optional[int] = None, chunk_size: Optional[int] = None,
+            output_name: str = "archive_reparse", progress_interval: float = 5.0) -> Dict:
+        """
+        并行重新解析归档页面并保存结果
+
+        每个分片完成后立即把视频/频道记录追加到 {output_name}_videos.jsonl / _channels.jsonl，
+        并写入观看次数快照；全部完成后从记录文件流式导出CSV/JSON，内存占用与归档大小无关。
+
+        Args:
+            page_type: 只解析指定页面类型
+            since: 只解析该时间戳之后抓取的页面
+            workers: 进程数，None则使用配置（默认CPU核数）
+            chunk_size: 每个分片的页面数，None则使用配置
+            output_name: 输出文件名前缀
+            progress_interval: 进度日志间隔（秒）
+
+        Returns:
+            {pages, failed_pages, videos, channels, seconds, pages_per_sec, saved_files}
+        """
+        workers = workers or ARCHIVE_CONFIG["reparse_workers"] or os.cpu_count() or 1
+        chunk_size = chunk_size or ARCHIVE_CONFIG["reparse_chunk_size"]
+        max_in_flight = workers * 2
+
+        # 每个分片的记录完成后立即追加到 JSON Lines 文件，主进程不保留全部记录；先清空上次运行的文件
+        videos_path = self.data_service.records_path(output_name, "videos")
+        channels_path = self.data_service.records_path(output_name, "channels")
+        for path in (videos_path, channels_path):
+            if os.path.exists(path):
+                os.remove(path)
+        video_count = channel_count = 0
+        pages = failed_pages = 0
+        shard_sizes = {}
+        start = last_report = time.time()
+
+        def collect(future):
+            nonlocal pages, failed_pages, video_count, channel_count, last_report
+            shard_size = shard_sizes.pop(future)
+            try:
+                shard_pages, shard_failed, shard_videos, shard_channels = future.result()
+            except Exception as e:
+                # 整个分片失败（如子进程异常退出）：计为失败页面，继续处理其余分片
+                self.logger.error(f"重新解析分片失败（{shard_size} 个页面）: {str(e)}")
+                pages += shard_size
+                failed_pages += shard_size
+                return
+            pages += shard_pages
+            failed_pages += shard_failed
+            self.data_service.append_records(shard_videos, output_name, "videos")
+            self.data_service.append_records(shard_channels, output_name, "channels")
+            video_count += len(shard_videos)
+            channel_count += len(shard_channels)
+            self._record_snapshots(shard_videos)
+            now = time.time()
+            if now - last_report >= progress_interval:
+                last_report = now
+                self.logger.info(f"已重新解析 {pages} 个页面 ({pages / (now - start):.1f} 页/秒)")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            shard = []
+            for page in self.archive.iter_pages(page_type, since):
+                shard.append((page["page_type"], page["url"], page["fetched_at"], page["content_hash"]))
+                if len(shard) < chunk_size:
+                    continue
+                future = executor.submit(_reparse_shard, self.archive.archive_dir, shard)
+                shard_sizes[future] = len(shard)
+                pending.add(future)
+                shard = []
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+            if shard:
+                future = executor.submit(_reparse_shard, self.archive.archive_dir, shard)
+                shard_sizes[future] = len(shard)
+                pending.add(future)
+            for future in wait(pending).done:
+                collect(future)
+
+        seconds = time.time() - start
+        pages_per_sec = pages / seconds if seconds else 0.0
+        self.logger.info(
+            f"重新解析完成: {pages} 个页面（失败 {failed_pages} 个），{workers} 个进程，"
+            f"用时 {seconds:.1f} 秒 ({pages_per_sec:.1f} 页/秒)"
+        )
+
+        # 从记录文件流式导出CSV/JSON
+        saved_files = {}
+        if video_count:
+            saved_files = self.data_service.export_records(videos_path, output_name, "videos")
+            saved_files["jsonl"] = videos_path
+        if channel_count:
+            channel_files = self.data_service.export_records(channels_path, output_name, "channels", formats=["json"])
+            if channel_files:
+                saved_files["channels"] = channel_files["json"]
+        return {
+            "pages": pages,
+            "failed_pages": failed_pages,
+            "videos": video_count,
+            "channels": channel_count,
+            "seconds": seconds,
+            "pages_per_sec": pages_per_sec,
+            "saved_files": saved_files,
+        }
+
+    def _record_snapshots(self, videos: List[Dict]):
+        """逐片写入观看次数快照，失败只记录日志"""
+        if not videos or not SNAPSHOT_CONFIG["enabled"]:
+            return
+        try:
+            self.data_service.snapshot_service.record(videos)
+        except Exception as e:
+            self.logger.error(f"记录观看次数快照失败: {str(e)}")
+
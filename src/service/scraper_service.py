@@ -3,10 +3,18 @@
 YouTube爬虫服务类 - 使用服务层架构
 """
 
-from .browser_service import BrowserService
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .browser_service import BrowserService, BrowserPool
 from .youtube_service import YouTubeService
 from .data_service import DataService
 from .logging_service import LoggingService
+from ..config.settings import SCRAPER_CONFIG
+from ..utils.selector_registry import get_selector_registry
+from ..utils.text_parsers import canonicalize_video_url
+from ..utils.search_filters import SearchOptions
 
 
 class YouTubeScraperService:
@@ -43,7 +51,7 @@ class YouTubeScraperService:
         self.browser_service.create_driver(self.headless)
         
         # 创建YouTube服务
-        self.youtube_service = YouTubeService(self.browser_service.get_driver())
+        self.youtube_service = YouTubeService(self.browser_service.get_driver(), self.browser_service)
         
         self.logger.info("爬虫服务启动成功")
     
@@ -52,16 +60,21 @@ class YouTubeScraperService:
         if self.browser_service:
             self.browser_service.close_driver()
         
+        # 保存选择器命中率统计
+        get_selector_registry().save()
+        
         self.logging_service.log_shutdown()
         self.logger.info("爬虫服务已停止")
     
-    def search_videos(self, search_query: str, max_videos: int = None):
+    def search_videos(self, search_query: str, max_videos: int = None,
+                      options: Optional[SearchOptions] = None):
         """
         搜索YouTube视频
         
         Args:
             search_query: 搜索关键词
             max_videos: 最大视频数量
+            options: 搜索过滤选项
             
         Returns:
             视频信息列表
@@ -84,7 +97,7 @@ class YouTubeScraperService:
         
         try:
             # 执行搜索
-            videos = self.youtube_service.search_videos(search_query, max_videos)
+            videos = self.youtube_service.search_videos(search_query, max_videos, options)
             
             # 记录搜索完成
             self.logging_service.log_search_complete(len(videos))
@@ -95,6 +108,159 @@ class YouTubeScraperService:
             self.logging_service.log_error(e, "搜索视频时出错")
             raise
     
+    def search_batch(self, queries: List[str], max_videos: int = None, pool_size: int = None,
+                     options: Optional[SearchOptions] = None) -> Tuple[List[Dict], Dict[str, List[str]]]:
+        """
+        批量搜索多个关键词，共享浏览器会话
+        
+        先用主驱动依次收集每个搜索词的结果链接，按视频ID跨搜索词去重，
+        再由驱动池并行打开去重后的视频页，每个视频只处理一次。
+        
+        Args:
+            queries: 搜索关键词列表
+            max_videos: 每个搜索词的最大视频数量
+            pool_size: 驱动池大小，None则使用配置文件中的设置
+            options: 搜索过滤选项（应用于每个搜索词）
+            
+        Returns:
+            (视频信息列表, {搜索词: [视频ID, ...]})
+        """
+        if not self.youtube_service:
+            raise RuntimeError("爬虫服务未启动，请先调用start()方法")
+        
+        queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+        if not queries:
+            raise ValueError("搜索关键词列表为空")
+        for query in queries:
+            is_valid, message = self.youtube_service.validate_search_query(query)
+            if not is_valid:
+                raise ValueError(f"搜索关键词无效 ({query}): {message}")
+        max_videos = max_videos or SCRAPER_CONFIG["max_videos"]
+        is_valid, message = self.youtube_service.validate_max_videos(max_videos)
+        if not is_valid:
+            raise ValueError(f"视频数量无效: {message}")
+        
+        # 1. 收集链接并按视频ID去重
+        query_map: Dict[str, List[str]] = {}
+        unique_links: Dict[str, str] = {}
+        for query in queries:
+            self.logging_service.log_search_start(query, max_videos)
+            try:
+                links = self.youtube_service.collect_search_links(query, max_videos, options)
+            except Exception as e:
+                self.logging_service.log_error(e, f"收集搜索结果时出错: {query}")
+                links = []
+            video_ids = []
+            for link in links:
+                url, video_id = canonicalize_video_url(link)
+                if not video_id or video_id in video_ids:
+                    continue
+                video_ids.append(video_id)
+                unique_links.setdefault(video_id, url)
+            query_map[query] = video_ids
+        
+        total_links = sum(len(ids) for ids in query_map.values())
+        self.logger.info(f"{len(queries)} 个搜索词共 {total_links} 个结果，去重后 {len(unique_links)} 个视频")
+        
+        # 2. 并行处理去重后的视频
+        videos_by_id = self._process_unique_videos(unique_links, pool_size)
+        
+        # 3. 为每个视频记录命中的搜索词
+        queries_by_id: Dict[str, List[str]] = {}
+        for query, video_ids in query_map.items():
+            for video_id in video_ids:
+                queries_by_id.setdefault(video_id, []).append(query)
+        videos = []
+        for video_id, video_info in videos_by_id.items():
+            video_info["video_id"] = video_id
+            video_info["queries"] = queries_by_id.get(video_id, [])
+            videos.append(video_info)
+        
+        self.logging_service.log_search_complete(len(videos))
+        return videos, query_map
+    
+    def _process_unique_videos(self, unique_links: Dict[str, str], pool_size: int = None) -> Dict[str, Dict]:
+        """
+        用驱动池处理视频，返回 {视频ID: 视频信息}（保持收集顺序）
+        
+        Args:
+            unique_links: {视频ID: 视频URL}
+            pool_size: 驱动池大小
+        """
+        pool_size = pool_size or SCRAPER_CONFIG["driver_pool_size"]
+        pool_size = max(1, min(pool_size, len(unique_links)))
+        items = list(unique_links.items())
+        results: Dict[str, Dict] = {}
+        
+        if pool_size <= 1:
+            for index, (video_id, url) in enumerate(items, 1):
+                video_info = self.youtube_service._process_single_video(url, index)
+                if self.browser_service.govern_memory():
+                    self.youtube_service.driver = self.browser_service.driver
+                if video_info:
+                    results[video_id] = video_info
+            return results
+        
+        start_time = time.monotonic()
+        with BrowserPool(pool_size, self.headless, existing=self.browser_service) as pool:
+            # 池中复用的主驱动沿用 self.youtube_service，驱动重建/回收后两处看到的是同一实例
+            youtube_services = {
+                id(browser_service): (self.youtube_service if browser_service is self.browser_service
+                                      else YouTubeService(browser_service.get_driver(), browser_service))
+                for browser_service in pool.browser_services
+            }
+            
+            def worker(index: int, url: str):
+                with pool.browser() as browser_service:
+                    youtube_service = youtube_services[id(browser_service)]
+                    video_info = youtube_service._process_single_video(url, index)
+                    # 每个驱动独立治理内存，回收后换上该驱动的新实例
+                    if browser_service.govern_memory():
+                        youtube_service.driver = browser_service.driver
+                    return video_info
+            
+            with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="video-worker") as executor:
+                futures = [(video_id, executor.submit(worker, index, url))
+                           for index, (video_id, url) in enumerate(items, 1)]
+                for video_id, future in futures:
+                    try:
+                        video_info = future.result()
+                    except Exception as e:
+                        self.logging_service.log_error(e, f"处理视频时出错: {video_id}")
+                        continue
+                    if video_info:
+                        results[video_id] = video_info
+        
+        self.logger.info(f"驱动池({pool_size})处理 {len(items)} 个视频，耗时 {time.monotonic() - start_time:.1f} 秒")
+        return results
+    
+    def run_batch(self, queries: List[str], max_videos: int = None, pool_size: int = None,
+                  output_name: str = "batch_search", options: Optional[SearchOptions] = None) -> Dict[str, str]:
+        """
+        运行批量搜索并保存合并结果和搜索词映射
+        
+        Args:
+            queries: 搜索关键词列表
+            max_videos: 每个搜索词的最大视频数量
+            pool_size: 驱动池大小
+            output_name: 输出文件名前缀
+            options: 搜索过滤选项
+            
+        Returns:
+            保存的文件路径字典（包含 query_map）
+        """
+        try:
+            videos, query_map = self.search_batch(queries, max_videos, pool_size, options)
+            saved_files = self.save_results(videos, output_name)
+            query_map_path = self.data_service.save_query_map(query_map, output_name)
+            if query_map_path:
+                saved_files["query_map"] = query_map_path
+            return saved_files
+            
+        except Exception as e:
+            self.logging_service.log_error(e, "运行批量搜索时出错")
+            raise
+    
     def save_results(self, videos, search_query: str):
         """
         保存搜索结果
@@ -124,20 +290,21 @@ class YouTubeScraperService:
             self.logging_service.log_error(e, "保存结果时出错")
             raise
     
-    def run(self, search_query: str, max_videos: int = None):
+    def run(self, search_query: str, max_videos: int = None, options: Optional[SearchOptions] = None):
         """
         运行完整的爬虫流程
         
         Args:
             search_query: 搜索关键词
             max_videos: 最大视频数量
+            options: 搜索过滤选项
             
         Returns:
             保存的文件路径字典
         """
         try:
             # 搜索视频
-            videos = self.search_videos(search_query, max_videos)
+            videos = self.search_videos(search_query, max_videos, options)
             
             # 保存结果
             saved_files = self.save_results(videos, search_query)
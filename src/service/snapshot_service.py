@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+快照服务层 - 把每次抓取的观看次数/订阅数按 (video_id, scrape_time) 追加到SQLite，
+并计算每小时观看增速和各频道增长最快的视频
+
+用法:
+    python -m src.service.snapshot_service                 # 打印各频道增速前10的视频
+    python -m src.service.snapshot_service --hours 48 --limit 5
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from ..config.settings import SNAPSHOT_CONFIG
+from ..utils.text_parsers import extract_video_id, parse_count, timestamp_from_iso
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    channel TEXT,
+    title TEXT
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS view_snapshots (
+    video_id TEXT NOT NULL,
+    scrape_time INTEGER NOT NULL,
+    view_count INTEGER,
+    subscribers INTEGER,
+    PRIMARY KEY (video_id, scrape_time)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos (channel);
+"""
+
+# 每个视频最新一次快照与上一次快照之间的增速
+_VELOCITY_SQL = """
+WITH ordered AS (
+    SELECT video_id, scrape_time, view_count,
+           LAG(scrape_time) OVER w AS prev_time,
+           LAG(view_count) OVER w AS prev_views,
+           ROW_NUMBER() OVER (PARTITION BY video_id ORDER BY scrape_time DESC) AS rn
+    FROM view_snapshots
+    WHERE view_count IS NOT NULL AND scrape_time >= ?
+    WINDOW w AS (PARTITION BY video_id ORDER BY scrape_time)
+)
+SELECT o.video_id, v.channel, v.title, o.scrape_time, o.view_count, o.prev_time, o.prev_views,
+       (o.view_count - o.prev_views) * 3600.0 / (o.scrape_time - o.prev_time) AS views_per_hour
+FROM ordered o
+LEFT JOIN videos v ON v.video_id = o.video_id
+WHERE o.rn = 1 AND o.prev_time IS NOT NULL AND o.scrape_time > o.prev_time
+"""
+
+_VELOCITY_COLUMNS = ("video_id", "channel", "title", "scrape_time", "view_count",
+                     "prev_time", "prev_views", "views_per_hour")
+
+
+class SnapshotService:
+    """快照服务类 - 观看次数时间序列存储"""
+
+    def __init__(self, db_path: str = None):
+        """
+        初始化快照服务
+
+        Args:
+            db_path: SQLite数据库路径，None则使用配置文件中的设置
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path or SNAPSHOT_CONFIG["db_path"]
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def record(self, videos: Iterable[Dict]) -> int:
+        """
+        追加一批视频的快照
+
+        video_id 缺失时从 url 提取；抓取时间取 scrape_timestamp，缺失时为当前时间；
+        观看次数和订阅数优先使用 view_count_num / subscribers_num。
+
+        Args:
+            videos: 视频记录
+
+        Returns:
+            写入的快照数量
+        """
+        now = int(time.time())
+        video_rows, snapshot_rows = {}, []
+        for video in videos:
+            video_id = video.get("video_id") or extract_video_id(video.get("url") or "")
+            if not video_id:
+                continue
+            scrape_time = timestamp_from_iso(video.get("scrape_timestamp")) or now
+            view_count = video.get("view_count_num")
+            if view_count is None:
+                view_count = parse_count(video.get("view_count"))
+            subscribers = video.get("subscribers_num")
+            if subscribers is None:
+                subscribers = parse_count(video.get("subscribers"))
+            video_rows[video_id] = (video_id, video.get("source_channel") or video.get("channel"), video.get("title"))
+            snapshot_rows.append((video_id, scrape_time, view_count, subscribers))
+
+        if not snapshot_rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO videos (video_id, channel, title) VALUES (?, ?, ?) "
+                "ON CONFLICT(video_id) DO UPDATE SET channel = COALESCE(excluded.channel, channel), "
+                "title = COALESCE(excluded.title, title)",
+                video_rows.values(),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO view_snapshots (video_id, scrape_time, view_count, subscribers) "
+                "VALUES (?, ?, ?, ?)",
+                snapshot_rows,
+            )
+        self.logger.info(f"已记录 {len(snapshot_rows)} 条观看次数快照")
+        return len(snapshot_rows)
+
+    def history(self, video_id: str) -> List[Dict]:
+        """某个视频的全部快照（按时间升序）"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT scrape_time, view_count, subscribers FROM view_snapshots "
+                "WHERE video_id = ? ORDER BY scrape_time",
+                (video_id,),
+            ).fetchall()
+        return [{"scrape_time": t, "view_count": v, "subscribers": s} for t, v, s in rows]
+
+    def velocity(self, since: Optional[int] = None, channel: Optional[str] = None) -> List[Dict]:
+        """
+        计算每个视频最新两次快照之间的每小时观看增速
+
+        Args:
+            since: 只使用该时间戳之后的快照，None表示全部
+            channel: 只返回指定频道
+
+        Returns:
+            [{video_id, channel, title, scrape_time, view_count, prev_time, prev_views, views_per_hour}, ...]
+            按增速降序
+        """
+        sql = _VELOCITY_SQL
+        params = [since or 0]
+        if channel is not None:
+            sql += " AND v.channel = ?"
+            params.append(channel)
+        sql += " ORDER BY views_per_hour DESC"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip(_VELOCITY_COLUMNS, row)) for row in rows]
+
+    def top_movers(self, limit: int = 10, since: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        各频道观看增速最快的视频
+
+        Args:
+            limit: 每个频道返回的数量
+            since: 只使用该时间戳之后的快照
+
+        Returns:
+            {频道: [增速记录, ...]}
+        """
+        sql = (
+            "SELECT * FROM (SELECT r.*, ROW_NUMBER() OVER (PARTITION BY channel ORDER BY views_per_hour DESC) AS rank "
+            f"FROM ({_VELOCITY_SQL}) r) WHERE rank <= ? ORDER BY channel, rank"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, (since or 0, limit)).fetchall()
+        movers: Dict[str, List[Dict]] = {}
+        for row in rows:
+            record = dict(zip(_VELOCITY_COLUMNS, row))
+            movers.setdefault(record["channel"] or "Unknown", []).append(record)
+        return movers
+
+    def prune(self, before: int) -> int:
+        """删除早于指定时间戳的快照，返回删除数量"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM view_snapshots WHERE scrape_time < ?", (before,))
+        return cursor.rowcount
+
+    def count(self) -> int:
+        """快照总数"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM view_snapshots").fetchone()[0]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="观看次数快照：各频道增速最快的视频")
+    parser.add_argument("--hours", type=float, default=None, help="只使用最近N小时的快照")
+    parser.add_argument("--limit", type=int, default=10, help="每个频道显示的数量")
+    args = parser.parse_args()
+
+    since = int(time.time() - args.hours * 3600) if args.hours else None
+    with SnapshotService() as service:
+        print(f"快照总数: {service.count()}")
+        for channel, movers in service.top_movers(args.limit, since).items():
+            print(f"[{channel}]")
+            for m in movers:
+                print(f"  {m['views_per_hour']:>12.1f} 次/小时  {m['view_count']:>12}  {m['video_id']}  {(m['title'] or '')[:40]}")
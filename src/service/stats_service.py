@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+统计服务层 - 基于pandas列式计算视频统计（频道计数、观看次数分布、分位数、24小时划分）
+"""
+
+import os
+import glob
+import time
+import logging
+from typing import Dict, List, Optional, Union
+
+from ..config.settings import OUTPUT_CONFIG, OUTPUT_DIR
+from ..utils.text_parsers import is_older_than, parse_count, resolve_upload_timestamp, timestamp_from_iso
+
+# 统计用到的列，加载历史数据时只读取这些列
+STATS_COLUMNS = [
+    "channel", "source_channel", "view_count", "view_count_num",
+    "is_older_than_24h", "upload_timestamp", "scrape_timestamp", "date", "video_id", "url",
+]
+
+# 观看次数分位数
+VIEW_COUNT_PERCENTILES = [0.5, 0.9, 0.95, 0.99]
+
+
+class StatsService:
+    """统计服务类 - 一次列式计算得到全部统计结果"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def to_frame(self, videos: Union[List[Dict], "pd.DataFrame"]) -> "pd.DataFrame":
+        """
+        把视频记录转换为统计用的DataFrame，并规范化数值列
+
+        - view_count_num 缺失时从 view_count 原始文本解析（parse_count按字符串缓存）
+        - is_older_than_24h 缺失时用 upload_timestamp 与 scrape_timestamp（缺失时为当前时间）计算；
+          没有 upload_timestamp 的旧数据与 DataService.filter_by_upload_time 一样以 scrape_timestamp 为基准从 date 补算，
+          上传时间仍未知时按老视频处理
+        """
+        import pandas as pd  # 延迟导入，避免仅加载服务时引入pandas
+
+        if isinstance(videos, pd.DataFrame):
+            df = videos.copy()
+        else:
+            df = pd.DataFrame.from_records(videos or [])
+        for column in STATS_COLUMNS:
+            if column not in df.columns:
+                df[column] = None
+
+        views = pd.to_numeric(df["view_count_num"], errors="coerce")
+        missing = views.isna() & df["view_count"].notna()
+        if missing.any():
+            views[missing] = pd.to_numeric(df.loc[missing, "view_count"].map(parse_count), errors="coerce")
+        df["view_count_num"] = views.astype("Int64")
+
+        df["upload_timestamp"] = pd.to_numeric(df["upload_timestamp"], errors="coerce").astype("Int64")
+
+        older = df["is_older_than_24h"]
+        if older.dtype == object:
+            older = older.map(lambda v: str(v).lower() not in ("false", "0") if v is not None and v == v else None)
+        missing = older.isna()
+        if missing.any():
+            # 搜索/用户频道/归档重新解析的记录没有该标记，但带有上传时间戳；旧CSV只有相对时间 date
+            now = int(time.time())
+            older = older.astype(object)
+            flags = []
+            for upload, scraped, date in zip(df.loc[missing, "upload_timestamp"],
+                                             df.loc[missing, "scrape_timestamp"], df.loc[missing, "date"]):
+                scraped = scraped if isinstance(scraped, str) else None
+                if pd.isna(upload):
+                    upload = resolve_upload_timestamp(date, scraped) if isinstance(date, str) else None
+                flags.append(is_older_than(None if upload is None else int(upload), timestamp_from_iso(scraped) or now))
+            older[missing] = flags
+        df["is_older_than_24h"] = older.astype(bool)
+        df["channel"] = df["channel"].fillna("未知频道")
+        df["source_channel"] = df["source_channel"].fillna("Unknown")
+        return df
+
+    def compute(self, videos: Union[List[Dict], "pd.DataFrame"], by: str = "source_channel") -> Dict:
+        """
+        计算统计信息
+
+        Args:
+            videos: 视频记录列表或DataFrame
+            by: 按频道分组统计使用的列
+
+        Returns:
+            {
+                total_videos, channels, older_24h, within_24h,
+                view_count_stats: {count, min, max, avg, sum, p50, p90, p95, p99},
+                per_channel: {频道: {videos, older_24h, within_24h, views_sum, views_median}}
+            }
+        """
+        df = self.to_frame(videos)
+        if df.empty:
+            return {}
+
+        older_24h = int(df["is_older_than_24h"].sum())
+        stats = {
+            "total_videos": int(len(df)),
+            "channels": {str(k): int(v) for k, v in df["channel"].value_counts(sort=False).items()},
+            "older_24h": older_24h,
+            "within_24h": int(len(df) - older_24h),
+            "view_count_stats": {},
+            "per_channel": {},
+        }
+
+        views = df["view_count_num"].dropna().astype("int64")
+        if not views.empty:
+            quantiles = views.quantile(VIEW_COUNT_PERCENTILES)
+            stats["view_count_stats"] = {
+                "count": int(views.size),
+                "min": int(views.min()),
+                "max": int(views.max()),
+                "avg": float(views.mean()),
+                "sum": int(views.sum()),
+                **{f"p{int(q * 100)}": float(value) for q, value in quantiles.items()},
+            }
+
+        grouped = df.assign(
+            within=~df["is_older_than_24h"],
+            views=df["view_count_num"].astype("float64"),
+        ).groupby(by, sort=True).agg(
+            videos=("is_older_than_24h", "size"),
+            older_24h=("is_older_than_24h", "sum"),
+            within_24h=("within", "sum"),
+            views_sum=("views", "sum"),
+            views_median=("views", "median"),
+        )
+        stats["per_channel"] = {
+            str(channel): {
+                "videos": int(row.videos),
+                "older_24h": int(row.older_24h),
+                "within_24h": int(row.within_24h),
+                "views_sum": int(row.views_sum),
+                "views_median": None if row.views_median != row.views_median else float(row.views_median),
+            }
+            for channel, row in grouped.iterrows()
+        }
+        return stats
+
+    def load_history(self, pattern: str = "*_videos.*", directory: Optional[str] = None) -> "pd.DataFrame":
+        """
+        加载历史输出文件（CSV/JSON）为一个DataFrame，只读取统计需要的列
+
+        Args:
+            pattern: 文件名通配符
+            directory: 目录，None则使用输出目录
+
+        Returns:
+            合并后的DataFrame（增加 source_file 列）
+        """
+        import pandas as pd
+
+        frames = []
+        for path in sorted(glob.glob(os.path.join(directory or OUTPUT_DIR, pattern))):
+            try:
+                if path.endswith(".csv"):
+                    frame = pd.read_csv(path, encoding=OUTPUT_CONFIG["csv_encoding"],
+                                        usecols=lambda c: c in STATS_COLUMNS)
+                elif path.endswith(".json"):
+                    frame = pd.read_json(path, encoding=OUTPUT_CONFIG["json_encoding"], dtype=False)
+                    frame = frame[[c for c in frame.columns if c in STATS_COLUMNS]]
+                else:
+                    continue
+            except Exception as e:
+                self.logger.warning(f"加载历史文件失败 {path}: {str(e)}")
+                continue
+            frame["source_file"] = os.path.basename(path)
+            frames.append(frame)
+
+        if not frames:
+            return pd.DataFrame(columns=STATS_COLUMNS + ["source_file"])
+        return pd.concat(frames, ignore_index=True)
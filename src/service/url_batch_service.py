@@ -6,7 +6,7 @@ URL批量处理服务类 - 用于批量处理YouTube频道URL
 import time
 import re
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -14,28 +14,47 @@ from .youtube_service import YouTubeService
 from .browser_service import BrowserService
 from .data_service import DataService
 from .logging_service import LoggingService
-from ..utils.element_extractors import extract_video_links, extract_channel_about_info, extract_channel_subscribers_from_page
-from ..utils.text_parsers import is_video_older_than_24_hours
-from ..config.settings import SCRAPER_CONFIG
+from .metrics_service import get_metrics_service
+from .fetch_service import fetch_page
+from .stats_service import StatsService
+from .page_archive_service import archive_page
+from .watchdog_service import guard
+from ..utils.selector_registry import get_selector_registry
+from ..utils.element_extractors import (
+    extract_video_links, extract_video_tiles, extract_listing_tiles,
+    extract_channel_about_info, extract_channel_subscribers_from_page
+)
+from ..utils.text_parsers import (
+    normalize_subscriber_text, parse_count, resolve_upload_timestamp, timestamp_from_iso, is_older_than
+)
+from ..utils.channel_planner import plan_channel_walk
+from ..utils.errors import BlockedError, DriverHangError
+from ..utils.listing_records import build_listing_record
+from ..config.settings import SCRAPER_CONFIG, CHANNEL_WALK_CONFIG, LISTING_CONFIG, ERROR_CONFIG, MEMORY_CONFIG
 
 
 class URLBatchService:
     """URL批量处理服务类"""
     
-    def __init__(self, headless: bool = None):
+    def __init__(self, headless: bool = None, listing_only: bool = None):
         """
         初始化URL批量处理服务
         
         Args:
             headless: 是否无头模式
+            listing_only: 是否只用/videos列表卡片构建视频记录，None则使用配置文件中的设置
         """
         self.headless = headless
+        self.listing_only = LISTING_CONFIG["listing_only"] if listing_only is None else listing_only
         self.browser_service = BrowserService()
         self.data_service = DataService()
+        self.stats_service = StatsService()
         self.logging_service = LoggingService()
         self.logger = self.logging_service.get_logger(__name__)
-        self.driver = None
+        self.metrics = get_metrics_service()
         self.youtube_service = None
+        # 频道级信息缓存：频道键（见 _channel_cache_key）-> {bio, subscribers, location}，同一频道的所有视频共享
+        self._channel_info_cache: Dict[str, Dict] = {}
         
     def __enter__(self):
         """上下文管理器入口"""
@@ -49,18 +68,32 @@ class URLBatchService:
     def start(self):
         """启动服务"""
         self.logging_service.log_startup()
+        self.metrics.start_exporters()
         self.browser_service.create_driver(self.headless)
-        self.driver = self.browser_service.get_driver()
-        self.youtube_service = YouTubeService(self.driver)
+        self.youtube_service = YouTubeService(self.browser_service.get_driver(), self.browser_service)
         self.logger.info("URL批量处理服务启动成功")
     
+    @property
+    def driver(self):
+        """当前WebDriver实例（看门狗重建驱动后随之更新）"""
+        return self.browser_service.driver
+    
     def stop(self):
         """停止服务"""
         if self.browser_service:
             self.browser_service.close_driver()
+        self._save_selector_stats()
+        self.metrics.flush()
         self.logging_service.log_shutdown()
         self.logger.info("URL批量处理服务已停止")
     
+    def _save_selector_stats(self):
+        """保存选择器命中率统计，并提示失效选择器"""
+        registry = get_selector_registry()
+        registry.save()
+        for page_type, field, selector, misses in registry.dead_selectors():
+            self.logger.warning(f"失效选择器 {page_type}/{field}: {selector} (未命中 {misses} 次)")
+    
     def extract_channel_name_from_url(self, url: str) -> str:
         """从URL中提取频道名称"""
         try:
@@ -122,6 +155,19 @@ class URLBatchService:
             self.logger.warning(f"URL转换失败，使用原始URL: {str(e)}")
             return url
     
+    @staticmethod
+    def _channel_cache_key(url: str) -> str:
+        """
+        频道级信息的缓存键：@handle 或 channel/c/user 加频道ID，
+        URL参数和 /videos 等子页面不影响；不能用频道名，/channel/<ID>/videos 的"频道名"都是 videos
+        """
+        path_parts = urlparse(url).path.strip('/').split('/')
+        if path_parts[0].startswith('@'):
+            return path_parts[0].lower()
+        if len(path_parts) >= 2 and path_parts[0] in ('channel', 'c', 'user'):
+            return f"{path_parts[0]}/{path_parts[1]}"
+        return url.split('?', 1)[0].rstrip('/')
+    
     def _build_about_url(self, url: str) -> str:
         """根据频道URL构建关于(about)页面URL，尽量保留原始参数结构"""
         try:
@@ -155,67 +201,84 @@ class URLBatchService:
         self.logger.info(f"开始处理频道: {channel_name} - {channel_url}")
         
         try:
-            # 先访问频道关于页，提取频道信息
-            about_url = self._build_about_url(channel_url)
-            self.logger.info(f"访问频道关于页: {about_url}")
-            self.driver.get(about_url)
-            time.sleep(SCRAPER_CONFIG["page_load_delay"])
-            channel_about_info = extract_channel_about_info(self.driver)
+            # 先访问频道关于页，提取频道信息（同一频道只访问一次）
+            channel_about_info = None
+            cache_key = self._channel_cache_key(channel_url)
+            if cache_key not in self._channel_info_cache:
+                about_url = self._build_about_url(channel_url)
+                self.logger.info(f"访问频道关于页: {about_url}")
+                fetch_page(self.driver, about_url, "about", browser_service=self.browser_service)
+                with guard(self.browser_service, "extract", about_url):
+                    channel_about_info = extract_channel_about_info(self.driver)
+                archive_page(self.driver, about_url, "about")
 
             # 智能处理URL：保留参数但确保能找到视频
             videos_url = self._smart_convert_to_videos_url(channel_url)
             self.logger.info(f"访问频道页面: {videos_url}")
             if videos_url != channel_url:
                 self.logger.info(f"原始URL: {channel_url}")
-            self.driver.get(videos_url)
-            time.sleep(SCRAPER_CONFIG["page_load_delay"])
+            fetch_page(self.driver, videos_url, "channel_videos", browser_service=self.browser_service)
+            archive_page(self.driver, videos_url, "channel_videos")
             
-            # 滚动加载更多视频
-            self._scroll_to_load_videos()
+            # 看门狗只覆盖频道页上的解析、规划和滚动；打开观看页由各页面自己的 navigate/extract 截止时间保护
+            with guard(self.browser_service, "scroll", videos_url):
+                # 在频道页上完成频道级信息解析，结果供该频道所有视频共享
+                channel_info = self._resolve_channel_info(cache_key, channel_about_info)
+                
+                if self.listing_only:
+                    # 仅列表模式：直接用卡片构建记录，不打开观看页
+                    videos = self._build_listing_videos(channel_name, channel_url, channel_info, max_videos)
+                elif CHANNEL_WALK_CONFIG["plan_from_tiles"]:
+                    # 根据列表卡片的发布时间规划需要打开的视频，凑够数量即停止滚动
+                    _, planned = self._plan_videos_from_tiles(channel_name, max_videos)
+                    video_links = [tile["url"] for tile in planned]
+                else:
+                    # 滚动加载更多视频
+                    self._scroll_to_load_videos()
+                    
+                    # 提取视频链接
+                    video_links = extract_video_links(self.driver, max_videos)
+            
+            if self.listing_only:
+                if LISTING_CONFIG["fetch_description"]:
+                    # 逐个打开观看页补全描述，每个页面受自己的截止时间保护
+                    self.youtube_service.fill_descriptions(videos)
+                self._log_channel_summary(channel_name, videos)
+                return videos
             
-            # 提取视频链接
-            video_links = extract_video_links(self.driver, max_videos)
             self.logger.info(f"从频道 {channel_name} 获取到 {len(video_links)} 个视频链接")
             
             # 处理每个视频 - 24小时内的视频不计入max_videos限制
             videos = []
             valid_video_count = 0  # 只计算24小时前的视频
             
-            for i, link in enumerate(video_links):
+            links = list(video_links)
+            for i, link in enumerate(links):
                 # 如果已经获取到足够的24小时前的视频，停止处理
                 if valid_video_count >= max_videos:
                     break
                 
                 video_info = self._process_single_video(link, i + 1, channel_name)
+                # 内存治理：导航到空白页，定期采样并在超过阈值时回收驱动（视频链接已规划好，不再需要频道页）
+                if self.browser_service.govern_memory():
+                    self.youtube_service.driver = self.driver
+                # 按重试策略延后的视频追加到本频道队尾
+                links.extend(self.youtube_service.take_deferred())
                 if video_info:
                     # 添加源信息
                     video_info['source_channel'] = channel_name
                     video_info['source_url'] = channel_url
-                    video_info['scrape_timestamp'] = datetime.now().isoformat()
-
-                    # 合并频道关于信息
-                    try:
-                        from ..utils.text_parsers import normalize_subscriber_text
-                        subscribers_value = channel_about_info.get('subscribers') or "未知"
-                        if subscribers_value == "未知":
-                            # 尝试在当前频道页(含Videos页)再次抓取订阅数
-                            subscribers_value = extract_channel_subscribers_from_page(self.driver)
-                        subscribers_value = normalize_subscriber_text(subscribers_value) or "未知"
+                    scrape_time = datetime.now()
+                    video_info['scrape_timestamp'] = scrape_time.isoformat()
 
-                        video_info.update({
-                            'bio': channel_about_info.get('bio', '未知'),
-                            'subscribers': subscribers_value,
-                            'location': channel_about_info.get('location', '未知'),
-                        })
-                        # 用户反馈不需要视频总数
-                        if 'video_num' in video_info:
-                            del video_info['video_num']
-                    except Exception:
-                        pass
+                    # 合并频道级信息
+                    video_info.update(channel_info)
                     
-                    # 判断视频是否超过24小时
+                    # 判断视频是否超过24小时：上传时间以抓取时间为基准解析为时间戳后整数比较
                     upload_date = video_info.get('date', '未知')
-                    is_old_video = is_video_older_than_24_hours(upload_date)
+                    anchor = int(scrape_time.timestamp())
+                    video_info['upload_timestamp'] = resolve_upload_timestamp(upload_date, anchor)
+                    is_old_video = is_older_than(video_info['upload_timestamp'], anchor)
                     video_info['is_older_than_24h'] = is_old_video
                     
                     if is_old_video:
@@ -228,21 +291,142 @@ class URLBatchService:
                     
                     videos.append(video_info)
             
-            # 统计24小时内和24小时前的视频数量
-            old_videos = [v for v in videos if v.get('is_older_than_24h', True)]
-            new_videos = [v for v in videos if not v.get('is_older_than_24h', True)]
-            
-            self.logger.info(f"频道 {channel_name} 处理完成:")
-            self.logger.info(f"  总视频数: {len(videos)} 个")
-            self.logger.info(f"  24小时前视频: {len(old_videos)} 个 (计入指定数量)")
-            self.logger.info(f"  24小时内视频: {len(new_videos)} 个 (不计入指定数量)")
-            
+            self._log_channel_summary(channel_name, videos)
             return videos
             
+        except (BlockedError, DriverHangError):
+            # 频道页/关于页被拦截或驱动卡死：交给批处理统计或重建驱动后重试该频道
+            raise
         except Exception as e:
             self.logger.error(f"处理频道 {channel_name} 时出错: {str(e)}")
             return []
     
+    def _build_listing_videos(self, channel_name: str, channel_url: str, channel_info: Dict,
+                              max_videos: int) -> List[Dict]:
+        """
+        仅列表模式：用/videos列表卡片（DOM + ytInitialData）构建视频记录
+        
+        24小时判断使用卡片上的相对发布时间；不打开观看页（fetch_description 由调用方在看门狗保护范围外处理）。
+        
+        Returns:
+            视频信息列表
+        """
+        header_channel, planned = self._plan_videos_from_tiles(channel_name, max_videos, listing=True)
+        scrape_timestamp = datetime.now().isoformat()
+        anchor = timestamp_from_iso(scrape_timestamp)
+        videos = []
+        for tile in planned:
+            video_info = build_listing_record(tile, header_channel or channel_name, anchor)
+            video_info['source_channel'] = channel_name
+            video_info['source_url'] = channel_url
+            video_info['scrape_timestamp'] = scrape_timestamp
+            video_info.update(channel_info)
+            video_info['is_older_than_24h'] = is_older_than(video_info['upload_timestamp'], anchor)
+            videos.append(video_info)
+        self.metrics.inc("listing_records_total", len(videos))
+        return videos
+    
+    @staticmethod
+    def _count_age_split(videos: List[Dict]):
+        """一次遍历统计 (24小时前视频数, 24小时内视频数)"""
+        old_count = sum(1 for v in videos if v.get('is_older_than_24h', True))
+        return old_count, len(videos) - old_count
+    
+    def _log_channel_summary(self, channel_name: str, videos: List[Dict]):
+        """统计并记录单个频道24小时内和24小时前的视频数量"""
+        old_count, new_count = self._count_age_split(videos)
+        
+        self.logger.info(f"频道 {channel_name} 处理完成:")
+        self.logger.info(f"  总视频数: {len(videos)} 个")
+        self.logger.info(f"  24小时前视频: {old_count} 个 (计入指定数量)")
+        self.logger.info(f"  24小时内视频: {new_count} 个 (不计入指定数量)")
+    
+    def _resolve_channel_info(self, cache_key: str, channel_about_info: Optional[Dict]) -> Dict:
+        """
+        解析频道级信息（简介、订阅数、地理位置），每个频道只解析一次
+        
+        关于页缺少订阅数时，在当前频道页（Videos页头部）回退提取，
+        必须在进入视频观看页之前调用。
+        
+        Args:
+            cache_key: 频道缓存键（_channel_cache_key）
+            channel_about_info: 关于页提取结果，已缓存时可为None
+            
+        Returns:
+            频道级信息字典
+        """
+        cached = self._channel_info_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        channel_about_info = channel_about_info or {}
+        subscribers_value = channel_about_info.get('subscribers') or "未知"
+        if subscribers_value == "未知":
+            # 尝试在当前频道页(含Videos页)再次抓取订阅数
+            self.metrics.inc("channel_subscriber_fallback_total")
+            try:
+                subscribers_value = extract_channel_subscribers_from_page(self.driver)
+            except Exception as e:
+                self.logger.warning(f"频道页提取订阅数失败: {str(e)}")
+        # 数值从原始文本解析：标准化会丢掉越南语 N/Tr 单位和小数部分（"12,3 N" -> "12"）
+        subscribers_raw = subscribers_value if subscribers_value != "未知" else None
+        subscribers_num = parse_count(subscribers_raw)
+        subscribers_value = normalize_subscriber_text(subscribers_value) or "未知"
+        
+        # 用户反馈不需要视频总数，因此不合并 video_num
+        channel_info = {
+            'bio': channel_about_info.get('bio', '未知'),
+            'subscribers': subscribers_value,
+            'subscribers_raw': subscribers_raw,
+            'subscribers_num': subscribers_num,
+            'location': channel_about_info.get('location', '未知'),
+        }
+        self._channel_info_cache[cache_key] = channel_info
+        return channel_info
+    
+    def _plan_videos_from_tiles(self, channel_name: str, max_videos: int,
+                                listing: bool = False) -> Tuple[Optional[str], List[Dict]]:
+        """
+        读取/videos列表卡片并规划需要打开的视频
+        
+        每轮一次脚本调用读取全部卡片；已凑够 max_videos 个24小时前的视频时不再滚动，
+        否则最多滚动 scroll_count 次。
+        
+        Args:
+            channel_name: 频道名称（用于日志）
+            max_videos: 需要的24小时前视频数量
+            listing: 是否同时读取 ytInitialData 卡片（仅列表模式需要完整字段）
+            
+        Returns:
+            (页面头部的频道名或None, 规划的卡片列表)
+        """
+        header_channel = None
+        open_recent = CHANNEL_WALK_CONFIG["open_recent_videos"]
+        scroll_count = SCRAPER_CONFIG["scroll_count"]
+        scroll_delay = SCRAPER_CONFIG["scroll_delay"]
+        
+        scrolls = 0
+        while True:
+            if listing:
+                header_channel, tiles = extract_listing_tiles(self.driver)
+            else:
+                tiles = extract_video_tiles(self.driver)
+            planned, satisfied = plan_channel_walk(tiles, max_videos, open_recent)
+            if satisfied or scrolls >= scroll_count:
+                break
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            time.sleep(scroll_delay)
+            scrolls += 1
+        if scrolls:
+            self.metrics.observe("wait_seconds", scrolls * scroll_delay, kind="scroll")
+        
+        recent_skipped = 0 if open_recent else sum(1 for t in tiles if t.get("is_older_than_24h") is False)
+        self.logger.info(
+            f"频道 {channel_name}: 读取 {len(tiles)} 个卡片，规划打开 {len(planned)} 个视频，"
+            f"滚动 {scrolls} 次{'' if open_recent else f'，跳过24小时内视频 {recent_skipped} 个'}"
+        )
+        return header_channel, planned
+    
     def _scroll_to_load_videos(self):
         """滚动页面以加载更多视频"""
         self.logger.info("正在加载频道视频...")
@@ -253,6 +437,7 @@ class URLBatchService:
         for i in range(scroll_count):
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(scroll_delay)
+        self.metrics.observe("wait_seconds", scroll_count * scroll_delay, kind="scroll")
     
     def _process_single_video(self, video_url: str, index: int, channel_name: str) -> Optional[Dict]:
         """处理单个视频"""
@@ -260,7 +445,7 @@ class URLBatchService:
             self.logger.info(f"处理频道 {channel_name} 第 {index} 个视频: {video_url}")
             
             # 使用YouTube服务处理视频
-            video_info = self.youtube_service._process_single_video(video_url, index)
+            video_info = self.youtube_service._process_single_video(video_url, index, defer=True)
             
             if video_info:
                 self.logger.info(f"成功获取视频信息: {video_info.get('title', 'Unknown')[:50]}...")
@@ -274,14 +459,14 @@ class URLBatchService:
     def process_multiple_urls(self, 
                              channel_urls: List[str], 
                              max_videos_per_channel: int = 20,
-                             delay_between_channels: int = 2) -> List[Dict]:
+                             delay_between_channels: int = None) -> List[Dict]:
         """
         批量处理多个频道URL
         
         Args:
             channel_urls: 频道URL列表
             max_videos_per_channel: 每个频道最大视频数量
-            delay_between_channels: 频道间延迟时间（秒）
+            delay_between_channels: 已废弃，请求间隔由 RATE_LIMIT_CONFIG 的按主机令牌桶控制
             
         Returns:
             所有视频信息列表
@@ -289,6 +474,9 @@ class URLBatchService:
         all_videos = []
         successful_channels = 0
         failed_channels = []
+        blocked_channels = []
+        total_old_videos = 0
+        total_new_videos = 0
         
         self.logger.info(f"开始批量处理 {len(channel_urls)} 个频道URL")
         start_time = datetime.now()
@@ -298,8 +486,18 @@ class URLBatchService:
             self.logger.info(f"正在处理第 {i}/{len(channel_urls)} 个频道: {channel_name}")
             
             try:
+                if not self.browser_service.is_driver_ready():
+                    # 上一个频道重试时驱动再次卡死被结束
+                    self.youtube_service.rebuild_driver()
+                
                 # 处理单个频道
-                videos = self.process_channel_url(channel_url, max_videos_per_channel)
+                try:
+                    videos = self.process_channel_url(channel_url, max_videos_per_channel)
+                except DriverHangError as e:
+                    # 频道页阶段卡死（视频阶段的卡死由YouTube服务重建驱动后就地继续）：重建驱动重试一次
+                    self.logger.error(f"频道 {channel_name} 处理中驱动卡死，重建驱动后重试: {str(e)}")
+                    self.youtube_service.rebuild_driver()
+                    videos = self.process_channel_url(channel_url, max_videos_per_channel)
                 
                 if videos:
                     # 为每个视频添加批处理元数据
@@ -312,40 +510,44 @@ class URLBatchService:
                     all_videos.extend(videos)
                     successful_channels += 1
                     
-                    # 分别统计24小时内外的视频
-                    old_videos = [v for v in videos if v.get('is_older_than_24h', True)]
-                    new_videos = [v for v in videos if not v.get('is_older_than_24h', True)]
-                    self.logger.info(f"频道 {channel_name}: 获取 {len(videos)} 个视频 (24小时前: {len(old_videos)}个, 24小时内: {len(new_videos)}个)")
+                    # 分别统计24小时内外的视频，同时累计批次总数
+                    old_count, new_count = self._count_age_split(videos)
+                    total_old_videos += old_count
+                    total_new_videos += new_count
+                    self.logger.info(f"频道 {channel_name}: 获取 {len(videos)} 个视频 (24小时前: {old_count}个, 24小时内: {new_count}个)")
                 else:
                     self.logger.warning(f"频道 {channel_name}: 未获取到任何视频")
                     failed_channels.append(channel_name)
-                
-                # 添加延迟
-                if i < len(channel_urls) and delay_between_channels > 0:
-                    self.logger.info(f"等待 {delay_between_channels} 秒后继续下一个频道...")
-                    time.sleep(delay_between_channels)
                     
+            except BlockedError as e:
+                self.logger.error(f"频道 {channel_name} 被拦截 ({e.kind})，跳过")
+                blocked_channels.append(channel_name)
+                continue
             except Exception as e:
                 self.logger.error(f"处理频道 {channel_name} 时出错: {str(e)}")
                 failed_channels.append(channel_name)
                 continue
+            finally:
+                # 每个频道结束后刷新textfile导出
+                self.metrics.flush()
         
         end_time = datetime.now()
         duration = end_time - start_time
         
-        # 计算最终统计信息
-        total_old_videos = sum(1 for v in all_videos if v.get('is_older_than_24h', True))
-        total_new_videos = sum(1 for v in all_videos if not v.get('is_older_than_24h', True))
+        # 结束时再采样一次，统计中的当前内存反映批次末尾的状态
+        if MEMORY_CONFIG["enabled"]:
+            self.browser_service.sample_memory()
         
         # 输出统计信息
         self._log_batch_statistics(
             duration, successful_channels, len(channel_urls), 
-            len(all_videos), total_old_videos, total_new_videos, failed_channels
+            len(all_videos), total_old_videos, total_new_videos, failed_channels, blocked_channels
         )
         
         return all_videos
     
-    def _log_batch_statistics(self, duration, successful, total, video_count, old_videos, new_videos, failed):
+    def _log_batch_statistics(self, duration, successful, total, video_count, old_videos, new_videos, failed,
+                              blocked=None):
         """记录批处理统计信息"""
         self.logger.info("=" * 60)
         self.logger.info("URL批量处理完成！")
@@ -357,6 +559,29 @@ class URLBatchService:
         
         if failed:
             self.logger.warning(f"失败的频道: {', '.join(failed)}")
+        if blocked:
+            self.logger.warning(f"被拦截的频道: {', '.join(blocked)}")
+        failures = self.metrics.get("video_failures_total")
+        if failures is not None and failures.total():
+            categories = list(ERROR_CONFIG["retry_policy"]) + ["unknown"]
+            by_category = {c: int(failures.value(category=c)) for c in categories if failures.value(category=c)}
+            self.logger.warning(
+                f"失败视频按类别: {', '.join(f'{c} {n}个' for c, n in by_category.items())}"
+            )
+        memory = self.browser_service.memory_stats
+        if memory["samples"]:
+            self.logger.info(
+                f"浏览器内存: 进程树RSS 当前 {self._format_mb(memory['last_rss_bytes'])} / "
+                f"峰值 {self._format_mb(memory['peak_rss_bytes'])}，"
+                f"JS堆 当前 {self._format_mb(memory['last_js_heap_bytes'])} / "
+                f"峰值 {self._format_mb(memory['peak_js_heap_bytes'])}，"
+                f"采样 {memory['samples']} 次，回收驱动 {memory['recycles']} 次"
+            )
+    
+    @staticmethod
+    def _format_mb(value: Optional[int]) -> str:
+        """字节数格式化为MB，未知时返回 未知"""
+        return "未知" if value is None else f"{value / 1024 / 1024:.0f}MB"
     
     def save_batch_results(self, videos: List[Dict], filename_prefix: str = "url_batch") -> Dict:
         """
@@ -391,38 +616,25 @@ class URLBatchService:
             raise
     
     def _display_batch_summary(self, videos: List[Dict]):
-        """显示批处理摘要"""
-        old_videos = [v for v in videos if v.get('is_older_than_24h', True)]
-        new_videos = [v for v in videos if not v.get('is_older_than_24h', True)]
-        
-        self.logger.info(f"保存了 {len(videos)} 个视频信息")
-        self.logger.info(f"  - 24小时前视频: {len(old_videos)} 个")
-        self.logger.info(f"  - 24小时内视频: {len(new_videos)} 个")
-        
-        # 按频道统计
-        channel_stats = {}
-        channel_old_stats = {}
-        channel_new_stats = {}
-        
-        for video in videos:
-            channel = video.get('source_channel', 'Unknown')
-            if channel not in channel_stats:
-                channel_stats[channel] = 0
-                channel_old_stats[channel] = 0
-                channel_new_stats[channel] = 0
-            
-            channel_stats[channel] += 1
-            if video.get('is_older_than_24h', True):
-                channel_old_stats[channel] += 1
-            else:
-                channel_new_stats[channel] += 1
+        """显示批处理摘要（一次列式计算得到总体和按频道统计）"""
+        stats = self.stats_service.compute(videos)
+        if not stats:
+            return
+        
+        self.logger.info(f"保存了 {stats['total_videos']} 个视频信息")
+        self.logger.info(f"  - 24小时前视频: {stats['older_24h']} 个")
+        self.logger.info(f"  - 24小时内视频: {stats['within_24h']} 个")
+        
+        view_stats = stats["view_count_stats"]
+        if view_stats:
+            self.logger.info(
+                f"观看次数: 中位数 {view_stats['p50']:.0f}, P90 {view_stats['p90']:.0f}, "
+                f"P99 {view_stats['p99']:.0f}, 最大 {view_stats['max']}"
+            )
         
         self.logger.info("按频道统计:")
-        for channel in sorted(channel_stats.keys()):
-            total = channel_stats[channel]
-            old = channel_old_stats[channel]
-            new = channel_new_stats[channel]
-            self.logger.info(f"  {channel}: {total} 个视频 (24h前: {old}, 24h内: {new})")
+        for channel, row in stats["per_channel"].items():
+            self.logger.info(f"  {channel}: {row['videos']} 个视频 (24h前: {row['older_24h']}, 24h内: {row['within_24h']})")
     
     def run_batch_process(self, 
                          channel_urls: List[str], 
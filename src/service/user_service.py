@@ -12,6 +12,9 @@ from .browser_service import BrowserService
 from .youtube_service import YouTubeService
 from .data_service import DataService
 from .logging_service import LoggingService
+from .fetch_service import fetch_page
+from .page_archive_service import archive_page
+from ..utils.selector_registry import get_selector_registry
 
 
 class YouTubeUserService:
@@ -48,7 +51,7 @@ class YouTubeUserService:
         self.browser_service.create_driver(self.headless)
         
         # 创建YouTube服务
-        self.youtube_service = YouTubeService(self.browser_service.get_driver())
+        self.youtube_service = YouTubeService(self.browser_service.get_driver(), self.browser_service)
         
         self.logger.info("用户服务启动成功")
     
@@ -57,6 +60,9 @@ class YouTubeUserService:
         if self.browser_service:
             self.browser_service.close_driver()
         
+        # 保存选择器命中率统计
+        get_selector_registry().save()
+        
         self.logging_service.log_shutdown()
         self.logger.info("用户服务已停止")
     
@@ -173,10 +179,8 @@ class YouTubeUserService:
     def _navigate_to_user_channel(self, channel_url: str):
         """导航到用户频道页面（默认按最新时间排序）"""
         self.logger.info(f"正在访问用户频道: {channel_url}")
-        self.youtube_service.driver.get(channel_url)
-        
-        from ..config.settings import SCRAPER_CONFIG
-        time.sleep(SCRAPER_CONFIG["page_load_delay"])
+        fetch_page(self.youtube_service.driver, channel_url, "channel_videos", browser_service=self.browser_service)
+        archive_page(self.youtube_service.driver, channel_url, "channel_videos")
         
         # YouTube频道的/videos页面默认就是按最新时间排序的
         self.logger.info("页面已按最新时间排序（默认）")
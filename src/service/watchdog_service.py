@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+驱动看门狗服务层 - 为每个驱动操作登记截止时间，超时时强制结束 chromedriver/Chrome 进程树
+
+page_load_timeout 只约束 driver.get 的页面加载；渲染进程冻结或弹出对话框时 driver.get 和
+execute_script 可能无限期阻塞。看门狗用一个后台线程检查所有登记的操作，超过截止时间即结束进程树，
+阻塞的调用随之因连接断开而返回，watch() 退出时抛出 DriverHangError，由调用方重建驱动并从当前视频继续。
+"""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Optional
+
+from ..config.settings import WATCHDOG_CONFIG
+from ..utils.errors import DriverHangError
+from .metrics_service import get_metrics_service
+
+
+class _Watch:
+    """一次登记的驱动操作"""
+
+    __slots__ = ("browser_service", "operation", "timeout", "deadline", "fired")
+
+    def __init__(self, browser_service, operation: str, timeout: float):
+        self.browser_service = browser_service
+        self.operation = operation
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout
+        self.fired = False
+
+
+class DriverWatchdog:
+    """驱动看门狗 - 一个监控线程负责进程内所有驱动的操作截止时间"""
+
+    def __init__(self, poll_interval: float = None, deadlines: Dict[str, float] = None):
+        """
+        初始化看门狗
+
+        Args:
+            poll_interval: 检查间隔（秒），None则使用配置文件中的设置
+            deadlines: 各操作的截止时间（秒），None则使用配置文件中的设置
+        """
+        self.logger = logging.getLogger(__name__)
+        self.metrics = get_metrics_service()
+        self.poll_interval = poll_interval if poll_interval is not None else WATCHDOG_CONFIG["poll_interval"]
+        self.deadlines = dict(WATCHDOG_CONFIG["deadlines"] if deadlines is None else deadlines)
+        self._lock = threading.Lock()
+        self._watches: Dict[int, _Watch] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_thread(self):
+        """首次登记操作时启动监控线程"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="driver-watchdog", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """监控线程：结束超过截止时间的操作所属的驱动"""
+        while True:
+            time.sleep(self.poll_interval)
+            now = time.monotonic()
+            with self._lock:
+                expired = [w for w in self._watches.values() if not w.fired and w.deadline <= now]
+                for watch in expired:
+                    watch.fired = True
+            for watch in expired:
+                self._fire(watch)
+
+    def _fire(self, watch: _Watch):
+        """结束卡死的驱动进程树"""
+        self.metrics.inc("watchdog_kills_total", operation=watch.operation)
+        self.logger.error(f"驱动操作 {watch.operation} 超过 {watch.timeout:.0f} 秒未返回，强制结束浏览器进程")
+        try:
+            watch.browser_service.kill_driver()
+        except Exception as e:
+            self.logger.error(f"结束浏览器进程失败: {str(e)}")
+
+    @contextmanager
+    def watch(self, browser_service, operation: str, timeout: float = None, url: str = None):
+        """
+        在截止时间内执行一段驱动操作
+
+        Args:
+            browser_service: 驱动所属的浏览器服务（超时时调用其 kill_driver）
+            operation: 操作名称，对应 deadlines 中的键
+            timeout: 截止时间（秒），None则按操作名称取配置
+            url: 当前页面URL（写入异常）
+
+        Raises:
+            DriverHangError: 操作超时、驱动进程树已被结束
+        """
+        if timeout is None:
+            timeout = self.deadlines[operation]
+        watch = _Watch(browser_service, operation, timeout)
+        key = id(watch)
+        with self._lock:
+            self._watches[key] = watch
+            self._ensure_thread()
+        try:
+            yield watch
+        except Exception as e:
+            if watch.fired:
+                raise DriverHangError(operation, timeout, url) from e
+            raise
+        finally:
+            with self._lock:
+                self._watches.pop(key, None)
+        if watch.fired:
+            # 结束进程树时操作恰好返回
+            raise DriverHangError(operation, timeout, url)
+
+
+_default_watchdog = None
+_default_lock = threading.Lock()
+
+
+def get_watchdog() -> Optional[DriverWatchdog]:
+    """获取进程内共享的看门狗，未启用时返回None"""
+    global _default_watchdog
+    if not WATCHDOG_CONFIG["enabled"]:
+        return None
+    if _default_watchdog is None:
+        with _default_lock:
+            if _default_watchdog is None:
+                _default_watchdog = DriverWatchdog()
+    return _default_watchdog
+
+
+def guard(browser_service, operation: str, url: str = None):
+    """
+    看门狗保护的上下文；未启用看门狗或没有浏览器服务（无法重建驱动）时不做任何事
+
+    用法:
+        with guard(self.browser_service, "extract", url):
+            title = extract_title(self.driver)
+    """
+    watchdog = get_watchdog()
+    if watchdog is None or browser_service is None:
+        return nullcontext()
+    return watchdog.watch(browser_service, operation, url=url)
@@ -13,66 +13,103 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 
 from ..config.settings import (
     SCRAPER_CONFIG, 
-    YOUTUBE_CONFIG, 
     OUTPUT_CONFIG,
-    ERROR_CONFIG
+    ERROR_CONFIG,
+    LISTING_CONFIG
 )
 from ..utils.element_extractors import (
     extract_title,
     extract_channel_name,
     extract_view_count_and_date,
     extract_video_description,
-    extract_video_links
+    extract_video_links,
+    extract_listing_tiles
 )
+from ..utils.errors import (
+    AgeRestrictedError, DriverHangError, SelectorMissError, VideoUnavailableError,
+    classify_exception, get_retry_policy
+)
+from ..utils.interstitials import check_playability
+from ..utils.listing_records import build_listing_record
+from ..utils.text_parsers import extract_video_id, parse_count, resolve_upload_timestamp
 from ..utils.css_selectors import PAGE_LOAD_SELECTORS
+from ..utils.search_filters import SearchOptions, build_search_url
+from .metrics_service import get_metrics_service
+from .fetch_service import fetch_page
+from .page_archive_service import archive_page
+from .negative_cache_service import get_negative_cache
+from .watchdog_service import guard
+
+# 字段提取失败时的占位值，用于统计字段级失败
+FIELD_FAILURE_VALUES = {
+    "title": ("未知标题",),
+    "channel": ("未知频道",),
+    "view_count": ("未知",),
+    "date": ("未知",),
+    "description": ("获取失败",),
+}
 
 
 class YouTubeService:
     """YouTube服务类 - 处理爬虫业务逻辑"""
     
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: WebDriver, browser_service=None):
+        """
+        初始化YouTube服务
+        
+        Args:
+            driver: WebDriver实例
+            browser_service: 驱动所属的浏览器服务；提供时驱动操作受看门狗保护，卡死后重建驱动
+        """
         self.driver = driver
+        self.browser_service = browser_service
         self.logger = logging.getLogger(__name__)
+        self.metrics = get_metrics_service()
+        # 按重试策略延后处理的视频URL及其已用的重试次数
+        self.deferred_urls: List[str] = []
+        self._deferred_attempts: Dict[str, Dict[str, int]] = {}
     
-    def search_videos(self, search_query: str, max_videos: int = None) -> List[Dict]:
+    def search_videos(self, search_query: str, max_videos: int = None,
+                      options: Optional[SearchOptions] = None, listing_only: bool = None) -> List[Dict]:
         """
         搜索YouTube视频
         
         Args:
             search_query: 搜索关键词
             max_videos: 最大视频数量
+            options: 搜索过滤选项（上传时间、类型、时长、排序）
+            listing_only: 是否只用搜索结果卡片构建记录，None则使用配置文件中的设置
             
         Returns:
             视频信息列表
         """
         if max_videos is None:
             max_videos = SCRAPER_CONFIG["max_videos"]
+        if listing_only is None:
+            listing_only = LISTING_CONFIG["listing_only"]
         
         self.logger.info(f"开始搜索: {search_query}, 最大数量: {max_videos}")
         
         try:
-            # 构建搜索URL
-            search_url = YOUTUBE_CONFIG["search_url"].format(
-                search_query.replace(' ', '+')
-            )
-            
-            # 访问搜索页面
-            self._navigate_to_search_page(search_url)
+            if listing_only:
+                self._navigate_to_search_page(build_search_url(search_query, options))
+                self._scroll_to_load_videos()
+                videos = self.collect_listing_records(max_videos)
+                if LISTING_CONFIG["fetch_description"]:
+                    self.fill_descriptions(videos)
+                self.logger.info(f"仅列表模式获取 {len(videos)} 个视频")
+                return videos
             
-            # 滚动加载更多视频
-            self._scroll_to_load_videos()
+            video_links = self.collect_search_links(search_query, max_videos, options)
             
-            # 提取视频链接
-            video_links = extract_video_links(self.driver, max_videos)
-            self.logger.info(f"获取到 {len(video_links)} 个视频链接")
-            
-            # 处理每个视频
+            # 处理每个视频，延后重试的视频追加到队尾
             videos = []
-            for i, link in enumerate(video_links):
-                if i >= max_videos:
-                    break
-                
-                video_info = self._process_single_video(link, i + 1)
+            links = list(video_links[:max_videos])
+            for i, link in enumerate(links):
+                video_info = self._process_single_video(link, i + 1, defer=True)
+                if self.browser_service is not None and self.browser_service.govern_memory():
+                    self.driver = self.browser_service.driver
+                links.extend(self.take_deferred())
                 if video_info:
                     videos.append(video_info)
             
@@ -83,11 +120,77 @@ class YouTubeService:
             self.logger.error(f"搜索过程中出错: {str(e)}")
             return []
     
+    def collect_search_links(self, search_query: str, max_videos: int,
+                             options: Optional[SearchOptions] = None) -> List[str]:
+        """
+        访问搜索结果页并收集视频链接（不打开视频页）
+        
+        Args:
+            search_query: 搜索关键词
+            max_videos: 最大视频数量
+            options: 搜索过滤选项，编码为 sp= 参数由YouTube服务端过滤
+            
+        Returns:
+            规范化后的视频链接列表
+        """
+        # 构建搜索URL
+        search_url = build_search_url(search_query, options)
+        
+        # 访问搜索页面
+        self._navigate_to_search_page(search_url)
+        
+        # 滚动加载更多视频
+        self._scroll_to_load_videos()
+        
+        # 提取视频链接
+        video_links = extract_video_links(self.driver, max_videos)
+        self.logger.info(f"获取到 {len(video_links)} 个视频链接")
+        return video_links
+    
+    def collect_listing_records(self, max_videos: int = None, channel: str = None) -> List[Dict]:
+        """
+        用当前列表/搜索结果页的卡片构建视频记录（不打开观看页）
+        
+        Args:
+            max_videos: 最大记录数量，None表示全部
+            channel: 卡片缺少频道名时使用的频道名
+            
+        Returns:
+            视频信息列表
+        """
+        header_channel, tiles = extract_listing_tiles(self.driver)
+        if max_videos is not None:
+            tiles = tiles[:max_videos]
+        records = [build_listing_record(tile, channel or header_channel) for tile in tiles]
+        self.metrics.inc("listing_records_total", len(records))
+        return records
+    
+    def fill_descriptions(self, records: List[Dict]) -> List[Dict]:
+        """
+        为列表记录打开观看页补全完整描述，卡片中缺失的字段一并补齐
+        
+        Args:
+            records: 列表记录（原地更新）
+            
+        Returns:
+            更新后的记录列表
+        """
+        for i, record in enumerate(records, 1):
+            video_info = self._process_single_video(record["url"], i)
+            if not video_info:
+                continue
+            record["description"] = video_info.get("description", record.get("description", ""))
+            for field, failure_values in FIELD_FAILURE_VALUES.items():
+                if record.get(field) in failure_values and video_info.get(field) not in failure_values:
+                    record[field] = video_info[field]
+            record["record_source"] = "listing+watch"
+        return records
+    
     def _navigate_to_search_page(self, search_url: str):
         """导航到搜索页面"""
         self.logger.info(f"正在访问: {search_url}")
-        self.driver.get(search_url)
-        time.sleep(SCRAPER_CONFIG["page_load_delay"])
+        fetch_page(self.driver, search_url, "search", browser_service=self.browser_service)
+        archive_page(self.driver, search_url, "search")
     
     def _scroll_to_load_videos(self):
         """滚动页面以加载更多视频"""
@@ -95,39 +198,93 @@ class YouTubeService:
         scroll_count = SCRAPER_CONFIG["scroll_count"]
         scroll_delay = SCRAPER_CONFIG["scroll_delay"]
         
-        for i in range(scroll_count):
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_delay)
+        with guard(self.browser_service, "scroll"):
+            for i in range(scroll_count):
+                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(scroll_delay)
+        self.metrics.observe("wait_seconds", scroll_count * scroll_delay, kind="scroll")
     
-    def _process_single_video(self, video_url: str, index: int) -> Optional[Dict]:
+    def _process_single_video(self, video_url: str, index: int, defer: bool = False) -> Optional[Dict]:
         """
         处理单个视频
         
+        失败时按错误类别的重试策略处理：立即重试（按类别的等待和退避）、延后重试（defer=True时
+        放入 deferred_urls，由调用方追加到队尾）或放弃；永久不可用的视频写入负缓存，
+        负缓存中的视频直接跳过。驱动操作卡死被看门狗结束时先重建驱动，再按 driver 类别重试当前视频。
+        
         Args:
             video_url: 视频URL
             index: 视频索引
+            defer: 调用方是否会处理 take_deferred() 返回的延后视频
             
         Returns:
-            视频信息字典
+            视频信息字典；跳过、延后或最终失败时返回None（不产生占位记录）
         """
+        video_id = extract_video_id(video_url)
+        negative_cache = get_negative_cache()
+        if negative_cache is not None and video_id:
+            entry = negative_cache.get(video_id)
+            if entry is not None:
+                self.metrics.inc("negative_cache_hits_total", category=entry["category"])
+                self.logger.info(f"跳过不可用视频 {video_id} ({entry['category']}): {entry['reason']}")
+                return None
+        
         self.logger.info(f"正在处理第 {index} 个视频: {video_url}")
+        start_time = time.monotonic()
+        # 各类别已用的重试次数（延后的视频沿用延后前的次数）
+        attempts = self._deferred_attempts.pop(video_url, {})
         
-        for retry in range(ERROR_CONFIG["max_retries"]):
+        while True:
             try:
-                return self._extract_video_details(video_url)
+                video_info = self._extract_video_details(video_url)
+                self.metrics.inc("videos_extracted_total")
+                self.metrics.observe("video_seconds", time.monotonic() - start_time)
+                return video_info
             except Exception as e:
-                self.logger.warning(f"处理视频失败 (重试 {retry + 1}/{ERROR_CONFIG['max_retries']}): {str(e)}")
-                if retry < ERROR_CONFIG["max_retries"] - 1:
-                    time.sleep(ERROR_CONFIG["retry_delay"])
-                    continue
-                else:
-                    self.logger.error(f"处理视频最终失败: {video_url}")
-                    if ERROR_CONFIG["continue_on_error"]:
+                category = classify_exception(e)
+                policy = get_retry_policy(category)
+                used = attempts.get(category, 0)
+                if isinstance(e, DriverHangError):
+                    # 驱动已被看门狗结束：先重建，重试或后续视频都使用新驱动
+                    self.rebuild_driver()
+                
+                if used < policy["max_retries"]:
+                    attempts[category] = used + 1
+                    self.metrics.inc("retries_total")
+                    if policy["where"] == "deferred" and defer:
+                        self.logger.warning(f"处理视频失败 [{category}]，延后重试: {str(e)}")
+                        self._deferred_attempts[video_url] = attempts
+                        self.deferred_urls.append(video_url)
                         return None
-                    else:
-                        raise
-        
-        return None
+                    delay = policy["delay"] * policy["backoff"] ** used
+                    self.logger.warning(
+                        f"处理视频失败 [{category}] (重试 {used + 1}/{policy['max_retries']}，等待 {delay:.0f} 秒): {str(e)}"
+                    )
+                    if delay > 0:
+                        time.sleep(delay)
+                        self.metrics.observe("wait_seconds", delay, kind="retry_delay")
+                    continue
+                
+                self.metrics.inc("video_failures_total", category=category)
+                self.logger.error(f"处理视频最终失败 [{category}]: {video_url} - {str(e)}")
+                if policy["negative_cache"] and negative_cache is not None and video_id:
+                    negative_cache.add(video_id, category, getattr(e, "reason", str(e)))
+                if ERROR_CONFIG["continue_on_error"]:
+                    return None
+                raise
+    
+    def rebuild_driver(self) -> WebDriver:
+        """通过浏览器服务重建驱动（需要在构造时传入 browser_service）"""
+        if self.browser_service is None:
+            raise RuntimeError("没有浏览器服务，无法重建驱动")
+        self.logger.warning("正在重建浏览器驱动")
+        self.driver = self.browser_service.rebuild_driver()
+        return self.driver
+    
+    def take_deferred(self) -> List[str]:
+        """取出并清空延后重试的视频URL"""
+        deferred, self.deferred_urls = self.deferred_urls, []
+        return deferred
     
     def _extract_video_details(self, video_url: str) -> Dict:
         """
@@ -138,35 +295,60 @@ class YouTubeService:
             
         Returns:
             视频信息字典
+            
+        Raises:
+            VideoUnavailableError / AgeRestrictedError: 播放状态表明视频已删除、私享或需要确认年龄
+            SelectorMissError: 标题和频道名都未能提取
+            DriverHangError: 导航或提取超过看门狗截止时间，驱动进程树已被结束
         """
         # 访问视频页面
-        self.driver.get(video_url)
-        time.sleep(SCRAPER_CONFIG["page_load_delay"])
-        
-        # 等待页面加载 - 使用更宽松的策略
-        self._wait_for_page_load()
+        fetch_page(self.driver, video_url, "watch", browser_service=self.browser_service)
         
-        # 提取视频信息
-        title = extract_title(self.driver)
-        channel = extract_channel_name(self.driver)
-        view_count, upload_date = extract_view_count_and_date(self.driver)
-        description = extract_video_description(self.driver)
+        with guard(self.browser_service, "extract", video_url):
+            # 不可用的视频没有可提取的内容，不再等待页面元素
+            playability = check_playability(self.driver)
+            if playability is not None:
+                category, reason = playability
+                error_class = AgeRestrictedError if category == "age_restricted" else VideoUnavailableError
+                raise error_class(reason, video_url)
+            
+            # 等待页面加载 - 使用更宽松的策略
+            self._wait_for_page_load()
+            
+            # 提取视频信息
+            title = extract_title(self.driver)
+            channel = extract_channel_name(self.driver)
+            view_count, upload_date = extract_view_count_and_date(self.driver)
+            description = extract_video_description(self.driver)
+            archive_page(self.driver, video_url, "watch")
         
         # 构建视频信息
         video_info = {
             "title": title,
             "channel": channel,
             "view_count": view_count,
+            "view_count_num": parse_count(view_count),
             "date": upload_date,
+            "upload_timestamp": resolve_upload_timestamp(upload_date),
             "description": description,
             "url": video_url
         }
+        self._record_field_failures(video_info)
+        if title in FIELD_FAILURE_VALUES["title"] and channel in FIELD_FAILURE_VALUES["channel"]:
+            raise SelectorMissError("标题和频道名均提取失败", video_url)
         
         self.logger.info(f"成功获取视频信息: {title[:50]}...")
         return video_info
     
+    def _record_field_failures(self, video_info: Dict):
+        """统计提取失败的字段"""
+        for field, failure_values in FIELD_FAILURE_VALUES.items():
+            if video_info.get(field) in failure_values:
+                self.metrics.inc("extraction_failures_total", field=field)
+    
     def _wait_for_page_load(self):
         """等待页面加载完成 - 优化性能"""
+        wait_start = time.monotonic()
         try:
             # 减少基本等待时间
             time.sleep(1)
@@ -184,6 +366,8 @@ class YouTubeService:
             
         except Exception as e:
             self.logger.warning(f"页面加载等待时出错: {str(e)}")
+        finally:
+            self.metrics.observe("wait_seconds", time.monotonic() - wait_start, kind="page_ready")
     
     def validate_search_query(self, search_query: str) -> Tuple[bool, str]:
         """
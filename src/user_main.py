@@ -3,11 +3,11 @@
 YouTube用户帖子爬虫主入口 - 专门用于搜索特定用户的帖子
 """
 
-from .service.user_service import YouTubeUserService
-
-
 def main():
     """用户搜索主函数"""
+    # 延迟导入服务层，启动时不加载selenium/pandas
+    from .service.user_service import YouTubeUserService
+    
     print("YouTube用户帖子爬虫")
     print("=" * 50)
     
@@ -1,5 +1,7 @@
 # YouTube爬虫工具包
 
+import importlib
+
 # 导入文本解析器
 from .text_parsers import (
     parse_view_count_and_date,
@@ -10,15 +12,18 @@ from .text_parsers import (
     clean_description
 )
 
-# 导入元素提取器
-from .element_extractors import (
-    extract_title,
-    extract_channel_name,
-    extract_view_count_and_date,
-    extract_description_first_line,
-    extract_video_description,
-    extract_video_links
-)
+# 元素提取器（依赖selenium）和文件工具（依赖pandas）按需加载，见文件末尾的 __getattr__
+_LAZY_ATTRS = {
+    'extract_title': '.element_extractors',
+    'extract_channel_name': '.element_extractors',
+    'extract_view_count_and_date': '.element_extractors',
+    'extract_description_first_line': '.element_extractors',
+    'extract_video_description': '.element_extractors',
+    'extract_video_links': '.element_extractors',
+    'save_results': '.file_utils',
+    'display_video_info': '.file_utils',
+    'validate_input': '.file_utils',
+}
 
 # 导入CSS选择器
 from .css_selectors import (
@@ -32,13 +37,6 @@ from .css_selectors import (
     PAGE_LOAD_SELECTORS
 )
 
-# 导入文件工具
-from .file_utils import (
-    save_results,
-    display_video_info,
-    validate_input
-)
-
 __all__ = [
     # Text Parsers
     'parse_view_count_and_date',
@@ -70,4 +68,18 @@ __all__ = [
     'save_results',
     'display_video_info',
     'validate_input'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """首次访问时加载对应模块并缓存到包命名空间"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,280 @@
+# 注入浏览器执行的JavaScript脚本
+#
+# 每个脚本在一次 execute_script 调用内完成整页数据采集，避免逐个元素的WebDriver往返。
+# 选择器通过 arguments 传入，选择器定义仍集中在 css_selectors.py。
+
+# 公共函数：在ytInitialData中查找指定键、把各种文本结构转换为字符串
+_JS_HELPERS = r"""
+function findKey(root, key) {
+    var stack = [root];
+    var seen = 0;
+    while (stack.length && seen < 200000) {
+        var node = stack.pop();
+        seen++;
+        if (!node || typeof node !== 'object') continue;
+        if (Object.prototype.hasOwnProperty.call(node, key)) return node[key];
+        for (var k in node) {
+            var v = node[k];
+            if (v && typeof v === 'object') stack.push(v);
+        }
+    }
+    return null;
+}
+function textOf(value) {
+    if (value === null || value === undefined) return null;
+    if (typeof value === 'string') return value;
+    if (typeof value === 'number') return String(value);
+    if (value.simpleText) return value.simpleText;
+    if (value.content) return value.content;
+    if (value.runs) return value.runs.map(function (r) { return r.text || ''; }).join('');
+    return null;
+}
+function firstText(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var els = document.querySelectorAll(selectors[i]);
+        for (var j = 0; j < els.length; j++) {
+            var t = (els[j].innerText || els[j].textContent || '').trim();
+            if (t) return t;
+        }
+    }
+    return null;
+}
+"""
+
+# 频道"关于"信息：优先读取 ytInitialData 中的 aboutChannelViewModel，缺失字段再从DOM补齐
+# arguments: [简介选择器, 订阅者选择器, 视频数选择器, 位置关键词]
+CHANNEL_ABOUT_INFO_SCRIPT = "return (function (bioSelectors, subscriberSelectors, videoCountSelectors, locationKeywords) {" + _JS_HELPERS + r"""
+    var info = {bio: null, subscribers: null, video_num: null, location: null, links: [], source: null};
+
+    // 1. ytInitialData.aboutChannelViewModel（新版关于弹窗）
+    try {
+        var vm = window.ytInitialData ? findKey(window.ytInitialData, 'aboutChannelViewModel') : null;
+        if (vm) {
+            info.source = 'aboutChannelViewModel';
+            info.bio = textOf(vm.description);
+            info.subscribers = textOf(vm.subscriberCountText);
+            info.video_num = textOf(vm.videoCountText);
+            info.location = textOf(vm.country);
+            (vm.links || []).forEach(function (item) {
+                var link = item.channelExternalLinkViewModel || item;
+                var url = textOf(link.link);
+                if (url) info.links.push({title: textOf(link.title) || '', url: url});
+            });
+        } else if (window.ytInitialData) {
+            // 旧版频道头部
+            var header = findKey(window.ytInitialData, 'c4TabbedHeaderRenderer');
+            if (header) {
+                info.source = 'c4TabbedHeaderRenderer';
+                info.subscribers = textOf(header.subscriberCountText);
+                info.video_num = textOf(header.videosCountText);
+            }
+            var meta = findKey(window.ytInitialData, 'channelMetadataRenderer');
+            if (meta && !info.bio) info.bio = textOf(meta.description);
+        }
+    } catch (e) {}
+
+    // 2. DOM补齐缺失字段
+    if (!info.bio) info.bio = firstText(bioSelectors);
+    if (!info.subscribers) info.subscribers = firstText(subscriberSelectors);
+    if (!info.video_num) {
+        var videoText = firstText(videoCountSelectors);
+        if (videoText && /video|视频/i.test(videoText)) info.video_num = videoText;
+    }
+    if (!info.location || !info.subscribers || !info.video_num) {
+        var rows = document.querySelectorAll('#additional-info-container tr, #details-container tr, ytd-channel-about-metadata-renderer');
+        for (var i = 0; i < rows.length; i++) {
+            var lines = (rows[i].innerText || '').split('\n').map(function (l) { return l.trim(); }).filter(Boolean);
+            for (var j = 0; j < lines.length; j++) {
+                var line = lines[j];
+                if (!info.location && locationKeywords.some(function (k) { return line.indexOf(k) !== -1; })) {
+                    var parts = line.replace('：', ':').split(':');
+                    info.location = parts.length > 1 && parts.slice(1).join(':').trim() ? parts.slice(1).join(':').trim()
+                        : (lines[j + 1] || line);
+                } else if (!info.subscribers && /subscriber|订阅|訂閱|đăng ký/i.test(line)) {
+                    info.subscribers = line;
+                } else if (!info.video_num && /video|视频/i.test(line)) {
+                    info.video_num = line;
+                }
+            }
+        }
+    }
+    if (!info.links.length) {
+        document.querySelectorAll('#link-list-container a[href], yt-channel-external-link-view-model a[href]').forEach(function (a) {
+            info.links.push({title: (a.innerText || '').trim(), url: a.href});
+        });
+    }
+    if (!info.source) info.source = 'dom';
+    return info;
+})(arguments[0], arguments[1], arguments[2], arguments[3]);
+"""
+
+# 视频链接批量采集：按文档顺序返回列表/搜索结果中每个视频卡片的 watch?v= 链接
+# arguments: [视频卡片选择器, 卡片内链接选择器]
+VIDEO_LINKS_SCRIPT = r"""
+return (function (containerSelectors, linkSelectors) {
+    var hrefs = [];
+    var containers = document.querySelectorAll(containerSelectors.join(','));
+    for (var i = 0; i < containers.length; i++) {
+        var links = containers[i].querySelectorAll(linkSelectors.join(','));
+        for (var j = 0; j < links.length; j++) {
+            var href = links[j].href;
+            if (href && href.indexOf('watch?v=') !== -1) {
+                hrefs.push(href);
+                break;
+            }
+        }
+    }
+    if (!hrefs.length) {
+        document.querySelectorAll("a[href*='watch?v=']").forEach(function (a) { hrefs.push(a.href); });
+    }
+    return hrefs;
+})(arguments[0], arguments[1]);
+"""
+
+# 多选择器并行探测：按给定顺序返回第一个文本长度达标的选择器下标和文本，均未命中返回null
+# arguments: [选择器列表, 最小文本长度]
+FIRST_TEXT_SCRIPT = r"""
+return (function (selectors, minLength) {
+    for (var i = 0; i < selectors.length; i++) {
+        var els = document.querySelectorAll(selectors[i]);
+        for (var j = 0; j < els.length; j++) {
+            var t = (els[j].innerText || els[j].textContent || '').trim();
+            if (t.length >= minLength) return [i, t];
+        }
+    }
+    return null;
+})(arguments[0], arguments[1]);
+"""
+
+# 点击第一个可见的按钮（用于"显示更多"），返回被点击的选择器下标，均不可见返回-1
+# arguments: [选择器列表]
+CLICK_FIRST_VISIBLE_SCRIPT = r"""
+return (function (selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var els = document.querySelectorAll(selectors[i]);
+        for (var j = 0; j < els.length; j++) {
+            var el = els[j];
+            if (el.offsetParent !== null || el.getClientRects().length) {
+                el.click();
+                return i;
+            }
+        }
+    }
+    return -1;
+})(arguments[0]);
+"""
+
+# 视频卡片元数据批量采集：一次返回每个卡片的链接、标题、元数据行文本和时长角标
+# arguments: [视频卡片选择器, 卡片内链接选择器, 标题选择器, 元数据选择器, 时长选择器]
+VIDEO_TILES_SCRIPT = r"""
+return (function (containerSelectors, linkSelectors, titleSelectors, metaSelectors, durationSelectors) {
+    function textIn(root, selectors) {
+        for (var i = 0; i < selectors.length; i++) {
+            var el = root.querySelector(selectors[i]);
+            if (!el) continue;
+            var t = (el.innerText || el.textContent || el.getAttribute('title') || '').trim();
+            if (t) return t;
+        }
+        return null;
+    }
+    var tiles = [];
+    var containers = document.querySelectorAll(containerSelectors.join(','));
+    for (var i = 0; i < containers.length; i++) {
+        var tile = containers[i];
+        var href = null;
+        var links = tile.querySelectorAll(linkSelectors.join(','));
+        for (var j = 0; j < links.length; j++) {
+            if (links[j].href && links[j].href.indexOf('watch?v=') !== -1) {
+                href = links[j].href;
+                break;
+            }
+        }
+        if (!href) continue;
+        var meta = [];
+        for (var k = 0; k < metaSelectors.length && !meta.length; k++) {
+            tile.querySelectorAll(metaSelectors[k]).forEach(function (el) {
+                var t = (el.innerText || el.textContent || '').trim();
+                if (t && meta.indexOf(t) === -1) meta.push(t);
+            });
+        }
+        tiles.push({
+            href: href,
+            title: textIn(tile, titleSelectors),
+            meta: meta,
+            duration: textIn(tile, durationSelectors)
+        });
+    }
+    return tiles;
+})(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4]);
+"""
+
+# ytInitialData 视频卡片采集：按文档顺序返回 videoRenderer / gridVideoRenderer 的关键字段，
+# 字段名与 text_parsers.video_tile_from_renderer 一致
+LISTING_INITIAL_DATA_SCRIPT = "return (function () {" + _JS_HELPERS + r"""
+    var result = {channel: null, tiles: []};
+    var data = window.ytInitialData;
+    if (!data) return result;
+    var header = findKey(data, 'c4TabbedHeaderRenderer') || findKey(data, 'pageHeaderRenderer');
+    if (header) result.channel = textOf(header.title) || textOf(header.pageTitle);
+    var stack = [data];
+    var seen = 0;
+    while (stack.length && seen < 500000) {
+        var node = stack.pop();
+        seen++;
+        if (!node || typeof node !== 'object') continue;
+        var r = node.videoRenderer || node.gridVideoRenderer;
+        if (r && typeof r === 'object') {
+            var snippet = textOf(r.descriptionSnippet);
+            if (!snippet && r.detailedMetadataSnippets && r.detailedMetadataSnippets.length) {
+                snippet = textOf(r.detailedMetadataSnippets[0].snippetText);
+            }
+            result.tiles.push({
+                video_id: r.videoId || null,
+                title: textOf(r.title),
+                views: textOf(r.viewCountText) || textOf(r.shortViewCountText),
+                published: textOf(r.publishedTimeText),
+                duration: textOf(r.lengthText),
+                channel: textOf(r.ownerText) || textOf(r.longBylineText),
+                description: snippet
+            });
+            continue;
+        }
+        var keys = Object.keys(node);
+        for (var i = keys.length - 1; i >= 0; i--) {
+            var v = node[keys[i]];
+            if (v && typeof v === 'object') stack.push(v);
+        }
+    }
+    return result;
+})();
+"""
+
+# 拦截页探测：一次返回当前URL、标题、播放状态说明和短页面的正文
+# 正常页面的正文很长，只有正文较短（错误页/同意页/验证页）时才返回正文，避免传输整页文本
+PAGE_STATE_SCRIPT = r"""
+return (function (maxTextLength) {
+    var body = document.body;
+    var text = body ? (body.textContent || '') : '';
+    var reason = '';
+    var player = window.ytInitialPlayerResponse;
+    if (player && player.playabilityStatus) {
+        reason = (player.playabilityStatus.status || '') + ' ' + (player.playabilityStatus.reason || '');
+    }
+    return {
+        url: location.href,
+        title: document.title || '',
+        reason: reason,
+        text: text.length <= maxTextLength ? text : ''
+    };
+})(arguments[0]);
+"""
+
+# 观看页播放状态：返回 ytInitialPlayerResponse.playabilityStatus 的 [status, reason]，没有播放器数据返回null
+PLAYABILITY_SCRIPT = r"""
+return (function () {
+    var player = window.ytInitialPlayerResponse;
+    if (!player || !player.playabilityStatus) return null;
+    var status = player.playabilityStatus;
+    return [status.status || '', status.reason || ''];
+})();
+"""
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+频道遍历规划器 - 根据/videos列表卡片上的发布时间决定需要打开哪些视频页
+
+/videos 标签按发布时间从新到旧排列，卡片上带有相对发布时间，因此无需打开观看页
+就能判断视频是否超过24小时，凑够 max_videos 个24小时前的视频即可停止。
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .text_parsers import resolve_upload_timestamp, is_older_than
+
+
+def plan_channel_walk(tiles: List[Dict], max_videos: int, open_recent: bool = True,
+                      anchor: Optional[int] = None) -> Tuple[List[Dict], bool]:
+    """
+    规划需要打开的视频
+
+    发布时间未知的卡片按老视频处理（与观看页日期未知时的判断一致）。
+
+    Args:
+        tiles: 按页面顺序排列的卡片 [{url, published, ...}, ...]
+        max_videos: 需要的24小时前视频数量
+        open_recent: 是否同时打开24小时内的视频（不计入max_videos）
+        anchor: 判断基准时间戳，None表示当前时间
+
+    Returns:
+        (需要打开的卡片列表, 是否已凑够max_videos个24小时前的视频)
+    """
+    anchor = int(anchor if anchor is not None else time.time())
+    planned = []
+    old_count = 0
+    for tile in tiles:
+        if old_count >= max_videos:
+            break
+        tile["upload_timestamp"] = resolve_upload_timestamp(tile.get("published"), anchor)
+        is_old = is_older_than(tile["upload_timestamp"], anchor)
+        tile["is_older_than_24h"] = is_old
+        if is_old:
+            old_count += 1
+            planned.append(tile)
+        elif open_recent:
+            planned.append(tile)
+    return planned, old_count >= max_videos
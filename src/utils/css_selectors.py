@@ -91,6 +91,15 @@ CHANNEL_SUBSCRIBER_COUNT_SELECTORS = [
     "yt-formatted-string[aria-label*='subscriber']",
 ]
 
+# 频道页（首页/Videos页头部）订阅者数量选择器
+CHANNEL_PAGE_SUBSCRIBER_SELECTORS = [
+    "yt-formatted-string#owner-sub-count",
+    "yt-formatted-string#subscriber-count",
+    "#subscriber-count",
+    "yt-formatted-string[aria-label*='subscriber']",
+    "yt-formatted-string[aria-label*='订阅']",
+]
+
 # 频道视频总数选择器（不同布局可能显示在标签或头部信息中）
 CHANNEL_VIDEOS_COUNT_SELECTORS = [
     "yt-formatted-string#videos-count",
@@ -123,3 +132,25 @@ DIALOG_CONTAINER_SELECTORS = [
     "ytd-popup-container",
     "#contentWrapper",
 ]
+
+# 列表/搜索结果视频卡片 - 标题选择器（在卡片内查找）
+TILE_TITLE_SELECTORS = [
+    "#video-title",
+    "a#video-title-link",
+    "yt-lockup-metadata-view-model h3",
+    "h3 a",
+]
+
+# 列表/搜索结果视频卡片 - 元数据行（观看次数、发布时间）
+TILE_METADATA_SELECTORS = [
+    "#metadata-line span.inline-metadata-item",
+    "#metadata-line span",
+    "yt-content-metadata-view-model span.yt-core-attributed-string",
+]
+
+# 列表/搜索结果视频卡片 - 缩略图上的时长角标
+TILE_DURATION_SELECTORS = [
+    "ytd-thumbnail-overlay-time-status-renderer #text",
+    "ytd-thumbnail-overlay-time-status-renderer span",
+    "badge-shape .badge-shape-wiz__text",
+]
@@ -2,18 +2,72 @@ from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 from .css_selectors import *
 from .text_parsers import parse_view_count_and_date, parse_title_from_page_source, parse_description_from_page_source, clean_description
+from .selector_registry import get_selector_registry
+from ..config.settings import EXTRACTION_CONFIG
+
+
+def _deadline_mode():
+    """是否使用零隐式等待 + 字段截止时间的提取模式"""
+    return EXTRACTION_CONFIG["mode"] == "deadline"
+
+
+def _poll_first_text(driver, page_type, field, selectors, min_length=1):
+    """
+    在字段截止时间内同时轮询全部选择器，返回第一个命中的文本
+    
+    每轮只有一次脚本调用；命中时把排在前面的选择器记为未命中，超时则全部记为未命中。
+    
+    Returns:
+        命中的文本，超时返回None
+    """
+    import time
+    from .browser_scripts import FIRST_TEXT_SCRIPT
+    
+    registry = get_selector_registry()
+    ordered = registry.ordered(page_type, field, selectors)
+    deadline = time.monotonic() + EXTRACTION_CONFIG["field_deadlines"].get(field, 3)
+    while True:
+        try:
+            result = driver.execute_script(FIRST_TEXT_SCRIPT, ordered, min_length)
+        except Exception:
+            result = None
+        if result:
+            index, text = int(result[0]), result[1]
+            for selector in ordered[:index]:
+                registry.record(page_type, field, selector, False)
+            registry.record(page_type, field, ordered[index], True)
+            return text
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(EXTRACTION_CONFIG["poll_interval"])
+    
+    for selector in ordered:
+        registry.record(page_type, field, selector, False)
+    return None
 
 
 def extract_title(driver):
     """提取视频标题"""
-    for selector in TITLE_SELECTORS:
+    if _deadline_mode():
+        title = _poll_first_text(driver, "watch", "title", TITLE_SELECTORS)
+        if title:
+            return title
+        try:
+            return parse_title_from_page_source(driver.page_source) or "未知标题"
+        except Exception:
+            return "未知标题"
+    
+    registry = get_selector_registry()
+    for selector in registry.ordered("watch", "title", TITLE_SELECTORS):
         try:
             title_element = driver.find_element(By.CSS_SELECTOR, selector)
             title = title_element.text.strip()
             if title and len(title) > 0:
+                registry.record("watch", "title", selector, True)
                 return title
         except NoSuchElementException:
-            continue
+            pass
+        registry.record("watch", "title", selector, False)
     
     # 如果上述方法都失败，尝试从页面源码获取
     try:
@@ -29,44 +83,94 @@ def extract_title(driver):
 
 def extract_channel_name(driver):
     """提取频道名称"""
-    for selector in CHANNEL_SELECTORS:
+    if _deadline_mode():
+        return _poll_first_text(driver, "watch", "channel", CHANNEL_SELECTORS) or "未知频道"
+    
+    registry = get_selector_registry()
+    for selector in registry.ordered("watch", "channel", CHANNEL_SELECTORS):
         try:
             channel_element = driver.find_element(By.CSS_SELECTOR, selector)
             channel = channel_element.text.strip()
             if channel and len(channel) > 0:
+                registry.record("watch", "channel", selector, True)
                 return channel
         except NoSuchElementException:
-            continue
+            pass
+        registry.record("watch", "channel", selector, False)
     
     return "未知频道"
 
 
+def _click_show_more(driver):
+    """点击描述区域的"显示更多"按钮，按历史命中率顺序尝试选择器"""
+    if _deadline_mode():
+        return _click_show_more_before_deadline(driver)
+    
+    registry = get_selector_registry()
+    for selector in registry.ordered("watch", "show_more", SHOW_MORE_SELECTORS):
+        try:
+            show_more_button = driver.find_element(By.CSS_SELECTOR, selector)
+        except NoSuchElementException:
+            registry.record("watch", "show_more", selector, False)
+            continue
+        # 已展开时按钮不可见，不计入命中统计
+        if show_more_button.is_displayed():
+            registry.record("watch", "show_more", selector, True)
+            driver.execute_script("arguments[0].click();", show_more_button)
+            import time
+            time.sleep(0.8)  # 减少等待时间到0.8秒
+            return True
+    return False
+
+
+def _click_show_more_before_deadline(driver):
+    """截止时间模式：在截止时间内轮询，一次脚本调用点击第一个可见的"显示更多"按钮"""
+    import time
+    from .browser_scripts import CLICK_FIRST_VISIBLE_SCRIPT
+    
+    registry = get_selector_registry()
+    ordered = registry.ordered("watch", "show_more", SHOW_MORE_SELECTORS)
+    deadline = time.monotonic() + EXTRACTION_CONFIG["field_deadlines"].get("show_more", 1.5)
+    while True:
+        try:
+            index = driver.execute_script(CLICK_FIRST_VISIBLE_SCRIPT, ordered)
+        except Exception:
+            index = -1
+        if index is not None and index >= 0:
+            registry.record("watch", "show_more", ordered[index], True)
+            time.sleep(EXTRACTION_CONFIG["poll_interval"])
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(EXTRACTION_CONFIG["poll_interval"])
+
+
 def extract_full_description_text(driver):
     """提取完整的描述文本，用于获取第一行信息"""
     try:
         # 尝试点击"显示更多"按钮
-        for selector in SHOW_MORE_SELECTORS:
-            try:
-                show_more_button = driver.find_element(By.CSS_SELECTOR, selector)
-                if show_more_button.is_displayed():
-                    driver.execute_script("arguments[0].click();", show_more_button)
-                    import time
-                    time.sleep(0.8)  # 减少等待时间到0.8秒
-                    break
-            except NoSuchElementException:
-                continue
+        _click_show_more(driver)
         
         # 获取完整描述文本
-        for selector in DESCRIPTION_SELECTORS:
+        if _deadline_mode():
+            text = _poll_first_text(driver, "watch", "description", DESCRIPTION_SELECTORS, min_length=11)
+            if text:
+                print(f"获取到完整描述文本，长度: {len(text)}")
+            return text
+        
+        registry = get_selector_registry()
+        for selector in registry.ordered("watch", "description", DESCRIPTION_SELECTORS):
             try:
                 description_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 for element in description_elements:
                     text = element.text.strip()
                     if text and len(text) > 10:
+                        registry.record("watch", "description", selector, True)
                         print(f"获取到完整描述文本，长度: {len(text)}")
                         return text
             except Exception:
-                continue
+                pass
+            registry.record("watch", "description", selector, False)
         
         return None
         
@@ -100,7 +204,8 @@ def extract_view_count_and_date(driver):
                     return view_count, upload_date
         
         # 如果从描述获取失败，尝试其他方法
-        for selector in VIEW_COUNT_SELECTORS:
+        registry = get_selector_registry()
+        for selector in registry.ordered("watch", "view_count", VIEW_COUNT_SELECTORS):
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 for element in elements:
@@ -108,9 +213,11 @@ def extract_view_count_and_date(driver):
                     if text and ("views" in text.lower() or "观看" in text or "次观看" in text):
                         view_count, upload_date = parse_view_count_and_date(text)
                         if view_count != "未知" or upload_date != "未知":
+                            registry.record("watch", "view_count", selector, True)
                             return view_count, upload_date
             except Exception:
-                continue
+                pass
+            registry.record("watch", "view_count", selector, False)
         
         return "未知", "未知"
         
@@ -123,19 +230,11 @@ def extract_description_first_line(driver):
     """提取描述的第一行信息（包含观看次数和日期）"""
     try:
         # 尝试点击"显示更多"按钮
-        for selector in SHOW_MORE_SELECTORS:
-            try:
-                show_more_button = driver.find_element(By.CSS_SELECTOR, selector)
-                if show_more_button.is_displayed():
-                    driver.execute_script("arguments[0].click();", show_more_button)
-                    import time
-                    time.sleep(0.8)  # 减少等待时间到0.8秒
-                    break
-            except NoSuchElementException:
-                continue
+        _click_show_more(driver)
         
         # 获取描述的第一行 - 改进逻辑
-        for selector in DESCRIPTION_SELECTORS:
+        registry = get_selector_registry()
+        for selector in registry.ordered("watch", "description", DESCRIPTION_SELECTORS):
             try:
                 description_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 for element in description_elements:
@@ -150,10 +249,12 @@ def extract_description_first_line(driver):
                                 any(keyword in first_line.lower() for keyword in ["views", "观看", "次观看", "ago", "前", "年", "月", "日"]) or
                                 any(char.isdigit() for char in first_line)  # 包含数字
                             ):
+                                registry.record("watch", "description", selector, True)
                                 print(f"找到描述第一行: {first_line}")
                                 return first_line
             except Exception:
-                continue
+                pass
+            registry.record("watch", "description", selector, False)
         
         # 如果上述方法失败，尝试更宽泛的搜索
         print("尝试备用方法获取描述第一行...")
@@ -183,31 +284,27 @@ def extract_video_description(driver):
     """提取视频描述"""
     try:
         # 尝试点击"显示更多"按钮
-        for selector in SHOW_MORE_SELECTORS:
-            try:
-                show_more_button = driver.find_element(By.CSS_SELECTOR, selector)
-                if show_more_button.is_displayed():
-                    driver.execute_script("arguments[0].click();", show_more_button)
-                    import time
-                    time.sleep(0.8)  # 减少等待时间到0.8秒
-                    break
-            except NoSuchElementException:
-                continue
+        _click_show_more(driver)
         
         # 获取完整描述
         full_description = ""
-        for selector in DESCRIPTION_SELECTORS:
-            try:
-                description_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in description_elements:
-                    text = element.text.strip()
-                    if text and len(text) > 10:
-                        full_description = text
-                        break
+        if _deadline_mode():
+            full_description = _poll_first_text(driver, "watch", "description", DESCRIPTION_SELECTORS, min_length=11) or ""
+        else:
+            registry = get_selector_registry()
+            for selector in registry.ordered("watch", "description", DESCRIPTION_SELECTORS):
+                try:
+                    description_elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                    for element in description_elements:
+                        text = element.text.strip()
+                        if text and len(text) > 10:
+                            full_description = text
+                            break
+                except Exception:
+                    pass
+                registry.record("watch", "description", selector, bool(full_description))
                 if full_description:
                     break
-            except Exception:
-                continue
         
         # 如果获取到完整描述，移除第一行（观看次数和日期）
         if full_description:
@@ -242,8 +339,108 @@ def extract_video_description(driver):
 
 
 def extract_video_links(driver, max_videos):
-    """提取视频链接"""
+    """
+    提取视频链接
+    
+    一次注入脚本按文档顺序取回全部 watch?v= 链接，Python端规范化为视频ID并用集合去重；
+    脚本执行失败时回退到逐元素提取。
+    """
+    from .text_parsers import canonicalize_video_url
+    
+    try:
+        from .browser_scripts import VIDEO_LINKS_SCRIPT
+        hrefs = driver.execute_script(VIDEO_LINKS_SCRIPT, VIDEO_ELEMENTS_SELECTORS, VIDEO_LINK_SELECTORS)
+    except Exception as e:
+        print(f"注入脚本提取视频链接失败，回退到逐元素提取: {str(e)}")
+        hrefs = None
+    
+    if hrefs is None:
+        hrefs = _extract_video_hrefs_by_elements(driver, max_videos)
+    
+    video_links = []
+    seen_ids = set()
+    for href in hrefs:
+        url, video_id = canonicalize_video_url(href)
+        if not video_id or video_id in seen_ids:
+            continue
+        seen_ids.add(video_id)
+        video_links.append(url)
+        if len(video_links) >= max_videos:
+            break
+    
+    return video_links
+
+
+def extract_video_tiles(driver, max_tiles=None):
+    """
+    提取列表/搜索结果页的视频卡片元数据（不打开观看页）
+    
+    一次注入脚本取回全部卡片的链接、标题、观看次数、发布时间和时长；
+    脚本执行失败时回退为仅含链接的卡片。
+    
+    Returns:
+        按页面顺序去重后的卡片列表 [{url, video_id, title, views, published, duration}, ...]
+    """
+    from .text_parsers import canonicalize_video_url, classify_tile_metadata
+    
+    try:
+        from .browser_scripts import VIDEO_TILES_SCRIPT
+        raw_tiles = driver.execute_script(
+            VIDEO_TILES_SCRIPT, VIDEO_ELEMENTS_SELECTORS, VIDEO_LINK_SELECTORS,
+            TILE_TITLE_SELECTORS, TILE_METADATA_SELECTORS, TILE_DURATION_SELECTORS
+        )
+    except Exception as e:
+        print(f"注入脚本提取视频卡片失败，回退到仅提取链接: {str(e)}")
+        raw_tiles = None
+    
+    if raw_tiles is None:
+        raw_tiles = [{"href": href} for href in extract_video_links(driver, max_tiles or 1000)]
+    
+    tiles = []
+    seen_ids = set()
+    for raw in raw_tiles:
+        url, video_id = canonicalize_video_url(raw.get("href") or "")
+        if not video_id or video_id in seen_ids:
+            continue
+        seen_ids.add(video_id)
+        views, published = classify_tile_metadata(raw.get("meta"))
+        tiles.append({
+            "url": url,
+            "video_id": video_id,
+            "title": raw.get("title"),
+            "views": views,
+            "published": published,
+            "duration": raw.get("duration"),
+        })
+        if max_tiles and len(tiles) >= max_tiles:
+            break
+    
+    return tiles
+
+
+def extract_listing_tiles(driver):
+    """
+    提取列表/搜索结果页的全部卡片：DOM卡片与 ytInitialData 按视频ID合并
+    
+    Returns:
+        (页面头部的频道名或None, 合并后的卡片列表)
+    """
+    from .listing_records import merge_tiles
+    
+    dom_tiles = extract_video_tiles(driver)
+    try:
+        from .browser_scripts import LISTING_INITIAL_DATA_SCRIPT
+        data = driver.execute_script(LISTING_INITIAL_DATA_SCRIPT) or {}
+    except Exception as e:
+        print(f"注入脚本读取ytInitialData失败: {str(e)}")
+        data = {}
+    return data.get("channel"), merge_tiles(dom_tiles, data.get("tiles") or [])
+
+
+def _extract_video_hrefs_by_elements(driver, max_videos):
+    """逐元素提取视频链接（注入脚本不可用时的回退路径）"""
     video_links = []
+    seen_links = set()
     
     for selector in VIDEO_ELEMENTS_SELECTORS:
         try:
@@ -259,7 +456,8 @@ def extract_video_links(driver, max_videos):
                                 href = link_element.get_attribute("href")
                                 if href and "watch?v=" in href:
                                     # 避免重复链接
-                                    if href not in video_links:
+                                    if href not in seen_links:
+                                        seen_links.add(href)
                                         video_links.append(href)
                                         break
                             if len(video_links) >= max_videos:
@@ -282,8 +480,54 @@ def extract_video_links(driver, max_videos):
     return video_links 
 
 
+LOCATION_KEYWORDS = ["位置", "所在地", "Location", "Based in", "Country", "地点", "Vị trí"]
+
+
 def extract_channel_about_info(driver):
-    """提取频道“关于”页面的信息：bio、订阅者、视频总数、地理位置"""
+    """
+    提取频道“关于”页面的信息：bio、订阅者、视频总数、地理位置、外部链接
+
+    通过一次注入脚本读取 ytInitialData 中的 aboutChannelViewModel（缺失字段由脚本在DOM中补齐），
+    脚本执行失败时才回退到逐元素提取。
+    """
+    info = {
+        "bio": "未知",
+        "subscribers": "未知",
+        "video_num": "未知",
+        "location": "未知",
+        "links": []
+    }
+
+    try:
+        from .browser_scripts import CHANNEL_ABOUT_INFO_SCRIPT
+        result = driver.execute_script(
+            CHANNEL_ABOUT_INFO_SCRIPT,
+            CHANNEL_ABOUT_BIO_SELECTORS + [
+                "yt-attributed-string#description",
+                "yt-attributed-string[slot='description']",
+            ],
+            CHANNEL_SUBSCRIBER_COUNT_SELECTORS,
+            CHANNEL_VIDEOS_COUNT_SELECTORS,
+            LOCATION_KEYWORDS,
+        )
+    except Exception as e:
+        print(f"注入脚本提取频道信息失败，回退到逐元素提取: {str(e)}")
+        result = None
+
+    if isinstance(result, dict):
+        for k in ["bio", "subscribers", "video_num", "location"]:
+            value = result.get(k)
+            if isinstance(value, str) and value.strip():
+                info[k] = value.strip()
+        info["links"] = [link for link in (result.get("links") or []) if isinstance(link, dict)]
+        return info
+
+    info.update(_extract_channel_about_info_by_elements(driver))
+    return info
+
+
+def _extract_channel_about_info_by_elements(driver):
+    """逐元素提取频道“关于”信息（注入脚本不可用时的回退路径）"""
     from selenium.webdriver.common.by import By
     from selenium.common.exceptions import NoSuchElementException
 
@@ -310,32 +554,38 @@ def extract_channel_about_info(driver):
     except Exception:
         pass
 
+    registry = get_selector_registry()
+
     # 简介
-    for selector in CHANNEL_ABOUT_BIO_SELECTORS + [
+    for selector in registry.ordered("about", "bio", CHANNEL_ABOUT_BIO_SELECTORS + [
         "yt-attributed-string#description",
         "yt-attributed-string[slot='description']",
         "#description-inline-expander yt-formatted-string",
         "#description-inline-expander yt-attributed-string",
-    ]:
+    ]):
         try:
             el = driver.find_element(By.CSS_SELECTOR, selector)
             text = el.text.strip()
             if text:
+                registry.record("about", "bio", selector, True)
                 info["bio"] = text
                 break
         except NoSuchElementException:
-            continue
+            pass
+        registry.record("about", "bio", selector, False)
 
     # 订阅者数量
-    for selector in CHANNEL_SUBSCRIBER_COUNT_SELECTORS:
+    for selector in registry.ordered("about", "subscribers", CHANNEL_SUBSCRIBER_COUNT_SELECTORS):
         try:
             el = driver.find_element(By.CSS_SELECTOR, selector)
             text = el.text.strip()
             if text:
+                registry.record("about", "subscribers", selector, True)
                 info["subscribers"] = text
                 break
         except NoSuchElementException:
-            continue
+            pass
+        registry.record("about", "subscribers", selector, False)
 
     # 视频总数（如无法直接定位，则留给上层回填或保持未知）
     for selector in CHANNEL_VIDEOS_COUNT_SELECTORS:
@@ -431,30 +681,26 @@ def extract_channel_subscribers_from_page(driver):
     from selenium.common.exceptions import NoSuchElementException
 
     # 直接通过常见选择器读取
-    for selector in [
-        "yt-formatted-string#owner-sub-count",
-        "yt-formatted-string#subscriber-count",
-        "#subscriber-count",
-        "yt-formatted-string[aria-label*='subscriber']",
-        "yt-formatted-string[aria-label*='订阅']",
-    ]:
+    registry = get_selector_registry()
+    for selector in registry.ordered("channel", "subscribers", CHANNEL_PAGE_SUBSCRIBER_SELECTORS):
         try:
             el = driver.find_element(By.CSS_SELECTOR, selector)
             text = el.text.strip()
             if text:
+                registry.record("channel", "subscribers", selector, True)
                 return text
-        except NoSuchElementException:
-            continue
         except Exception:
-            continue
+            pass
+        registry.record("channel", "subscribers", selector, False)
 
     # 解析页面源码
     try:
-        from .text_parsers import parse_channel_about_from_page_source, normalize_subscriber_text
+        from .text_parsers import parse_channel_about_from_page_source
         page_source = driver.page_source
         parsed = parse_channel_about_from_page_source(page_source)
         if parsed.get("subscribers"):
-            return normalize_subscriber_text(parsed["subscribers"])
+            # 返回原始文本，由调用方解析数值后再标准化（标准化会丢掉越南语 N/Tr 单位和小数）
+            return parsed["subscribers"].strip()
     except Exception:
         pass
 
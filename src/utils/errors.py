@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+错误分类 - 把视频处理中的异常归入有限的几类，重试策略（ERROR_CONFIG["retry_policy"]）按类别决定
+是否重试、在哪里重试、等待多久，以及是否写入负缓存
+
+类别:
+    timeout         页面加载/脚本执行超时（暂时性）
+    driver          浏览器会话异常、驱动操作卡死被看门狗结束（暂时性，卡死时先重建驱动）
+    blocked         同意页/机器人验证/异常流量/429（由全局退避处理）
+    selector_miss   页面已加载但关键字段提取失败（可能是布局变体，延后重试）
+    unavailable     视频已删除/私享/因违规下架（永久性）
+    age_restricted  需要登录确认年龄（匿名抓取下永久性）
+    unknown         其他异常
+"""
+
+from typing import Dict, Optional
+
+from ..config.settings import ERROR_CONFIG
+
+
+class ScraperError(Exception):
+    """爬虫异常基类，category 对应重试策略中的类别"""
+
+    category = "unknown"
+
+    def __init__(self, message: str = "", url: Optional[str] = None):
+        self.url = url
+        super().__init__(message)
+
+
+class PageTimeoutError(ScraperError):
+    """页面加载或脚本执行超时"""
+
+    category = "timeout"
+
+
+class DriverError(ScraperError):
+    """浏览器会话异常"""
+
+    category = "driver"
+
+
+class DriverHangError(DriverError):
+    """驱动操作超过看门狗截止时间，进程树已被强制结束（需要重建驱动）"""
+
+    def __init__(self, operation: str, timeout: float, url: Optional[str] = None):
+        self.operation = operation
+        self.timeout = timeout
+        super().__init__(f"驱动操作 {operation} 超过 {timeout:.0f} 秒未返回，已强制结束浏览器进程", url)
+
+
+class BlockedError(ScraperError):
+    """页面被YouTube拦截（同意页/机器人验证/异常流量/429）"""
+
+    category = "blocked"
+
+    def __init__(self, kind: str, url: str, backoff_seconds: float = 0.0):
+        self.kind = kind
+        self.backoff_seconds = backoff_seconds
+        super().__init__(f"页面被拦截 ({kind}): {url}，全局退避 {backoff_seconds:.0f} 秒", url)
+
+
+class SelectorMissError(ScraperError):
+    """页面已加载但关键字段提取失败"""
+
+    category = "selector_miss"
+
+
+class VideoUnavailableError(ScraperError):
+    """视频已删除/私享/下架"""
+
+    category = "unavailable"
+
+    def __init__(self, reason: str, url: Optional[str] = None):
+        self.reason = reason
+        super().__init__(f"视频不可用: {reason}", url)
+
+
+class AgeRestrictedError(VideoUnavailableError):
+    """视频需要登录确认年龄"""
+
+    category = "age_restricted"
+
+
+# 永久性类别：写入负缓存，后续运行直接跳过
+PERMANENT_CATEGORIES = ("unavailable", "age_restricted")
+
+
+def classify_exception(exc: BaseException) -> str:
+    """把异常归入错误类别"""
+    if isinstance(exc, ScraperError):
+        return exc.category
+    try:
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+    except ImportError:
+        return "unknown"
+    if isinstance(exc, TimeoutException):
+        return "timeout"
+    if isinstance(exc, WebDriverException):
+        return "driver"
+    return "unknown"
+
+
+def get_retry_policy(category: str) -> Dict:
+    """
+    某类错误的重试策略
+
+    Returns:
+        {max_retries, delay, backoff, where, negative_cache}，未配置的类别使用 max_retries/retry_delay
+    """
+    policy = {
+        "max_retries": max(0, ERROR_CONFIG["max_retries"] - 1),
+        "delay": ERROR_CONFIG["retry_delay"],
+        "backoff": 1.0,
+        "where": "in_place",
+        "negative_cache": False,
+    }
+    policy.update(ERROR_CONFIG.get("retry_policy", {}).get(category, {}))
+    return policy
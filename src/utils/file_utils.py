@@ -1,4 +1,3 @@
-import pandas as pd
 import json
 import os
 
@@ -13,6 +12,7 @@ def save_results(videos, search_query, output_dir="data"):
     os.makedirs(output_dir, exist_ok=True)
     
     # 保存为CSV
+    import pandas as pd
     df = pd.DataFrame(videos)
     csv_filename = os.path.join(output_dir, f"{search_query}_videos.csv")
     df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
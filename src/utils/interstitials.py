@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+拦截页识别 - 判断当前页面是否为同意页、"确认不是机器人"验证、/sorry 异常流量页或429错误页
+
+这些页面上的提取器只会得到"未知标题"/"未知频道"，必须在获取层识别并作为单独的失败类别处理。
+"""
+
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# URL特征（小写子串）
+INTERSTITIAL_URL_MARKERS = {
+    "consent": ("consent.youtube.com", "consent.google.com"),
+    "sorry": ("google.com/sorry", "/sorry/index"),
+}
+
+# 播放状态说明/短页面正文特征（小写子串），按顺序匹配；YouTube页面的标题是视频/搜索标题，不参与子串匹配
+INTERSTITIAL_TEXT_MARKERS = {
+    "bot_check": (
+        "confirm you’re not a bot", "confirm you're not a bot", "confirm that you're not a bot",
+        "确认您不是自动程序", "确认你不是机器人", "確認您不是機器人",
+        "xác nhận bạn không phải là bot",
+    ),
+    "sorry": ("unusual traffic from your computer network", "我们的系统检测到您的计算机网络中存在异常流量"),
+    "rate_limited": ("429. that’s an error", "429. that's an error", "error 429", "too many requests"),
+    "consent": ("before you continue to youtube", "在您继续访问 youtube 之前", "trước khi bạn tiếp tục đến youtube"),
+}
+
+# 拦截页的完整标题（小写，去除首尾空白后精确匹配），YouTube页面上只按完整标题识别
+INTERSTITIAL_TITLES = {
+    "rate_limited": ("error 429 (too many requests)!!1", "429 too many requests"),
+    "consent": ("before you continue to youtube", "before you continue", "在您继续访问 youtube 之前"),
+}
+
+# 正文长度不超过该值时才检查正文（拦截页都很短）
+MAX_INTERSTITIAL_TEXT_LENGTH = 20000
+
+
+def _is_youtube_url(url: str) -> bool:
+    """是否为YouTube内容页（其标题来自视频或搜索词，可能包含任意文字）"""
+    host = (urlsplit(url).hostname or "").lower()
+    return host == "youtube.com" or host.endswith(".youtube.com")
+
+
+def detect_interstitial(state: Dict) -> Optional[str]:
+    """
+    根据页面状态判断拦截类型
+
+    Args:
+        state: {url, title, reason, text}（PAGE_STATE_SCRIPT 的返回值）
+
+    Returns:
+        拦截类型 consent/bot_check/sorry/rate_limited，正常页面返回None
+    """
+    url = (state.get("url") or "").lower()
+    for kind, markers in INTERSTITIAL_URL_MARKERS.items():
+        if any(marker in url for marker in markers):
+            return kind
+    title = (state.get("title") or "").strip().lower()
+    for kind, titles in INTERSTITIAL_TITLES.items():
+        if title in titles:
+            return kind
+    parts = [state.get("reason") or "", state.get("text") or ""]
+    if not _is_youtube_url(url):
+        # 非YouTube主机（同意页/异常流量页）的标题就是拦截说明
+        parts.append(title)
+    haystack = " ".join(parts).lower()
+    for kind, markers in INTERSTITIAL_TEXT_MARKERS.items():
+        if any(marker in haystack for marker in markers):
+            return kind
+    return None
+
+
+def check_interstitial(driver) -> Optional[str]:
+    """在浏览器中采集页面状态并判断拦截类型，脚本执行失败时返回None"""
+    from .browser_scripts import PAGE_STATE_SCRIPT
+    try:
+        state = driver.execute_script(PAGE_STATE_SCRIPT, MAX_INTERSTITIAL_TEXT_LENGTH)
+    except Exception:
+        return None
+    return detect_interstitial(state or {})
+
+
+# 需要登录确认年龄的说明（小写子串）
+AGE_GATE_MARKERS = (
+    "confirm your age", "age-restricted", "inappropriate for some users",
+    "确认您的年龄", "確認你的年齡", "xác nhận tuổi",
+)
+
+# 私享视频的说明（小写子串）
+PRIVATE_VIDEO_MARKERS = (
+    "video is private", "private video", "video privado", "vídeo privado", "video es privado",
+    "vidéo privée", "privates video", "video privato",
+    "私享视频", "私人影片", "私密影片", "video riêng tư",
+)
+
+# 播放状态 -> 错误类别；LOGIN_REQUIRED 需要结合说明区分年龄限制、私享视频和机器人验证
+PLAYABILITY_CATEGORIES = {
+    "ERROR": "unavailable",
+    "UNPLAYABLE": "unavailable",
+    "AGE_CHECK_REQUIRED": "age_restricted",
+    "AGE_VERIFICATION_REQUIRED": "age_restricted",
+}
+
+
+def classify_playability(status: str, reason: str = "") -> Optional[str]:
+    """
+    根据观看页播放状态判断视频是否永久不可用
+
+    Returns:
+        unavailable / age_restricted，可以正常提取或无法确定为永久不可用（含直播预告、机器人验证、
+        未识别的登录要求）时返回None
+    """
+    status = (status or "").upper()
+    reason_lower = (reason or "").lower()
+    if status == "LOGIN_REQUIRED":
+        if any(marker in reason_lower for marker in AGE_GATE_MARKERS):
+            return "age_restricted"
+        if any(marker in reason_lower for marker in PRIVATE_VIDEO_MARKERS):
+            return "unavailable"
+        # 机器人验证（含未收录语言的说明）等其他登录要求是暂时性的，不能写入负缓存
+        return None
+    return PLAYABILITY_CATEGORIES.get(status)
+
+
+def check_playability(driver):
+    """
+    读取观看页播放状态
+
+    Returns:
+        (错误类别, 说明)，视频可以正常提取或脚本执行失败时返回None
+    """
+    from .browser_scripts import PLAYABILITY_SCRIPT
+    try:
+        result = driver.execute_script(PLAYABILITY_SCRIPT)
+    except Exception:
+        return None
+    if not result:
+        return None
+    status, reason = result
+    category = classify_playability(status, reason)
+    return (category, reason or status) if category else None
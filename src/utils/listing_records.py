@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+列表记录 - 直接用列表/搜索结果页的卡片构建视频记录，无需打开观看页
+
+卡片来源有两个：DOM卡片（包含滚动后加载的项目）和 ytInitialData（包含首屏项目的
+完整观看次数、频道名和描述摘要）。两者按视频ID合并，DOM顺序优先。
+"""
+
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .text_parsers import convert_relative_date, parse_count, resolve_upload_timestamp
+
+# 观看次数文本中的数值部分，如 "1.2K views" -> "1.2K"，"12万次观看" -> "12万"，"1,2 N lượt xem" -> "1,2 N"
+COUNT_TEXT_PATTERN = re.compile(r'\d[\d.,]*(?:\s*(?:[KMB]|万|萬|亿|億|N|Tr|T)(?![A-Za-zà-ỹ]))?')
+
+# 列表记录默认的观看页地址
+DEFAULT_WATCH_URL = "https://www.youtube.com/watch?v={}"
+
+
+def count_text(views: Optional[str]) -> str:
+    """从观看次数文本中取出数值部分，无法识别时返回"未知\""""
+    if not views:
+        return "未知"
+    match = COUNT_TEXT_PATTERN.search(views)
+    return match.group(0).strip() if match else "未知"
+
+
+def merge_tiles(dom_tiles: List[Dict], data_tiles: List[Dict]) -> List[Dict]:
+    """
+    按视频ID合并DOM卡片和 ytInitialData 卡片
+
+    DOM卡片决定顺序；同一视频的字段以 ytInitialData 为准（观看次数是完整数字），
+    缺失时用DOM卡片补齐。只出现在 ytInitialData 中的卡片追加在末尾。
+
+    Returns:
+        合并后的卡片列表
+    """
+    data_by_id = {tile["video_id"]: tile for tile in data_tiles if tile.get("video_id")}
+    watch_url = DEFAULT_WATCH_URL
+    if dom_tiles:
+        parts = urlsplit(dom_tiles[0]["url"])
+        watch_url = f"{parts.scheme}://{parts.netloc}/watch?v={{}}"
+
+    merged = []
+    seen_ids = set()
+    for tile in dom_tiles:
+        video_id = tile["video_id"]
+        seen_ids.add(video_id)
+        data_tile = data_by_id.get(video_id, {})
+        combined = dict(tile)
+        for key, value in data_tile.items():
+            if value:
+                combined[key] = value
+        merged.append(combined)
+    for video_id, data_tile in data_by_id.items():
+        if video_id in seen_ids:
+            continue
+        combined = dict(data_tile)
+        combined["url"] = watch_url.format(video_id)
+        merged.append(combined)
+    return merged
+
+
+def build_listing_record(tile: Dict, channel: Optional[str] = None, anchor: Optional[int] = None) -> Dict:
+    """
+    用卡片构建视频记录（字段与观看页提取结果一致）
+
+    Args:
+        tile: 卡片字典
+        channel: 卡片缺少频道名时使用的频道名（频道列表页的卡片不含频道名）
+        anchor: 抓取时间戳，相对发布时间以此为基准；None表示当前时间
+
+    Returns:
+        视频信息字典
+    """
+    published = tile.get("published")
+    return {
+        "title": tile.get("title") or "未知标题",
+        "channel": tile.get("channel") or channel or "未知频道",
+        "view_count": count_text(tile.get("views")),
+        "view_count_num": parse_count(tile.get("views")),
+        "date": convert_relative_date(published) if published else "未知",
+        "upload_timestamp": resolve_upload_timestamp(published, anchor),
+        "description": tile.get("description") or "",
+        "url": tile.get("url") or DEFAULT_WATCH_URL.format(tile.get("video_id")),
+        "video_id": tile.get("video_id"),
+        "duration": tile.get("duration") or "",
+        "record_source": "listing",
+    }
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+归档页面重新解析 - 对页面归档中的源码重新运行 text_parsers，生成与在线抓取字段一致的记录
+
+只依赖页面源码，不需要浏览器；解析函数都是模块级纯函数，可以在子进程中调用。
+"""
+
+import datetime
+from typing import Dict, Iterator, List, Optional
+
+from .listing_records import build_listing_record, count_text
+from .text_parsers import (
+    extract_initial_data,
+    extract_video_id,
+    parse_channel_about_from_page_source,
+    parse_count,
+    parse_watch_page_from_page_source,
+    resolve_upload_timestamp,
+    channel_title_from_initial_data,
+    video_tiles_from_initial_data,
+)
+
+# 视频记录页面类型（观看页、频道列表页、搜索结果页）与频道记录页面类型
+VIDEO_PAGE_TYPES = ("watch", "channel_videos", "search")
+CHANNEL_PAGE_TYPES = ("about",)
+
+
+def _scrape_timestamp(fetched_at: int) -> str:
+    """抓取时间戳转换为与在线抓取一致的本地ISO时间"""
+    return datetime.datetime.fromtimestamp(fetched_at).isoformat()
+
+
+def reparse_watch_page(url: str, fetched_at: int, html: str) -> List[Dict]:
+    """观看页 -> 单条视频记录"""
+    fields = parse_watch_page_from_page_source(html)
+    return [{
+        "title": fields["title"] or "未知标题",
+        "channel": fields["channel"] or "未知频道",
+        "view_count": count_text(fields["view_count"]),
+        "view_count_num": parse_count(fields["view_count"]),
+        "date": fields["date"] or "未知",
+        "upload_timestamp": resolve_upload_timestamp(fields["date"], fetched_at),
+        "description": fields["description"] or "",
+        "url": url,
+        "video_id": extract_video_id(url),
+        "scrape_timestamp": _scrape_timestamp(fetched_at),
+        "record_source": "archive",
+    }]
+
+
+def reparse_listing_page(url: str, fetched_at: int, html: str) -> List[Dict]:
+    """频道列表页/搜索结果页 -> 每个卡片一条视频记录（只包含首屏 ytInitialData 中的卡片）"""
+    data = extract_initial_data(html)
+    if data is None:
+        return []
+    channel = channel_title_from_initial_data(data)
+    records = []
+    for tile in video_tiles_from_initial_data(data):
+        record = build_listing_record(tile, channel, anchor=fetched_at)
+        record["source_url"] = url
+        record["scrape_timestamp"] = _scrape_timestamp(fetched_at)
+        record["record_source"] = "archive"
+        records.append(record)
+    return records
+
+
+def reparse_about_page(url: str, fetched_at: int, html: str) -> List[Dict]:
+    """频道关于页 -> 单条频道记录"""
+    about = parse_channel_about_from_page_source(html)
+    return [{
+        "url": url,
+        **about,
+        "subscribers_num": parse_count(about.get("subscribers")),
+        "scrape_timestamp": _scrape_timestamp(fetched_at),
+        "record_source": "archive",
+    }]
+
+
+_REPARSERS = {
+    "watch": reparse_watch_page,
+    "channel_videos": reparse_listing_page,
+    "search": reparse_listing_page,
+    "about": reparse_about_page,
+}
+
+
+def reparse_page(page_type: str, url: str, fetched_at: int, html: Optional[str]) -> List[Dict]:
+    """
+    按页面类型重新解析一个归档页面
+
+    Args:
+        page_type: 页面类型 watch/channel_videos/search/about
+        url: 页面URL
+        fetched_at: 抓取时间戳（相对发布时间以此为基准）
+        html: 页面源码，None表示内容已被淘汰
+
+    Returns:
+        记录列表，未知页面类型或内容缺失时返回空列表
+    """
+    reparser = _REPARSERS.get(page_type)
+    if reparser is None or not html:
+        return []
+    return reparser(url, fetched_at, html)
+
+
+def reparse_archive(archive, page_type: Optional[str] = None, since: Optional[int] = None) -> Iterator[Dict]:
+    """
+    逐个页面重新解析归档
+
+    Args:
+        archive: PageArchiveService
+        page_type: 只解析指定页面类型
+        since: 只解析该时间戳之后抓取的页面
+
+    Yields:
+        {page_type, url, records}
+    """
+    for page in archive.iter_pages(page_type, since):
+        html = archive.load(page["content_hash"])
+        yield {
+            "page_type": page["page_type"],
+            "url": page["url"],
+            "records": reparse_page(page["page_type"], page["url"], page["fetched_at"], html),
+        }
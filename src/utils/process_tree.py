@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+进程树工具 - 查找、统计内存并强制结束 chromedriver 及其派生的 Chrome 进程
+
+安装了 psutil 时使用 psutil，否则在Linux上读取 /proc/<pid>/stat 的父进程号和 /proc/<pid>/statm 的常驻页数。
+"""
+
+import os
+import signal
+import logging
+from typing import Dict, List
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+def _proc_parent_map() -> Dict[int, List[int]]:
+    """读取 /proc 构建 父进程号 -> [子进程号] 映射"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                stat = f.read().decode("utf-8", "replace")
+        except OSError:
+            continue
+        # 进程名在括号中且可能包含空格，父进程号是右括号之后的第二个字段
+        fields = stat[stat.rfind(")") + 2:].split()
+        if len(fields) > 1:
+            children.setdefault(int(fields[1]), []).append(int(entry))
+    return children
+
+
+def descendant_pids(pid: int) -> List[int]:
+    """某进程的全部子孙进程号（先序，不含自身）"""
+    if psutil is not None:
+        try:
+            return [child.pid for child in psutil.Process(pid).children(recursive=True)]
+        except psutil.Error:
+            return []
+    if not os.path.isdir("/proc"):
+        return []
+    children = _proc_parent_map()
+    result, stack = [], list(children.get(pid, []))
+    while stack:
+        child = stack.pop()
+        result.append(child)
+        stack.extend(children.get(child, []))
+    return result
+
+
+def kill_process_tree(pid: int) -> int:
+    """
+    强制结束进程及其全部子孙进程（先结束子孙，避免被重新派生）
+
+    Returns:
+        发送了结束信号的进程数量
+    """
+    pids = descendant_pids(pid) + [pid]
+    killed = 0
+    for target in pids:
+        try:
+            if psutil is not None:
+                psutil.Process(target).kill()
+            else:
+                os.kill(target, getattr(signal, "SIGKILL", signal.SIGTERM))
+            killed += 1
+        except Exception as e:
+            logger.debug(f"结束进程 {target} 失败: {str(e)}")
+    return killed
+
+
+def process_rss(pid: int) -> int:
+    """单个进程的常驻内存（字节），进程不存在时返回0"""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return 0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def process_tree_rss(pid: int) -> int:
+    """
+    进程及其全部子孙进程的常驻内存之和（字节）
+
+    Chrome的多进程之间共享部分内存页，求和会略微高估，但足以反映增长趋势。
+    """
+    return sum(process_rss(p) for p in [pid] + descendant_pids(pid))
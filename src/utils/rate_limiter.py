@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+令牌桶限速器与全局退避 - 按主机限制页面请求速率，被拦截时所有工作者一起指数退避
+
+状态（两个double）保存在状态文件中，每次在 fcntl 排他锁下读-改-写，线程间和进程间共享。
+取令牌采用预约方式：令牌不足时仍然扣减（允许为负），按欠额计算需要等待的时间，
+释放锁后再睡眠，因此并发的请求按到达顺序依次排开，不会在锁上空等。
+没有 fcntl 的平台（Windows）退化为进程内共享。
+"""
+
+import os
+import time
+import random
+import struct
+import threading
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from ..config.settings import RATE_LIMIT_CONFIG, BLOCK_CONFIG
+
+# 状态文件格式：两个double
+_STATE = struct.Struct("dd")
+
+
+class _SharedState:
+    """两个double组成的共享状态：有状态文件时跨进程共享，否则只在进程内共享"""
+
+    def __init__(self, path: Optional[str], default: Tuple[float, float]):
+        self._lock = threading.Lock()
+        self._default = default
+        self._value = default
+        self.path = None
+        if path and fcntl is not None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.path = path
+
+    def update(self, fn: Callable):
+        """在锁内执行 fn(state) -> (new_state或None, result)，返回 result；new_state为None时不写回"""
+        with self._lock:
+            if self.path is None:
+                state, result = fn(self._value)
+                if state is not None:
+                    self._value = state
+                return result
+
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.pread(fd, _STATE.size, 0)
+                state, result = fn(_STATE.unpack(raw) if len(raw) == _STATE.size else self._default)
+                if state is not None:
+                    os.pwrite(fd, _STATE.pack(*state), 0)
+                return result
+            finally:
+                os.close(fd)  # 关闭文件同时释放锁
+
+
+class TokenBucketLimiter:
+    """令牌桶限速器"""
+
+    def __init__(self, name: str, rate: float, burst: float, state_dir: Optional[str] = None):
+        """
+        Args:
+            name: 桶名称（同名的桶共享状态）
+            rate: 每秒补充的令牌数
+            burst: 桶容量（允许的突发请求数）
+            state_dir: 状态文件目录，None表示只在进程内共享
+        """
+        self.name = name
+        self.rate = float(rate)
+        self.burst = float(burst)
+        path = os.path.join(state_dir, f"{name}.bucket") if state_dir else None
+        # 状态：令牌数、更新时间
+        self._state = _SharedState(path, (self.burst, time.time()))
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        预约令牌
+
+        Returns:
+            调用方需要等待的秒数（0表示可以立即请求）
+        """
+        now = time.time()
+
+        def take(state):
+            available, updated = state
+            available = min(self.burst, available + max(0.0, now - updated) * self.rate) - tokens
+            return (available, now), (-available / self.rate if available < 0 else 0.0)
+
+        return self._state.update(take)
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        取令牌，令牌不足时睡眠到可用为止
+
+        Returns:
+            实际等待的秒数
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class SharedBackoff:
+    """
+    全局自适应退避 - 任一工作者被拦截时，所有工作者暂停到同一截止时间
+
+    每次拦截退避等级加一，退避时间为 base * 2^(等级-1)（不超过 max），再乘以 [1-jitter, 1] 的随机系数；
+    截止时间之后的成功请求使等级减一，连续成功后恢复到正常速率。
+    """
+
+    def __init__(self, base: float, maximum: float, jitter: float, path: Optional[str] = None):
+        self.base = float(base)
+        self.maximum = float(maximum)
+        self.jitter = float(jitter)
+        # 状态：退避等级、截止时间
+        self._state = _SharedState(path, (0.0, 0.0))
+
+    def remaining(self) -> float:
+        """距离退避截止时间的秒数"""
+        now = time.time()
+        return self._state.update(lambda state: (None, max(0.0, state[1] - now)))
+
+    def wait(self) -> float:
+        """处于退避期时睡眠到截止时间，返回等待的秒数"""
+        waited = 0.0
+        remaining = self.remaining()
+        while remaining > 0:  # 等待期间其他工作者可能延长截止时间
+            time.sleep(remaining)
+            waited += remaining
+            remaining = self.remaining()
+        return waited
+
+    def on_block(self) -> float:
+        """记录一次拦截，返回本次设置的退避时间（秒）"""
+        now = time.time()
+
+        def escalate(state):
+            level, until = state
+            if until > now:
+                # 仍在退避期内（其他工作者已处理过同一波拦截），不重复升级
+                return None, until - now
+            level += 1
+            delay = min(self.maximum, self.base * 2 ** (level - 1)) * random.uniform(1 - self.jitter, 1)
+            return (level, now + delay), delay
+
+        return self._state.update(escalate)
+
+    def on_success(self):
+        """退避期之后的成功请求使退避等级减一"""
+        now = time.time()
+
+        def decay(state):
+            level, until = state
+            if level <= 0 or until > now:
+                return None, None
+            return (level - 1, until), None
+
+        self._state.update(decay)
+
+
+_limiters: Dict[str, TokenBucketLimiter] = {}
+_limiters_lock = threading.Lock()
+_backoff: Optional[SharedBackoff] = None
+
+
+def host_bucket_name(url: str) -> Optional[str]:
+    """URL所属的限速桶名称（按主机后缀匹配配置中的主机），未配置的主机返回None"""
+    host = (urlsplit(url).hostname or "").lower()
+    for name in RATE_LIMIT_CONFIG["hosts"]:
+        if host == name or host.endswith("." + name):
+            return name
+    return None
+
+
+def get_rate_limiter(url: str) -> Optional[TokenBucketLimiter]:
+    """获取URL所属主机的共享限速器，未启用限速或主机未配置时返回None"""
+    if not RATE_LIMIT_CONFIG["enabled"]:
+        return None
+    name = host_bucket_name(url)
+    if name is None:
+        return None
+    limiter = _limiters.get(name)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(name)
+            if limiter is None:
+                host_config = RATE_LIMIT_CONFIG["hosts"][name]
+                limiter = TokenBucketLimiter(name, host_config["rate"], host_config["burst"],
+                                             RATE_LIMIT_CONFIG["state_dir"])
+                _limiters[name] = limiter
+    return limiter
+
+
+def get_shared_backoff() -> Optional[SharedBackoff]:
+    """获取全局退避（与限速桶共用状态目录），未启用拦截识别时返回None"""
+    global _backoff
+    if not BLOCK_CONFIG["detect"]:
+        return None
+    if _backoff is None:
+        with _limiters_lock:
+            if _backoff is None:
+                state_dir = RATE_LIMIT_CONFIG["state_dir"]
+                _backoff = SharedBackoff(
+                    BLOCK_CONFIG["backoff_base_seconds"], BLOCK_CONFIG["backoff_max_seconds"],
+                    BLOCK_CONFIG["backoff_jitter"], os.path.join(state_dir, "backoff.state") if state_dir else None,
+                )
+    return _backoff
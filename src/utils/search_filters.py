@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+搜索过滤参数 - 把上传时间、类型、时长、排序编码为YouTube搜索URL的 sp= 参数
+
+sp 是一个base64编码的protobuf消息：
+    字段1 (varint)  排序方式：0 相关度, 1 评分, 2 上传日期, 3 观看次数
+    字段2 (message) 过滤条件：
+        字段1 上传时间：1 一小时内, 2 今天, 3 本周, 4 本月, 5 今年
+        字段2 类型：1 视频, 2 频道, 3 播放列表, 4 电影
+        字段3 时长：1 短于4分钟, 2 长于20分钟, 3 4-20分钟
+"""
+
+import base64
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import quote
+
+from ..config.settings import YOUTUBE_CONFIG
+
+UPLOAD_DATE_VALUES = {"hour": 1, "today": 2, "week": 3, "month": 4, "year": 5}
+TYPE_VALUES = {"video": 1, "channel": 2, "playlist": 3, "movie": 4}
+DURATION_VALUES = {"short": 1, "long": 2, "medium": 3}
+SORT_VALUES = {"relevance": 0, "rating": 1, "upload_date": 2, "view_count": 3}
+
+
+def _varint(value: int) -> bytes:
+    """protobuf varint编码"""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _varint_field(number: int, value: int) -> bytes:
+    """编码varint字段 (wire type 0)"""
+    return _varint(number << 3) + _varint(value)
+
+
+def _message_field(number: int, payload: bytes) -> bytes:
+    """编码嵌套消息字段 (wire type 2)"""
+    return _varint(number << 3 | 2) + _varint(len(payload)) + payload
+
+
+@dataclass(frozen=True)
+class SearchOptions:
+    """
+    搜索过滤选项
+
+    Attributes:
+        upload_date: 上传时间窗口 hour/today/week/month/year
+        type: 结果类型 video/channel/playlist/movie
+        duration: 时长 short/medium/long
+        sort_by: 排序方式 relevance/rating/upload_date/view_count
+    """
+
+    upload_date: Optional[str] = None
+    type: Optional[str] = None
+    duration: Optional[str] = None
+    sort_by: Optional[str] = None
+
+    def __post_init__(self):
+        for name, allowed in (("upload_date", UPLOAD_DATE_VALUES), ("type", TYPE_VALUES),
+                              ("duration", DURATION_VALUES), ("sort_by", SORT_VALUES)):
+            value = getattr(self, name)
+            if value is not None and value not in allowed:
+                raise ValueError(f"无效的{name}: {value}，可选值: {', '.join(allowed)}")
+
+    @classmethod
+    def last_24_hours(cls) -> "SearchOptions":
+        """只要24小时内上传的视频，按上传日期排序"""
+        return cls(upload_date="today", type="video", sort_by="upload_date")
+
+    def is_empty(self) -> bool:
+        """是否未设置任何过滤条件"""
+        return not (self.upload_date or self.type or self.duration or self.sort_by)
+
+    def to_sp(self) -> str:
+        """编码为 sp 参数值（未URL转义），未设置过滤条件时返回空字符串"""
+        message = b""
+        if self.sort_by and SORT_VALUES[self.sort_by]:
+            message += _varint_field(1, SORT_VALUES[self.sort_by])
+        filters = b""
+        if self.upload_date:
+            filters += _varint_field(1, UPLOAD_DATE_VALUES[self.upload_date])
+        if self.type:
+            filters += _varint_field(2, TYPE_VALUES[self.type])
+        if self.duration:
+            filters += _varint_field(3, DURATION_VALUES[self.duration])
+        if filters:
+            message += _message_field(2, filters)
+        return base64.b64encode(message).decode("ascii") if message else ""
+
+
+def build_search_url(search_query: str, options: Optional[SearchOptions] = None) -> str:
+    """
+    构建搜索URL
+
+    Args:
+        search_query: 搜索关键词
+        options: 搜索过滤选项
+
+    Returns:
+        搜索URL
+    """
+    url = YOUTUBE_CONFIG["search_url"].format(search_query.replace(' ', '+'))
+    sp = options.to_sp() if options else ""
+    if sp:
+        url += "&sp=" + quote(sp, safe="")
+    return url
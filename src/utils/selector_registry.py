@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+选择器命中率注册表 - 按页面类型和字段记录每个CSS选择器的命中/未命中次数，
+持久化到磁盘，并按历史命中率调整尝试顺序，让提取成本跟随YouTube当前布局。
+
+用法:
+    python -m src.utils.selector_registry          # 打印命中率报告和失效选择器
+"""
+
+import os
+import json
+import atexit
+import threading
+from typing import Dict, List, Tuple
+
+from ..config.settings import SELECTOR_CONFIG
+
+
+class SelectorRegistry:
+    """选择器命中率注册表"""
+
+    def __init__(self, stats_file: str = None):
+        self.stats_file = stats_file or SELECTOR_CONFIG["stats_file"]
+        self.enabled = SELECTOR_CONFIG["learning_enabled"]
+        # {page_type: {field: {selector: [hits, misses]}}}
+        self._stats: Dict[str, Dict[str, Dict[str, List[int]]]] = {}
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self.load()
+
+    def load(self):
+        """从磁盘加载历史统计"""
+        if not self.stats_file or not os.path.exists(self.stats_file):
+            return
+        try:
+            with open(self.stats_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            with self._lock:
+                self._stats = {
+                    page_type: {
+                        field: {sel: [int(v[0]), int(v[1])] for sel, v in selectors.items()}
+                        for field, selectors in fields.items()
+                    }
+                    for page_type, fields in data.items()
+                }
+        except Exception as e:
+            print(f"加载选择器统计失败: {str(e)}")
+
+    def save(self):
+        """保存统计到磁盘（先写临时文件再替换）"""
+        if not self.stats_file:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = json.dumps(self._stats, ensure_ascii=False, indent=2)
+            self._dirty = 0
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.stats_file)), exist_ok=True)
+            tmp_path = f"{self.stats_file}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(snapshot)
+            os.replace(tmp_path, self.stats_file)
+        except Exception as e:
+            print(f"保存选择器统计失败: {str(e)}")
+
+    def record(self, page_type: str, field: str, selector: str, hit: bool):
+        """记录一次选择器尝试结果"""
+        if not self.enabled:
+            return
+        with self._lock:
+            counts = self._stats.setdefault(page_type, {}).setdefault(field, {}).setdefault(selector, [0, 0])
+            counts[0 if hit else 1] += 1
+            self._dirty += 1
+            should_save = self._dirty >= SELECTOR_CONFIG["save_every"]
+        if should_save:
+            self.save()
+
+    def ordered(self, page_type: str, field: str, selectors: List[str]) -> List[str]:
+        """
+        按历史命中率排序选择器
+
+        样本不足 min_samples 的选择器使用中性先验；命中率相同时保持原列表顺序。
+        """
+        if not self.enabled:
+            return list(selectors)
+        with self._lock:
+            field_stats = self._stats.get(page_type, {}).get(field)
+            if not field_stats:
+                return list(selectors)
+            scores = {sel: self._score(field_stats.get(sel)) for sel in selectors}
+        return sorted(selectors, key=lambda sel: -scores[sel])
+
+    @staticmethod
+    def _score(counts) -> float:
+        """平滑命中率 (hits+1)/(attempts+2)"""
+        if not counts or counts[0] + counts[1] < SELECTOR_CONFIG["min_samples"]:
+            return 0.5
+        return (counts[0] + 1) / (counts[0] + counts[1] + 2)
+
+    def dead_selectors(self, min_attempts: int = None) -> List[Tuple[str, str, str, int]]:
+        """
+        列出失效选择器：尝试次数达到阈值且从未命中
+
+        Returns:
+            [(页面类型, 字段, 选择器, 未命中次数), ...]
+        """
+        min_attempts = min_attempts or SELECTOR_CONFIG["dead_min_attempts"]
+        dead = []
+        with self._lock:
+            for page_type, fields in self._stats.items():
+                for field, selectors in fields.items():
+                    for selector, (hits, misses) in selectors.items():
+                        if hits == 0 and misses >= min_attempts:
+                            dead.append((page_type, field, selector, misses))
+        return sorted(dead)
+
+    def format_report(self) -> str:
+        """生成命中率报告文本"""
+        lines = []
+        with self._lock:
+            stats = json.loads(json.dumps(self._stats))
+        for page_type in sorted(stats):
+            for field in sorted(stats[page_type]):
+                lines.append(f"[{page_type}/{field}]")
+                selectors = stats[page_type][field]
+                for selector, (hits, misses) in sorted(selectors.items(), key=lambda x: -self._score(x[1])):
+                    attempts = hits + misses
+                    rate = hits / attempts * 100 if attempts else 0
+                    lines.append(f"  {rate:6.1f}%  {hits:>6}/{attempts:<6}  {selector}")
+        dead = self.dead_selectors()
+        if dead:
+            lines.append("失效选择器:")
+            for page_type, field, selector, misses in dead:
+                lines.append(f"  {page_type}/{field}: {selector} (未命中 {misses} 次)")
+        return "\n".join(lines) if lines else "暂无选择器统计"
+
+
+_default_registry = None
+_default_lock = threading.Lock()
+
+
+def get_selector_registry() -> SelectorRegistry:
+    """获取进程内共享的选择器注册表，进程退出时自动保存"""
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = SelectorRegistry()
+                atexit.register(_default_registry.save)
+    return _default_registry
+
+
+if __name__ == "__main__":
+    print(get_selector_registry().format_report())
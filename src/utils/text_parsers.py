@@ -1,5 +1,11 @@
 import re
+import json
+import math
 import datetime
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qs
+
+VIDEO_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{11}$')
 
 
 def parse_youtube_first_line(first_line_text):
@@ -149,6 +155,71 @@ def convert_relative_date(relative_date):
         return relative_date
 
 
+# 列表卡片元数据行关键词：观看次数 / 发布时间
+TILE_VIEW_KEYWORDS = ("view", "观看", "觀看", "播放", "lượt xem", "watching")
+TILE_DATE_KEYWORDS = ("ago", "前", "trước", "streamed", "premiered", "直播", "首播")
+
+
+def classify_tile_metadata(texts):
+    """
+    把列表/搜索结果卡片的元数据行拆分为观看次数和发布时间
+    
+    Args:
+        texts: 元数据行文本列表，如 ["1.2K views", "3 hours ago"]
+        
+    Returns:
+        (观看次数文本, 发布时间文本)，缺失的一项为None
+    """
+    views, published = None, None
+    unclassified = []
+    for text in texts or []:
+        lowered = text.lower()
+        if published is None and any(k in lowered for k in TILE_DATE_KEYWORDS):
+            published = text
+        elif views is None and any(k in lowered for k in TILE_VIEW_KEYWORDS):
+            views = text
+        else:
+            unclassified.append(text)
+    # 无法识别的语言：按YouTube固定顺序（观看次数在前、发布时间在后）补齐
+    if views is None and unclassified:
+        views = unclassified.pop(0)
+    if published is None and unclassified:
+        published = unclassified.pop(0)
+    return views, published
+
+
+def extract_video_id(video_url):
+    """从 watch?v= 链接中提取11位视频ID，无法识别时返回None"""
+    try:
+        parts = urlsplit(video_url)
+        if not parts.path.endswith('/watch'):
+            return None
+        video_id = parse_qs(parts.query).get('v', [None])[0]
+        if video_id and VIDEO_ID_PATTERN.match(video_id):
+            return video_id
+    except Exception:
+        pass
+    return None
+
+
+def canonicalize_video_url(video_url):
+    """
+    规范化视频链接：只保留 v 参数，去掉播放列表、时间戳、si 等参数
+    
+    保留原始协议和主机（本地夹具服务器同样适用），相对链接补全为 www.youtube.com。
+    
+    Returns:
+        (规范化链接, 视频ID)，无法识别时返回 (None, None)
+    """
+    video_id = extract_video_id(video_url)
+    if not video_id:
+        return None, None
+    parts = urlsplit(video_url)
+    scheme = parts.scheme or "https"
+    netloc = parts.netloc or "www.youtube.com"
+    return f"{scheme}://{netloc}/watch?v={video_id}", video_id
+
+
 def parse_title_from_page_source(page_source):
     """从页面源码中解析标题"""
     try:
@@ -228,43 +299,172 @@ def clean_description(description):
     return description if description else "无描述"
 
 
-def is_video_older_than_24_hours(upload_date):
+# 相对时间单位（秒）：月按30天、年按365天近似
+_UNIT_SECONDS = {
+    "second": 1, "minute": 60, "hour": 3600, "day": 86400,
+    "week": 7 * 86400, "month": 30 * 86400, "year": 365 * 86400,
+}
+_ZH_UNITS = {
+    "秒": "second", "分钟": "minute", "分鐘": "minute", "小时": "hour", "小時": "hour", "天": "day",
+    "周": "week", "週": "week", "星期": "week", "个月": "month", "個月": "month", "月": "month", "年": "year",
+}
+_VI_UNITS = {
+    "giây": "second", "phút": "minute", "giờ": "hour", "ngày": "day",
+    "tuần": "week", "tháng": "month", "năm": "year",
+}
+_MONTHS = {
+    name: index
+    for index, names in enumerate([
+        ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+        ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+        ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december"),
+    ], 1)
+    for name in names
+}
+
+_EN_RELATIVE = re.compile(r'(\d+|an?|one)\s+(second|minute|hour|day|week|month|year)s?\s+ago', re.IGNORECASE)
+_ZH_RELATIVE = re.compile(r'(\d+)\s*(秒|分钟|分鐘|小时|小時|天|周|週|星期|个月|個月|月|年)\s*前')
+_VI_RELATIVE = re.compile(r'(\d+)\s+(giây|phút|giờ|ngày|tuần|tháng|năm)\s+trước', re.IGNORECASE)
+_ZH_YMD = re.compile(r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日')
+_ISO_YMD = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_VI_DMY = re.compile(r'(\d{1,2})\s+(?:thg|tháng)\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE)
+_EN_MDY = re.compile(r'([A-Za-z]{3,9})\.?\s+(\d{1,2}),?\s+(\d{4})')
+_EN_DMY = re.compile(r'(\d{1,2})\s+([A-Za-z]{3,9})\.?,?\s+(\d{4})')
+_SLASH_DATE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+_ZH_MD = re.compile(r'(\d{1,2})\s*月\s*(\d{1,2})\s*日')
+_EN_MD = re.compile(r'\b([A-Za-z]{3,9})\.?\s+(\d{1,2})\b')
+
+
+def _utc_midnight(year: int, month: int, day: int):
+    """某日UTC零点的时间戳，日期无效时返回None"""
+    try:
+        return int(datetime.datetime(year, month, day, tzinfo=datetime.timezone.utc).timestamp())
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def parse_upload_date(date_text):
     """
-    判断视频是否超过24小时
+    解析上传日期文本（与抓取时间无关的部分，按输入字符串缓存）
+    
+    支持英文/中文/越南语相对时间（"3 hours ago"、"3小时前"、"3 giờ trước"，含 Streamed/Premiered 前缀）
+    以及绝对日期（"Jul 31, 2025"、"31 Jul 2025"、"2025年7月31日"、"2025-07-31"、"31 thg 7, 2025"、
+    "07/31/2025"、无年份的 "7月31日"/"Jul 31"）。
     
-    Args:
-        upload_date: 上传日期字符串
-        
     Returns:
-        bool: True表示超过24小时，False表示24小时内
+        ("relative", 秒数) / ("absolute", UTC时间戳) / ("month_day", 月, 日)，无法识别时返回None
     """
-    if not upload_date or upload_date == "未知":
-        return True  # 无法判断时间的视频默认认为是老视频
+    if not date_text or date_text == "未知":
+        return None
+    text = str(date_text).strip()
+    
+    for pattern, units in ((_EN_RELATIVE, None), (_ZH_RELATIVE, _ZH_UNITS), (_VI_RELATIVE, _VI_UNITS)):
+        match = pattern.search(text)
+        if match:
+            amount = match.group(1)
+            amount = int(amount) if amount.isdigit() else 1
+            unit = match.group(2).lower()
+            unit = units[unit] if units else unit
+            return ("relative", amount * _UNIT_SECONDS[unit])
     
+    match = _ZH_YMD.search(text) or _ISO_YMD.search(text)
+    if match:
+        ts = _utc_midnight(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        return ("absolute", ts) if ts is not None else None
+    match = _VI_DMY.search(text)
+    if match:
+        ts = _utc_midnight(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+        return ("absolute", ts) if ts is not None else None
+    match = _EN_MDY.search(text)
+    if match and match.group(1).lower() in _MONTHS:
+        ts = _utc_midnight(int(match.group(3)), _MONTHS[match.group(1).lower()], int(match.group(2)))
+        return ("absolute", ts) if ts is not None else None
+    match = _EN_DMY.search(text)
+    if match and match.group(2).lower() in _MONTHS:
+        ts = _utc_midnight(int(match.group(3)), _MONTHS[match.group(2).lower()], int(match.group(1)))
+        return ("absolute", ts) if ts is not None else None
+    match = _SLASH_DATE.search(text)
+    if match:
+        first, second, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        # 第一段大于12时只能是日（日/月/年），否则按美式 月/日/年
+        month, day = (second, first) if first > 12 else (first, second)
+        ts = _utc_midnight(year, month, day)
+        return ("absolute", ts) if ts is not None else None
+    
+    match = _ZH_MD.search(text)
+    if match:
+        return ("month_day", int(match.group(1)), int(match.group(2)))
+    match = _EN_MD.search(text)
+    if match and match.group(1).lower() in _MONTHS:
+        return ("month_day", _MONTHS[match.group(1).lower()], int(match.group(2)))
+    return None
+
+
+def timestamp_from_iso(iso_text):
+    """把 scrape_timestamp 等ISO时间字符串转换为时间戳（无时区时按本地时间），失败返回None"""
     try:
-        # 处理相对时间格式
-        if "小时前" in upload_date or "hour" in upload_date.lower():
-            # 提取小时数
-            number_match = re.search(r'(\d+)', upload_date)
-            if number_match:
-                hours = int(number_match.group(1))
-                return hours >= 24  # 24小时及以上才算老视频
-            return True
-        
-        # 处理天、周、月、年的情况（都超过24小时）
-        if any(keyword in upload_date for keyword in ["天前", "周前", "月前", "年前", "day", "week", "month", "year"]):
-            return True
-        
-        # 处理绝对日期格式（都认为是老视频）
-        if any(keyword in upload_date for keyword in ["年", "月", "日", "/", "-"]):
-            return True
+        return int(datetime.datetime.fromisoformat(iso_text).timestamp())
+    except (TypeError, ValueError):
+        return None
+
+
+def resolve_upload_timestamp(date_text, anchor=None):
+    """
+    把上传日期文本解析为UTC时间戳
+    
+    Args:
+        date_text: 上传日期文本
+        anchor: 抓取时间（时间戳或ISO字符串，如 scrape_timestamp），相对时间以此为基准；None表示当前时间
         
-        # 默认情况下认为是老视频
+    Returns:
+        整数时间戳，无法识别时返回None
+    """
+    parsed = parse_upload_date(date_text)
+    if parsed is None:
+        return None
+    if parsed[0] == "absolute":
+        return parsed[1]
+    if isinstance(anchor, str):
+        anchor = timestamp_from_iso(anchor)
+    anchor = int(anchor if anchor is not None else datetime.datetime.now().timestamp())
+    if parsed[0] == "relative":
+        return anchor - parsed[1]
+    # 无年份日期：取抓取时间所在年份，晚于抓取时间则为上一年
+    year = datetime.datetime.fromtimestamp(anchor, datetime.timezone.utc).year
+    ts = _utc_midnight(year, parsed[1], parsed[2])
+    if ts is not None and ts > anchor:
+        ts = _utc_midnight(year - 1, parsed[1], parsed[2])
+    return ts
+
+
+def is_older_than(upload_timestamp, anchor, seconds=86400):
+    """
+    整数比较判断视频发布时间是否早于 anchor - seconds
+    
+    上传时间未知（None）时按老视频处理。
+    """
+    if upload_timestamp is None:
         return True
+    return anchor - upload_timestamp >= seconds
+
+
+def is_video_older_than_24_hours(upload_date, anchor=None):
+    """
+    判断视频是否超过24小时
+    
+    Args:
+        upload_date: 上传日期字符串
+        anchor: 抓取时间（时间戳或ISO字符串），None表示当前时间
         
-    except Exception as e:
-        print(f"判断视频时间时出错: {str(e)}")
-        return True  # 出错时默认认为是老视频 
+    Returns:
+        bool: True表示超过24小时，False表示24小时内；无法判断时间的视频默认认为是老视频
+    """
+    if isinstance(anchor, str):
+        anchor = timestamp_from_iso(anchor)
+    if anchor is None:
+        anchor = int(datetime.datetime.now().timestamp())
+    return is_older_than(resolve_upload_timestamp(upload_date, anchor), anchor)
 
 
 def normalize_subscriber_text(raw_text: str) -> str:
@@ -310,6 +510,69 @@ def normalize_subscriber_text(raw_text: str) -> str:
         return raw_text.strip() if raw_text else ""
 
 
+# 数量单位：英文 K/M/B，中文 万/亿，越南语 N(nghìn)/Tr(triệu)/T(tỷ)
+COUNT_MULTIPLIERS = {
+    "k": 10 ** 3, "m": 10 ** 6, "b": 10 ** 9,
+    "万": 10 ** 4, "萬": 10 ** 4, "亿": 10 ** 8, "億": 10 ** 8,
+    "n": 10 ** 3, "tr": 10 ** 6, "t": 10 ** 9,
+}
+# 数字内的分隔符后必须紧跟数字；NBSP/NNBSP 可作千位分隔，普通空格只有后面恰好是3位数字时才算千位分隔，
+# 否则结束匹配（"Trending #1 5 views" 不能拼成 15）
+COUNT_PATTERN = re.compile(
+    r'(\d(?:\d|[.,\u00a0\u202f](?=\d)| (?=\d{3}(?!\d)))*)\s*([KkMmBb]|万|萬|亿|億|Tr|N|T)?(?![A-Za-zà-ỹÀ-Ỹ])'
+)
+ZERO_COUNT_KEYWORDS = ("no views", "no subscribers", "无观看", "無觀看", "chưa có lượt xem")
+
+
+@lru_cache(maxsize=65536)
+def parse_count(text) -> "int | None":
+    """
+    把观看次数/订阅者数量文本转换为整数
+    
+    支持 "16,278"、"16.278"（越南语/欧洲分组）、"1.2K"、"3.4M"、"1.2万"、"3亿"、
+    "1,2 N lượt xem"、"1 Tr" 等写法；带单位时分隔符视为小数点，
+    不带单位时最后一组为3位数字则视为千位分隔符。
+    
+    Args:
+        text: 原始文本（可带"views/次观看/lượt xem"等标签）
+        
+    Returns:
+        整数，无法识别时返回None
+    """
+    if text is None:
+        return None
+    if isinstance(text, float) and not math.isfinite(text):
+        return None  # pandas缺失值（NaN）或溢出
+    if isinstance(text, (int, float)):
+        return int(text)
+    text = str(text).strip()
+    if not text or text == "未知":
+        return None
+    lowered = text.lower()
+    if any(keyword in lowered for keyword in ZERO_COUNT_KEYWORDS):
+        return 0
+    match = COUNT_PATTERN.search(text)
+    if not match:
+        return None
+    number, unit = match.group(1), match.group(2)
+    number = re.sub(r'[\u00a0\u202f ]', '', number)
+    
+    if unit:
+        # 带单位：最后一个分隔符是小数点，其余为分组
+        last_sep = max(number.rfind('.'), number.rfind(','))
+        if last_sep >= 0:
+            integer_part = re.sub(r'[.,]', '', number[:last_sep])
+            number = f"{integer_part}.{number[last_sep + 1:]}"
+        return int(round(float(number) * COUNT_MULTIPLIERS[unit.lower()]))
+    
+    last_sep = max(number.rfind('.'), number.rfind(','))
+    if last_sep >= 0 and len(number) - last_sep - 1 != 3:
+        # 最后一组不是3位：视为小数
+        integer_part = re.sub(r'[.,]', '', number[:last_sep])
+        return int(round(float(f"{integer_part}.{number[last_sep + 1:]}")))
+    return int(re.sub(r'[.,]', '', number))
+
+
 def _extract_simple_or_runs_text(block: str) -> str:
     """从 JSON 片段中提取 simpleText 或 runs 文本合并"""
     try:
@@ -351,6 +614,11 @@ def parse_channel_about_from_page_source(page_source: str) -> dict:
             text = _extract_simple_or_runs_text(sub_block.group(0))
             if text:
                 result["subscribers"] = text
+        if not result["subscribers"]:
+            # aboutChannelViewModel 中为纯字符串
+            sub_match = re.search(r'"subscriberCountText"\s*:\s*"([^"]+)"', page_source)
+            if sub_match:
+                result["subscribers"] = sub_match.group(1)
 
         # video count（视频总数，可能是 videoCountText / videosCountText）
         vid_block = re.search(r'"videoCountText"\s*:\s*\{([\s\S]*?)\}|"videosCountText"\s*:\s*\{([\s\S]*?)\}', page_source)
@@ -358,6 +626,10 @@ def parse_channel_about_from_page_source(page_source: str) -> dict:
             text = _extract_simple_or_runs_text(vid_block.group(0))
             if text:
                 result["video_num"] = text
+        if not result["video_num"]:
+            vid_match = re.search(r'"videoCountText"\s*:\s*"([^"]+)"', page_source)
+            if vid_match:
+                result["video_num"] = vid_match.group(1)
 
         # country/location（国家/地区）
         country_match = re.search(r'"country"\s*:\s*"([^"]+)"', page_source)
@@ -368,4 +640,136 @@ def parse_channel_about_from_page_source(page_source: str) -> dict:
         # 忽略解析错误
         pass
 
-    return result
\ No newline at end of file
+    return result
+
+
+# ytInitialData 中代表单个视频卡片的渲染器
+VIDEO_RENDERER_KEYS = ("videoRenderer", "gridVideoRenderer")
+INITIAL_DATA_PATTERN = re.compile(r'(?:var\s+ytInitialData|window\[["\']ytInitialData["\']\])\s*=\s*')
+PLAYER_RESPONSE_PATTERN = re.compile(
+    r'(?:var\s+ytInitialPlayerResponse|window\[["\']ytInitialPlayerResponse["\']\])\s*=\s*'
+)
+
+
+def _json_text(value):
+    """把 simpleText / runs / content 文本结构转换为字符串"""
+    if value is None:
+        return None
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    if isinstance(value, dict):
+        if "simpleText" in value:
+            return value["simpleText"]
+        if "content" in value:
+            return value["content"]
+        if "runs" in value:
+            return "".join(run.get("text", "") for run in value["runs"])
+    return None
+
+
+def _decode_assigned_json(page_source: str, pattern):
+    """解析页面源码中 `变量 = {...}` 赋值语句右侧的JSON，找不到时返回None"""
+    match = pattern.search(page_source or "")
+    if not match:
+        return None
+    try:
+        data, _ = json.JSONDecoder().raw_decode(page_source, match.end())
+        return data
+    except ValueError:
+        return None
+
+
+def extract_initial_data(page_source: str):
+    """从页面源码中解析 ytInitialData JSON，找不到时返回None"""
+    return _decode_assigned_json(page_source, INITIAL_DATA_PATTERN)
+
+
+def video_tile_from_renderer(renderer: dict) -> dict:
+    """把 videoRenderer / gridVideoRenderer 转换为卡片字典（与浏览器端脚本返回结构一致）"""
+    description = _json_text(renderer.get("descriptionSnippet"))
+    if not description:
+        snippets = renderer.get("detailedMetadataSnippets") or []
+        if snippets:
+            description = _json_text(snippets[0].get("snippetText"))
+    return {
+        "video_id": renderer.get("videoId"),
+        "title": _json_text(renderer.get("title")),
+        "views": _json_text(renderer.get("viewCountText")) or _json_text(renderer.get("shortViewCountText")),
+        "published": _json_text(renderer.get("publishedTimeText")),
+        "duration": _json_text(renderer.get("lengthText")),
+        "channel": _json_text(renderer.get("ownerText")) or _json_text(renderer.get("longBylineText")),
+        "description": description,
+    }
+
+
+def iter_video_renderers(data):
+    """按文档顺序遍历 ytInitialData 中的视频卡片渲染器"""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key in VIDEO_RENDERER_KEYS:
+                if isinstance(node.get(key), dict):
+                    yield node[key]
+                    break
+            else:
+                stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def parse_video_tiles_from_page_source(page_source: str) -> list:
+    """
+    从列表/搜索结果页源码的 ytInitialData 中解析视频卡片
+    
+    Returns:
+        按页面顺序去重后的卡片列表 [{video_id, title, views, published, duration, channel, description}, ...]
+    """
+    data = extract_initial_data(page_source)
+    if data is None:
+        return []
+    return video_tiles_from_initial_data(data)
+
+
+def video_tiles_from_initial_data(data) -> list:
+    """从已解析的 ytInitialData 中按页面顺序取出去重后的视频卡片"""
+    tiles = []
+    seen_ids = set()
+    for renderer in iter_video_renderers(data):
+        tile = video_tile_from_renderer(renderer)
+        video_id = tile["video_id"]
+        if not video_id or video_id in seen_ids:
+            continue
+        seen_ids.add(video_id)
+        tiles.append(tile)
+    return tiles
+
+
+def channel_title_from_initial_data(data):
+    """频道页 ytInitialData 中的频道名，找不到时返回None"""
+    if not isinstance(data, dict):
+        return None
+    metadata = (data.get("metadata") or {}).get("channelMetadataRenderer") or {}
+    return metadata.get("title") or None
+
+
+def parse_watch_page_from_page_source(page_source: str) -> dict:
+    """
+    从观看页源码中解析视频字段
+    
+    优先使用 ytInitialPlayerResponse 的 videoDetails/microformat（完整观看次数、完整描述、
+    ISO发布日期），缺失的字段回退到正则解析。
+    
+    Returns:
+        {title, channel, view_count, date, description}，无法解析的字段为None
+    """
+    player = _decode_assigned_json(page_source, PLAYER_RESPONSE_PATTERN) or {}
+    details = player.get("videoDetails") or {}
+    microformat = (player.get("microformat") or {}).get("playerMicroformatRenderer") or {}
+    return {
+        "title": details.get("title") or parse_title_from_page_source(page_source),
+        "channel": details.get("author") or microformat.get("ownerChannelName"),
+        "view_count": details.get("viewCount") or microformat.get("viewCount"),
+        "date": microformat.get("publishDate") or microformat.get("uploadDate"),
+        "description": details.get("shortDescription") or parse_description_from_page_source(page_source),
+    }